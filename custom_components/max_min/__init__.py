@@ -7,8 +7,13 @@ that wipes delta sensor values after a HA restart:
 
   1. Create coordinator and run first_refresh (seeds data, schedules
      reset timers, but does NOT start the watchdog or state listener).
-  2. Forward platform setup — RestoreEntity restores saved state.
-  3. start_listeners() — runs startup catch-up and starts listeners.
+  2. Forward platform setup — RestoreEntity restores saved state.  The
+     restores (and the records of the shared store, store.py) are staged
+     in a batch and committed (validated against one "now", consistency
+     run once) right before step 3.
+  3. start_listeners() — runs startup catch-up and subscribes to the
+     shared source hub, then the coordinator is registered with the
+     shared watchdog.
   4. apply_pending_initials() — enforces configured initial values.
 
 If step 3 runs before step 2, the watchdog sees last_reset=None,
@@ -24,14 +29,50 @@ from homeassistant.helpers import config_validation as cv
 
 from .const import DOMAIN, CONF_RESET_HISTORY
 from .coordinator import MaxMinDataUpdateCoordinator
+from .services import async_setup_services
+from .source_hub import MaxMinSourceHub
+from .store import MaxMinStore
+from .watchdog import MaxMinWatchdog
 
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 PLATFORMS = ["sensor"]
+DATA_WATCHDOG = "watchdog"
+DATA_SOURCE_HUB = "source_hub"
+DATA_STORE = "store"
+
+
+def _async_get_watchdog(hass: HomeAssistant) -> MaxMinWatchdog:
+    """Return the domain-wide watchdog, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    watchdog = domain_data.get(DATA_WATCHDOG)
+    if watchdog is None:
+        watchdog = domain_data[DATA_WATCHDOG] = MaxMinWatchdog(hass)
+    return watchdog
+
+
+def _async_get_source_hub(hass: HomeAssistant) -> MaxMinSourceHub:
+    """Return the domain-wide source hub, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    source_hub = domain_data.get(DATA_SOURCE_HUB)
+    if source_hub is None:
+        source_hub = domain_data[DATA_SOURCE_HUB] = MaxMinSourceHub(hass)
+    return source_hub
+
+
+async def _async_get_store(hass: HomeAssistant) -> MaxMinStore:
+    """Return the domain-wide tracker store, loading it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    store = domain_data.get(DATA_STORE)
+    if store is None:
+        store = domain_data[DATA_STORE] = MaxMinStore(hass)
+    await store.async_load()
+    return store
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Max Min integration."""
+    async_setup_services(hass)
     return True
 
 
@@ -41,14 +82,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await coordinator.async_config_entry_first_refresh()
 
     entry.runtime_data = coordinator
+    store = await _async_get_store(hass)
 
-    # Forward setup to platforms
+    # Forward setup to platforms; stored and entity restores are staged and
+    # applied together by commit_restore_batch() below.
+    coordinator.begin_restore_batch()
+    coordinator.restore_stored_records(store.entry_records(entry.entry_id))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    coordinator.commit_restore_batch()
 
     # Start state tracking AFTER platform setup so that RestoreEntity
     # has already restored state.  Running the watchdog before restore
     # causes false resets that wipe delta values on restart.
-    coordinator.start_listeners()
+    # Entries on the same source share one listener and one parse.
+    coordinator.start_listeners(_async_get_source_hub(hass))
+
+    # One shared watchdog for all entries instead of a timer per coordinator.
+    entry.async_on_unload(_async_get_watchdog(hass).async_register(coordinator))
+    # Persist tracked data (debounced, shared by all entries).
+    entry.async_on_unload(store.async_register(coordinator))
 
     # Apply initial values AFTER platform setup (i.e. after RestoreEntity
     # has had a chance to restore state).  This ensures user-configured
@@ -81,6 +133,22 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop a removed entry's persisted tracker state."""
+    store = await _async_get_store(hass)
+    store.async_remove_entry(entry.entry_id)
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Apply an options (or title) update to the running entry.
+
+    Periods, types, offset, device link and publish settings are applied to
+    the live coordinator (apply_options), keeping untouched periods' data
+    and timers.  A surgical reset needs the restore sequence documented
+    above, so it still reloads the entry.
+    """
+    coordinator = getattr(entry, "runtime_data", None)
+    if entry.options.get(CONF_RESET_HISTORY) or coordinator is None:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    coordinator.apply_options()
@@ -0,0 +1,94 @@
+"""Incremental time-weighted average of a step signal.
+
+Like the rolling window (rolling.py), the source is a step signal: each
+reading holds until the next one, and nothing accumulates while the
+source is unavailable.  The accumulator keeps the closed integral
+(value x seconds) and its duration, plus the value held since the last
+reading, so every reading costs O(1) and the average never needs the
+recorder history.
+"""
+
+
+class TimeWeightedAverage:
+    """Running integral of a step signal over one period."""
+
+    __slots__ = ("integral", "duration", "_current", "_since", "_override")
+
+    def __init__(self) -> None:
+        """Initialize an empty accumulator."""
+        self.integral = 0.0
+        self.duration = 0.0
+        self._current: float | None = None
+        self._since: float | None = None
+        # Manual set before any time accrued: reported until it does.
+        self._override: float | None = None
+
+    @property
+    def current(self) -> float | None:
+        """Return the value currently held (None while unavailable)."""
+        return self._current
+
+    def add(self, timestamp: float, value: float | None) -> None:
+        """Close the held value at ``timestamp`` and hold ``value`` from there."""
+        self._fold(timestamp)
+        self._current = value
+        self._since = timestamp if value is not None else None
+
+    def _fold(self, timestamp: float) -> None:
+        """Move the held value's contribution up to ``timestamp`` into the integral."""
+        if self._current is None or self._since is None:
+            return
+        elapsed = timestamp - self._since
+        if elapsed > 0:
+            self.integral += self._current * elapsed
+            self.duration += elapsed
+            self._since = timestamp
+            self._override = None
+
+    def value(self, timestamp: float) -> float | None:
+        """Return the average up to ``timestamp`` (None before any reading)."""
+        integral, duration = self.totals(timestamp)
+        if duration > 0:
+            return integral / duration
+        if self._override is not None:
+            return self._override
+        return self._current
+
+    def totals(self, timestamp: float) -> tuple[float, float]:
+        """Return (integral, duration) including the held value up to ``timestamp``."""
+        integral, duration = self.integral, self.duration
+        if self._current is not None and self._since is not None and timestamp > self._since:
+            elapsed = timestamp - self._since
+            integral += self._current * elapsed
+            duration += elapsed
+        return integral, duration
+
+    def reset(self, timestamp: float, average: float | None = None) -> None:
+        """Start a new period at ``timestamp``; the held value carries over.
+
+        With ``average`` the closed part is rewritten to that average over
+        the duration accumulated so far (manual set).  Before any time has
+        accrued there is nothing to rewrite, so ``average`` is reported as
+        is until the held value starts to add weight.
+        """
+        self._override = None
+        if average is None:
+            self.integral = 0.0
+            self.duration = 0.0
+        else:
+            self._fold(timestamp)
+            self.integral = average * self.duration
+            if self.duration == 0:
+                self._override = average
+        if self._current is not None:
+            self._since = timestamp
+
+    def restore(self, integral: float, duration: float) -> None:
+        """Replace the closed totals with ones saved before a restart."""
+        self.integral = float(integral)
+        self.duration = float(duration)
+        self._override = None
+
+    def as_list(self, timestamp: float) -> list[float]:
+        """Return [integral, duration] up to ``timestamp`` for persistence."""
+        return list(self.totals(timestamp))
@@ -8,16 +8,26 @@ from homeassistant.core import callback
 from homeassistant.helpers import selector
 
 from .const import (
+    CONF_DEADBAND,
+    CONF_DEADBAND_MAX_AGE,
+    CONF_DEADBAND_RELATIVE,
     CONF_DEVICE_ID,
+    CONF_ENTITY_MODE,
     CONF_INITIAL_DELTA,
     CONF_INITIAL_MAX,
     CONF_INITIAL_MIN,
     CONF_OFFSET,
+    CONF_PUBLISH_EXTREMES,
+    CONF_ROLLING_WINDOW,
+    CONF_PUBLISH_INTERVAL,
+    CONF_ROLLUP,
     CONF_RESET_HISTORY,
     CONF_PERIODS,
     CONF_SENSOR_ENTITY,
     CONF_TYPES,
     DOMAIN,
+    ENTITY_MODE_SENSORS,
+    ENTITY_MODE_SUMMARY,
     PERIOD_DAILY,
     PERIOD_MONTHLY,
     PERIOD_WEEKLY,
@@ -26,6 +36,13 @@ from .const import (
     TYPE_MAX,
     TYPE_MIN,
     TYPE_DELTA,
+    TYPE_AVERAGE,
+    TYPE_P5,
+    TYPE_P50,
+    TYPE_P95,
+    TYPE_COUNT,
+    TYPE_MEAN,
+    TYPE_STD,
 )
 
 
@@ -56,6 +73,65 @@ def _coerce_localized_float(value):
     return float(value)
 
 
+def _build_performance_schema(default_interval, default_extremes, default_rollup, default_deadband=(0, 0, 0)):
+    """Build the schema dict for the publish window, roll-up and deadband settings."""
+    deadband, deadband_relative, deadband_max_age = default_deadband
+    return {
+        vol.Optional(CONF_PUBLISH_INTERVAL, default=default_interval): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0,
+                max=3600,
+                step=1,
+                unit_of_measurement="seconds",
+            )
+        ),
+        vol.Optional(CONF_PUBLISH_EXTREMES, default=default_extremes): selector.BooleanSelector(),
+        vol.Optional(CONF_ROLLUP, default=default_rollup): selector.BooleanSelector(),
+        vol.Optional(CONF_DEADBAND, default=deadband): selector.NumberSelector(
+            selector.NumberSelectorConfig(min=0, mode="box", step="any")
+        ),
+        vol.Optional(CONF_DEADBAND_RELATIVE, default=deadband_relative): selector.NumberSelector(
+            selector.NumberSelectorConfig(min=0, max=100, mode="box", step="any", unit_of_measurement="%")
+        ),
+        vol.Optional(CONF_DEADBAND_MAX_AGE, default=deadband_max_age): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0,
+                max=86400,
+                step=1,
+                unit_of_measurement="seconds",
+            )
+        ),
+    }
+
+
+def _build_rolling_schema(default_window):
+    """Build the schema dict for the rolling window length (0 = disabled)."""
+    return {
+        vol.Optional(CONF_ROLLING_WINDOW, default=default_window): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0,
+                max=168,
+                step=1,
+                unit_of_measurement="hours",
+            )
+        ),
+    }
+
+
+def _build_entity_mode_schema(default_mode):
+    """Build the schema dict for the entity mode (per-sensor or summary)."""
+    return {
+        vol.Optional(CONF_ENTITY_MODE, default=default_mode): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=[
+                    {"value": ENTITY_MODE_SENSORS, "label": "One sensor per period and type"},
+                    {"value": ENTITY_MODE_SUMMARY, "label": "One summary sensor with all values as attributes"},
+                ],
+            )
+        ),
+    }
+
+
 def _build_initial_values_schema(periods, types):
     """Build the schema dict for initial values."""
     schema = {}
@@ -84,6 +160,21 @@ def _validate_initial_values(user_input, periods):
     return errors
 
 
+# Title suffix per type, in the order they appear in the title.
+_TITLE_LABELS = (
+    (TYPE_MAX, "Max"),
+    (TYPE_MIN, "Min"),
+    (TYPE_DELTA, "Delta"),
+    (TYPE_AVERAGE, "Average"),
+    (TYPE_P5, "P5"),
+    (TYPE_P50, "P50"),
+    (TYPE_P95, "P95"),
+    (TYPE_COUNT, "Count"),
+    (TYPE_MEAN, "Mean"),
+    (TYPE_STD, "Std dev"),
+)
+
+
 def _build_entry_title(hass, sensor_entity, types):
     """Build a human-readable entry title from the source sensor and selected types."""
     sensor_name = sensor_entity
@@ -92,13 +183,7 @@ def _build_entry_title(hass, sensor_entity, types):
         if state and state.name:
             sensor_name = state.name
 
-    suffixes = []
-    if TYPE_MAX in types:
-        suffixes.append("Max")
-    if TYPE_MIN in types:
-        suffixes.append("Min")
-    if TYPE_DELTA in types:
-        suffixes.append("Delta")
+    suffixes = [label for type_, label in _TITLE_LABELS if type_ in types]
     suffix = "/".join(suffixes) if suffixes else "Max/Min"
     return f"{sensor_name} ({suffix})"
 
@@ -140,6 +225,15 @@ class MaxMinConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         default_periods = user_input.get(CONF_PERIODS, [PERIOD_DAILY]) if user_input else [PERIOD_DAILY]
         default_types = user_input.get(CONF_TYPES, [TYPE_MAX, TYPE_MIN]) if user_input else [TYPE_MAX, TYPE_MIN]
         default_offset = user_input.get(CONF_OFFSET, 0) if user_input else 0
+        default_publish_interval = user_input.get(CONF_PUBLISH_INTERVAL, 0) if user_input else 0
+        default_publish_extremes = user_input.get(CONF_PUBLISH_EXTREMES, False) if user_input else False
+        default_rollup = user_input.get(CONF_ROLLUP, False) if user_input else False
+        default_entity_mode = user_input.get(CONF_ENTITY_MODE, ENTITY_MODE_SENSORS) if user_input else ENTITY_MODE_SENSORS
+        default_rolling_window = user_input.get(CONF_ROLLING_WINDOW, 0) if user_input else 0
+        default_deadband = tuple(
+            user_input.get(key, 0) if user_input else 0
+            for key in (CONF_DEADBAND, CONF_DEADBAND_RELATIVE, CONF_DEADBAND_MAX_AGE)
+        )
 
         return self.async_show_form(
             step_id="user",
@@ -165,6 +259,13 @@ class MaxMinConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                             {"value": TYPE_MIN, "label": "Minimum"},
                             {"value": TYPE_MAX, "label": "Maximum"},
                             {"value": TYPE_DELTA, "label": "Delta"},
+                            {"value": TYPE_AVERAGE, "label": "Average"},
+                            {"value": TYPE_P5, "label": "5th percentile"},
+                            {"value": TYPE_P50, "label": "Median"},
+                            {"value": TYPE_P95, "label": "95th percentile"},
+                            {"value": TYPE_COUNT, "label": "Reading count"},
+                            {"value": TYPE_MEAN, "label": "Mean"},
+                            {"value": TYPE_STD, "label": "Standard deviation"},
                         ],
                         multiple=True,
                     )
@@ -180,6 +281,11 @@ class MaxMinConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         unit_of_measurement="seconds",
                     )
                 ),
+                **_build_rolling_schema(default_rolling_window),
+                **_build_entity_mode_schema(default_entity_mode),
+                **_build_performance_schema(
+                    default_publish_interval, default_publish_extremes, default_rollup, default_deadband
+                ),
             }),
             errors=errors,
         )
@@ -248,6 +354,19 @@ class MaxMinOptionsFlow(config_entries.OptionsFlow):
         default_periods = self._config_entry.options.get(CONF_PERIODS, self._config_entry.data.get(CONF_PERIODS, [PERIOD_DAILY]))
         default_device = self._config_entry.options.get(CONF_DEVICE_ID, self._config_entry.data.get(CONF_DEVICE_ID))
         default_offset = self._config_entry.options.get(CONF_OFFSET, self._config_entry.data.get(CONF_OFFSET, 0))
+        default_publish_interval = self._config_entry.options.get(CONF_PUBLISH_INTERVAL, self._config_entry.data.get(CONF_PUBLISH_INTERVAL, 0))
+        default_publish_extremes = self._config_entry.options.get(CONF_PUBLISH_EXTREMES, self._config_entry.data.get(CONF_PUBLISH_EXTREMES, False))
+        default_rollup = self._config_entry.options.get(CONF_ROLLUP, self._config_entry.data.get(CONF_ROLLUP, False))
+        default_entity_mode = self._config_entry.options.get(
+            CONF_ENTITY_MODE, self._config_entry.data.get(CONF_ENTITY_MODE, ENTITY_MODE_SENSORS)
+        )
+        default_rolling_window = self._config_entry.options.get(
+            CONF_ROLLING_WINDOW, self._config_entry.data.get(CONF_ROLLING_WINDOW, 0)
+        )
+        default_deadband = tuple(
+            self._config_entry.options.get(key, self._config_entry.data.get(key, 0))
+            for key in (CONF_DEADBAND, CONF_DEADBAND_RELATIVE, CONF_DEADBAND_MAX_AGE)
+        )
 
         return self.async_show_form(
             step_id="init",
@@ -276,6 +395,13 @@ class MaxMinOptionsFlow(config_entries.OptionsFlow):
                             {"value": TYPE_MIN, "label": "Minimum"},
                             {"value": TYPE_MAX, "label": "Maximum"},
                             {"value": TYPE_DELTA, "label": "Delta"},
+                            {"value": TYPE_AVERAGE, "label": "Average"},
+                            {"value": TYPE_P5, "label": "5th percentile"},
+                            {"value": TYPE_P50, "label": "Median"},
+                            {"value": TYPE_P95, "label": "95th percentile"},
+                            {"value": TYPE_COUNT, "label": "Reading count"},
+                            {"value": TYPE_MEAN, "label": "Mean"},
+                            {"value": TYPE_STD, "label": "Standard deviation"},
                         ],
                         multiple=True,
                     )
@@ -294,6 +420,11 @@ class MaxMinOptionsFlow(config_entries.OptionsFlow):
                         unit_of_measurement="seconds",
                     )
                 ),
+                **_build_rolling_schema(default_rolling_window),
+                **_build_entity_mode_schema(default_entity_mode),
+                **_build_performance_schema(
+                    default_publish_interval, default_publish_extremes, default_rollup, default_deadband
+                ),
             }),
             errors=errors,
         )
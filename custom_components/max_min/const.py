@@ -9,15 +9,47 @@ CONF_INITIAL_MAX = "initial_max"
 CONF_INITIAL_DELTA = "initial_delta"
 CONF_OFFSET = "offset"
 CONF_RESET_HISTORY = "reset_history"
+CONF_PUBLISH_INTERVAL = "publish_interval"
+CONF_PUBLISH_EXTREMES = "publish_extremes_immediately"
+CONF_ROLLUP = "rollup"
+CONF_ENTITY_MODE = "entity_mode"
+CONF_DEADBAND = "deadband"
+CONF_DEADBAND_RELATIVE = "deadband_relative"
+CONF_DEADBAND_MAX_AGE = "deadband_max_age"
+CONF_ROLLING_WINDOW = "rolling_window"
+
+# One sensor per period/type, or one summary sensor per entry.
+ENTITY_MODE_SENSORS = "sensors"
+ENTITY_MODE_SUMMARY = "summary"
+# Unique-id suffix of the summary sensor ({entry_id}_summary).
+SUMMARY_KEY = "summary"
+
+SERVICE_RESET = "reset"
+SERVICE_SET_VALUE = "set_value"
+ATTR_VALUE = "value"
 
 PERIOD_DAILY = "daily"
 PERIOD_WEEKLY = "weekly"
 PERIOD_MONTHLY = "monthly"
 PERIOD_YEARLY = "yearly"
 PERIOD_ALL_TIME = "all_time"
+# Sliding window of the last CONF_ROLLING_WINDOW hours (max/min only).
+PERIOD_ROLLING = "rolling"
 
 TYPE_MAX = "max"
 TYPE_MIN = "min"
 TYPE_DELTA = "delta"
+# Time-weighted average over the period (average.py).
+TYPE_AVERAGE = "average"
+# Streaming percentiles over the period (quantile.py): {type: quantile}.
+TYPE_P5 = "p5"
+TYPE_P50 = "p50"
+TYPE_P95 = "p95"
+QUANTILE_TYPES = {TYPE_P5: 0.05, TYPE_P50: 0.5, TYPE_P95: 0.95}
+# Reading count, mean and standard deviation over the period (moments.py).
+TYPE_COUNT = "count"
+TYPE_MEAN = "mean"
+TYPE_STD = "std"
+MOMENT_TYPES = (TYPE_COUNT, TYPE_MEAN, TYPE_STD)
 
 CONF_DEVICE_ID = "device_id"
\ No newline at end of file
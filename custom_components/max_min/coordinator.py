@@ -10,10 +10,14 @@ integration loads.  The setup sequence MUST be:
                          schedule reset timers.  Does NOT run catch-up
                          and does NOT register the state listener.
   3. forward_entry_setups → RestoreEntity restores start/end/last_reset
-                            into tracked_data via update_restored_data().
-  4. start_listeners() — run startup catch-up (_check_watchdog), start
-                         the periodic watchdog, and register the state
-                         change listener.  ONLY called AFTER step 3.
+                            via restore_period_record().  The records are
+                            staged (begin_restore_batch) and applied by
+                            commit_restore_batch() with one "now" and one
+                            consistency sweep, just before step 4.
+  4. start_listeners() — run startup catch-up (_check_watchdog) and
+                         register the state change listener.  ONLY called
+                         AFTER step 3.  __init__.py then registers the
+                         coordinator with the shared domain watchdog.
   5. apply_pending_initials() — enforce configured initial values for
                                 periods that had no valid restore.
 
@@ -22,27 +26,40 @@ None → _is_reset_due returns True), _pending_start_reanchor is set,
 and the first real state change wipes start/end → delta drops to 0.
 
 Safety nets:
-  - update_restored_data() clears _pending_start_reanchor when it
+  - restore_period_record() clears _pending_start_reanchor when it
     accepts valid start/end data, so even if ordering is violated the
     restored values survive.
-  - async_unload() cancels the periodic watchdog timer.
+  - The shared watchdog (watchdog.py) sleeps until the earliest
+    watchdog_due of all coordinators, only visits coordinators whose
+    next boundary has passed (is_watchdog_due), and re-checks everything
+    after wall-clock jumps.  It is unregistered on entry unload.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import logging
+import time
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple
 
 from homeassistant.util import dt as dt_util
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.event import async_track_state_change_event, async_track_point_in_time, async_track_time_interval
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event, async_track_point_in_time
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
     CONF_INITIAL_MAX,
     CONF_INITIAL_MIN,
     CONF_INITIAL_DELTA,
+    CONF_DEADBAND,
+    CONF_DEADBAND_MAX_AGE,
+    CONF_DEADBAND_RELATIVE,
     CONF_OFFSET,
+    CONF_PUBLISH_EXTREMES,
+    CONF_PUBLISH_INTERVAL,
     CONF_RESET_HISTORY,
+    CONF_ROLLING_WINDOW,
+    CONF_ROLLUP,
     CONF_PERIODS,
     CONF_SENSOR_ENTITY,
     CONF_TYPES,
@@ -51,14 +68,71 @@ from .const import (
     PERIOD_WEEKLY,
     PERIOD_YEARLY,
     PERIOD_ALL_TIME,
+    PERIOD_ROLLING,
+    MOMENT_TYPES,
+    QUANTILE_TYPES,
+    TYPE_AVERAGE,
+    TYPE_COUNT,
+    TYPE_DELTA,
     TYPE_MAX,
+    TYPE_MEAN,
     TYPE_MIN,
 )
+from .average import TimeWeightedAverage
+from .moments import RunningMoments
+from .period_state import PeriodState, TrackedData
+from .quantile import P2Quantile
+from .rolling import RollingExtremes
 
 _LOGGER = logging.getLogger(__name__)
 
-WATCHDOG_INTERVAL = timedelta(minutes=1)
 BACKUP_RESET_DELAY = timedelta(seconds=30)
+# watchdog_due of a coordinator with no bounded period (only all_time):
+# nothing to check, unlike None, which means "unknown, retry soon".
+WATCHDOG_NEVER = datetime.max.replace(tzinfo=timezone.utc)
+# Seconds between average refreshes while a value is held and no
+# publish_interval is set: a flat source sends no events (repeats are
+# filtered), yet the time-weighted average keeps moving towards it.
+AVERAGE_REFRESH_INTERVAL = 60.0
+
+# Narrowest to broadest; extremes propagate outwards along this order.
+PERIOD_HIERARCHY = (PERIOD_DAILY, PERIOD_WEEKLY, PERIOD_MONTHLY, PERIOD_YEARLY, PERIOD_ALL_TIME)
+
+# Broader periods whose every boundary is also a boundary of the key period,
+# so the key period's current window always lies inside theirs and they can
+# be rolled up from it (a week can straddle a month or year boundary).
+ROLLUP_PARENTS = {
+    PERIOD_DAILY: (PERIOD_WEEKLY, PERIOD_MONTHLY, PERIOD_YEARLY, PERIOD_ALL_TIME),
+    PERIOD_WEEKLY: (PERIOD_ALL_TIME,),
+    PERIOD_MONTHLY: (PERIOD_YEARLY, PERIOD_ALL_TIME),
+    PERIOD_YEARLY: (PERIOD_ALL_TIME,),
+}
+
+
+class SourceMetadata(NamedTuple):
+    """Source attributes mirrored by the entities (None = not seen yet)."""
+
+    unit: str | None = None
+    device_class: str | None = None
+    state_class: str | None = None
+
+
+class ResetSeed(NamedTuple):
+    """Seed for a period reset and where it came from."""
+
+    value: float | None
+    # True for a fresh source reading; False for the last end value (or
+    # None) used while the source is unavailable or stale.
+    live: bool
+
+
+class AttributeSnapshot(NamedTuple):
+    """Precomputed extra_state_attributes for one period's sensors."""
+
+    # (last_reset, last_reset_reason, last_reset_triggered_at)
+    key: tuple
+    version: int
+    attributes: Mapping[str, Any]
 
 
 def _as_float(value):
@@ -70,6 +144,20 @@ def _as_float(value):
     return float(value)
 
 
+def parse_source_state(state) -> float | None:
+    """Parse a source state into the tracked float, or None if unusable.
+
+    Rounded to 4 decimals to avoid float precision noise (0.9999999999998).
+    """
+    if not state or state.state in (None, "unknown", "unavailable"):
+        return None
+    try:
+        return round(float(state.state), 4)
+    except ValueError:
+        _LOGGER.warning("Invalid sensor value: %s", state.state)
+        return None
+
+
 class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the sensor."""
 
@@ -84,71 +172,96 @@ class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
         )
         self.config_entry = config_entry
         self.sensor_entity = config_entry.data[CONF_SENSOR_ENTITY]
-        self.periods = config_entry.options.get(CONF_PERIODS, config_entry.data.get(CONF_PERIODS, [PERIOD_DAILY]))
-        # Fallback to verify single list
-        if isinstance(self.periods, str):
-            self.periods = [self.periods]
-            
-        self.types = config_entry.options.get(CONF_TYPES, config_entry.data.get(CONF_TYPES, [TYPE_MAX, TYPE_MIN]))
-        self.offset = config_entry.options.get(CONF_OFFSET, config_entry.data.get(CONF_OFFSET, 0))
+        self._load_options()
         
         # Surgical reset list: list of "period_type" to ignore during restore
         self.reset_history = config_entry.options.get(CONF_RESET_HISTORY, [])
         if isinstance(self.reset_history, bool):
             # Backward compatibility with v0.3.21 global flag
             self.reset_history = ["all"] if self.reset_history else []
+        self._skip_history = frozenset(self.reset_history)
+        self._skip_all_history = "all" in self._skip_history
 
 
-        # Data structure: {period: {"max": value, "min": value, "start": value, "end": value}}
-        self.tracked_data = {}
+        # Data structure: {period: PeriodState(max, min, start, end, last_reset, ...)}
+        self.tracked_data = TrackedData()
         # Store configured initial values so they can be enforced after restore
         self._configured_initials = {}
 
-        # Legacy global values (backward compatibility)
-        global_initial_max = config_entry.options.get(CONF_INITIAL_MAX, config_entry.data.get(CONF_INITIAL_MAX))
-        global_initial_min = config_entry.options.get(CONF_INITIAL_MIN, config_entry.data.get(CONF_INITIAL_MIN))
-
         for period in self.periods:
-            # Try specific period value first, then global
-            specific_max_key = f"{period}_{CONF_INITIAL_MAX}"
-            specific_min_key = f"{period}_{CONF_INITIAL_MIN}"
-            specific_delta_key = f"{period}_{CONF_INITIAL_DELTA}"
-
-            p_initial_max = config_entry.options.get(specific_max_key, config_entry.data.get(specific_max_key, global_initial_max))
-            p_initial_min = config_entry.options.get(specific_min_key, config_entry.data.get(specific_min_key, global_initial_min))
-            p_initial_delta = config_entry.options.get(specific_delta_key, config_entry.data.get(specific_delta_key))
-
-            # Ensure we coerce to float if they came from somewhere weird
-            if p_initial_max is not None:
-                try:
-                    p_initial_max = _as_float(p_initial_max)
-                except (ValueError, TypeError):
-                    p_initial_max = None
-            if p_initial_min is not None:
-                try:
-                    p_initial_min = _as_float(p_initial_min)
-                except (ValueError, TypeError):
-                    p_initial_min = None
-            if p_initial_delta is not None:
-                try:
-                    p_initial_delta = _as_float(p_initial_delta)
-                except (ValueError, TypeError):
-                    p_initial_delta = None
-
-            _LOGGER.debug("Period %s: Initial Max=%s, Min=%s, Delta=%s", period, p_initial_max, p_initial_min, p_initial_delta)
-
             self.tracked_data[period] = self._default_period_data()
-            self._configured_initials[period] = {
-                "max": p_initial_max,
-                "min": p_initial_min,
-                "delta": p_initial_delta,
-            }
+            self._configured_initials[period] = self._read_configured_initials(period)
+
+        # {period: (max_targets, min_targets)}: broader tracked periods that
+        # accept this period's extremes (surgical resets already excluded).
+        self._propagation_targets = self._build_propagation_targets()
+        # Roll-up: _rollup_base is the narrowest tracked period and
+        # _rollup_targets the broader periods currently derived from it.
+        # Their tracked_data holds the closed sub-period aggregate; the live
+        # max/min/end is merge(closed, base).  Empty when the mode is off.
+        self._rollup_base = next((p for p in PERIOD_HIERARCHY if p in self.tracked_data), None)
+        self._rollup_targets: tuple[str, ...] = ()
+        self._rollup_push_targets = None
 
         self._reset_listeners = {}
         self._backup_reset_listeners = {}
         self._next_resets = {} # Keep track of next reset times for offset logic
         self._unsub_sensor_state_listener = None
-        self._watchdog_unsub = None
+        # Earliest instant at which any period could need a reset.  The shared
+        # watchdog skips this coordinator until then.  None means "check on
+        # the next tick" (not yet computed, or the last check failed).
+        self._watchdog_due: datetime | None = None
+        # Boundary table: {period: (period_start_ts, next_period_start_ts,
+        # period_start)} for the period containing the last checked instant.
+        # Rebuilt only when a boundary is crossed or the HA time zone changes.
+        self._period_bounds: dict[str, tuple[float, float, datetime]] = {}
+        self._bounds_tz = None
+        # last_reset object last verified as current for each period.  While
+        # it is unchanged and now is inside the cached window, no reset can
+        # be due, so the per-event check is a single float comparison.
+        self._verified_last_reset: dict = {}
+        # (period, field) keys modified since the last publish.  Entities
+        # read changed_keys while handling an update and skip the state
+        # write when none of their own keys moved (None = refresh all).
+        self._pending_changes: set[tuple[str, str]] = set()
+        self.changed_keys: frozenset[tuple[str, str]] | None = None
+        self._last_publish: float | None = None
+        self._unsub_publish_timer = None
+        # Repeat-event pre-filter: raw state string of the last processed
+        # source event, and the epoch until which an identical string can
+        # not change anything (earliest boundary, minus the cumulative
+        # offset).  Any write to tracked_data outside the event path clears
+        # _last_source_state so the next event is processed in full.
+        self._last_source_state: str | None = None
+        self._source_state_valid_until = 0.0
+        self.events_processed = 0
+        # Last known unit/device_class/state_class of the source, refreshed
+        # from first refresh and source events only, so entities never hit
+        # the state machine while being serialised.  _source_attributes is
+        # the attributes object it was taken from; HA reuses it when a write
+        # leaves the attributes unchanged, so most events skip the refresh.
+        self.source_metadata = SourceMetadata()
+        self._source_attributes = None
+        # {period: AttributeSnapshot}; rebuilt (version + 1) only when reset
+        # metadata changes, so entities share one read-only mapping and
+        # isoformat() runs once per reset, not once per write.  Delta sensors
+        # also show start/end; {period: ((version, start, end), mapping)}
+        # caches that copy separately so end changes leave the snapshot alone.
+        self._attribute_snapshots: dict[str, AttributeSnapshot] = {}
+        self._delta_attributes: dict[str, tuple[tuple, Mapping[str, Any]]] = {}
+        self.events_skipped = 0
+        # Set by the shared watchdog while registered; called whenever the due
+        # time moves earlier so the watchdog can re-arm its single timer.
+        self.watchdog_listener = None
+        # Set by the shared store while registered; called after each
+        # publish so the tracker state is persisted (debounced) to disk.
+        self.persist_listener = None
+        # Set by the sensor platform; called by apply_options() to add and
+        # remove entities and re-link the device for the new options.
+        self.entities_listener = None
+        # Periods restored from the shared store during setup; their
+        # entities skip their own RestoreEntity record.
+        self.stored_periods: set[str] = set()
         self._source_is_cumulative = False
         # Periods whose start/end need re-anchoring on the first sensor update
         # after a reset.  Avoids race conditions with sensors that also reset at
@@ -164,28 +277,384 @@ class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
         # the restored sensor type, so a surgical reset of yearly_max does not
         # get canceled by a valid yearly_min restore from the same period.
         self._restore_accepted: set[tuple[str, str]] = set()
+        # Restored records staged during platform setup (None = apply
+        # immediately); see begin_restore_batch().
+        self._restore_batch: list[tuple] | None = None
+        # Rolling max/min over the last rolling_window seconds (rolling.py),
+        # and the timer armed at its next segment expiry.
+        self._rolling = RollingExtremes(self.rolling_window) if self.rolling_window else None
+        self._rolling_restored = False
+        self._unsub_rolling_timer = None
+        self._rolling_timer_at: float | None = None
+        # {period: TimeWeightedAverage} while the average type is selected.
+        self._averages: dict[str, TimeWeightedAverage] = {}
+        self._sync_averages()
+        # {period: {type: P2Quantile}} for the selected percentile types.
+        self._quantiles: dict[str, dict[str, P2Quantile]] = {}
+        self._sync_quantiles()
+        # {period: RunningMoments} shared by the count/mean/std types.
+        self._moments: dict[str, RunningMoments] = {}
+        self._moment_types: tuple[str, ...] = ()
+        self._sync_moments()
+        self._update_rollup_targets()
+
+    def _load_options(self) -> None:
+        """Read the options that apply_options() can change on a live entry."""
+        config_entry = self.config_entry
+        self.periods = config_entry.options.get(CONF_PERIODS, config_entry.data.get(CONF_PERIODS, [PERIOD_DAILY]))
+        # Fallback to verify single list
+        if isinstance(self.periods, str):
+            self.periods = [self.periods]
+            
+        self.types = config_entry.options.get(CONF_TYPES, config_entry.data.get(CONF_TYPES, [TYPE_MAX, TYPE_MIN]))
+        self.offset = config_entry.options.get(CONF_OFFSET, config_entry.data.get(CONF_OFFSET, 0))
+        # Optional coalescing window for entity state writes (0 = every change).
+        # tracked_data stays exact on every event; only publication is delayed.
+        self.publish_interval = config_entry.options.get(
+            CONF_PUBLISH_INTERVAL, config_entry.data.get(CONF_PUBLISH_INTERVAL, 0)
+        ) or 0
+        self.publish_extremes = config_entry.options.get(
+            CONF_PUBLISH_EXTREMES, config_entry.data.get(CONF_PUBLISH_EXTREMES, False)
+        )
+        # Roll-up mode: only the narrowest period sees raw samples (see
+        # _update_rollup_targets).
+        self.rollup = config_entry.options.get(CONF_ROLLUP, config_entry.data.get(CONF_ROLLUP, False))
+        # Publication deadband applied by the entities (0 = off): absolute
+        # and relative (% of the published value) thresholds, and the age
+        # after which a held-back value is written anyway.
+        self.deadband = config_entry.options.get(CONF_DEADBAND, config_entry.data.get(CONF_DEADBAND, 0)) or 0
+        self.deadband_relative = config_entry.options.get(
+            CONF_DEADBAND_RELATIVE, config_entry.data.get(CONF_DEADBAND_RELATIVE, 0)
+        ) or 0
+        self.deadband_max_age = config_entry.options.get(
+            CONF_DEADBAND_MAX_AGE, config_entry.data.get(CONF_DEADBAND_MAX_AGE, 0)
+        ) or 0
+        # Sliding window in seconds (0 = no rolling max/min sensors).
+        self.rolling_window = float(
+            config_entry.options.get(CONF_ROLLING_WINDOW, config_entry.data.get(CONF_ROLLING_WINDOW, 0)) or 0
+        ) * 3600
+
+    def _read_configured_initials(self, period) -> dict:
+        """Return the configured initial max/min/delta for one period."""
+        config_entry = self.config_entry
+        # Legacy global values (backward compatibility)
+        global_initial_max = config_entry.options.get(CONF_INITIAL_MAX, config_entry.data.get(CONF_INITIAL_MAX))
+        global_initial_min = config_entry.options.get(CONF_INITIAL_MIN, config_entry.data.get(CONF_INITIAL_MIN))
+
+        # Try specific period value first, then global
+        specific_max_key = f"{period}_{CONF_INITIAL_MAX}"
+        specific_min_key = f"{period}_{CONF_INITIAL_MIN}"
+        specific_delta_key = f"{period}_{CONF_INITIAL_DELTA}"
+
+        p_initial_max = config_entry.options.get(specific_max_key, config_entry.data.get(specific_max_key, global_initial_max))
+        p_initial_min = config_entry.options.get(specific_min_key, config_entry.data.get(specific_min_key, global_initial_min))
+        p_initial_delta = config_entry.options.get(specific_delta_key, config_entry.data.get(specific_delta_key))
+
+        # Ensure we coerce to float if they came from somewhere weird
+        if p_initial_max is not None:
+            try:
+                p_initial_max = _as_float(p_initial_max)
+            except (ValueError, TypeError):
+                p_initial_max = None
+        if p_initial_min is not None:
+            try:
+                p_initial_min = _as_float(p_initial_min)
+            except (ValueError, TypeError):
+                p_initial_min = None
+        if p_initial_delta is not None:
+            try:
+                p_initial_delta = _as_float(p_initial_delta)
+            except (ValueError, TypeError):
+                p_initial_delta = None
+
+        _LOGGER.debug("Period %s: Initial Max=%s, Min=%s, Delta=%s", period, p_initial_max, p_initial_min, p_initial_delta)
+        return {
+            "max": p_initial_max,
+            "min": p_initial_min,
+            "delta": p_initial_delta,
+        }
 
     @callback
-    def _check_watchdog(self, now):
-        """Periodic check to ensure no resets were missed."""
+    def _check_watchdog(self, now) -> bool:
+        """Check that no resets were missed; return True if any was forced."""
         _LOGGER.debug("Watchdog checking for missed resets...")
         changes = False
+        failed = False
         for period in self.periods:
             try:
                 if self.ensure_period_current(period, now, reason="watchdog"):
                     changes = True
             except Exception as err:
+                failed = True
                 _LOGGER.exception("Watchdog failed for period %s: %s", period, err)
                 
         if changes:
             _LOGGER.info("Watchdog forced missed resets successfully.")
 
+        # A failed period keeps the coordinator due so the next tick retries.
+        self._watchdog_due = None if failed else self._compute_watchdog_due(now)
+        return changes
+
+    def _compute_watchdog_due(self, now) -> datetime:
+        """Return the earliest upcoming boundary (plus offset) of any period.
+
+        WATCHDOG_NEVER when no tracked period has a boundary.
+        """
+        now_local = dt_util.as_local(now)
+        effective_offset = timedelta(seconds=self.offset if self._source_is_cumulative else 0)
+        due = None
+        for period in self.periods:
+            if period == PERIOD_ALL_TIME:
+                continue
+            # Inside the offset window of the current boundary the reset may
+            # still be pending, so the due time is the end of that window.
+            period_start = self._get_period_start(now_local, period)
+            if period_start is not None and now_local < period_start + effective_offset:
+                boundary = period_start
+            else:
+                boundary = self._compute_next_reset(now_local, period)
+            if boundary is None:
+                continue
+            boundary += effective_offset
+            if due is None or boundary < due:
+                due = boundary
+        return due if due is not None else WATCHDOG_NEVER
+
+    @property
+    def watchdog_due(self) -> datetime | None:
+        """Return the instant the shared watchdog should next check, if known."""
+        return self._watchdog_due
+
+    def is_watchdog_due(self, now) -> bool:
+        """Return True when the shared watchdog should check this coordinator."""
+        due = self._watchdog_due
+        return due is None or now >= due
+
+    @property
+    def event_stats(self) -> dict:
+        """Return processed/skipped source event counters for diagnostics."""
+        return {"processed": self.events_processed, "skipped": self.events_skipped}
+
+    @property
+    def tracked_data(self) -> TrackedData:
+        """Return the per-period state records."""
+        return self._tracked_data
+
+    @tracked_data.setter
+    def tracked_data(self, value) -> None:
+        # Plain {period: dict} assignments are converted to PeriodState.
+        self._tracked_data = value if isinstance(value, TrackedData) else TrackedData(value)
+
     def get_value(self, period, type_):
         """Get value for specific period and type."""
+        if period == PERIOD_ROLLING:
+            if self._rolling is None or type_ not in ("max", "min"):
+                return None
+            return self._rolling.max if type_ == "max" else self._rolling.min
+        if type_ == TYPE_AVERAGE:
+            average = self._averages.get(period)
+            value = average.value(dt_util.now().timestamp()) if average is not None else None
+            return round(value, 4) if value is not None else None
+        if type_ in QUANTILE_TYPES:
+            quantile = self._quantiles.get(period, {}).get(type_)
+            value = quantile.value if quantile is not None else None
+            return round(value, 4) if value is not None else None
+        if type_ in MOMENT_TYPES:
+            moments = self._moments.get(period)
+            if moments is None:
+                return None
+            if type_ == TYPE_COUNT:
+                return moments.count
+            if type_ == TYPE_MEAN:
+                value = moments.mean if moments.count else None
+            else:
+                value = moments.std
+            return round(value, 4) if value is not None else None
+        if period in self._rollup_targets and type_ in ("max", "min", "end"):
+            return self._rollup_value(period, type_)
         if period in self.tracked_data:
             return self.tracked_data[period].get(type_)
         return None
 
+    def get_attribute_snapshot(self, period) -> AttributeSnapshot:
+        """Return the current attribute snapshot for a period's sensors."""
+        data = self.tracked_data.get(period)
+        if data is None:
+            key = (None, None, None)
+        else:
+            key = (data.last_reset, data.last_reset_reason, data.last_reset_triggered_at)
+
+        snapshot = self._attribute_snapshots.get(period)
+        if snapshot is not None and snapshot.key == key:
+            return snapshot
+
+        last_reset, last_reset_reason, last_reset_triggered_at = key
+        attrs = {"config_entry_id": self.config_entry.entry_id}
+        if last_reset:
+            attrs["last_reset"] = last_reset.isoformat()
+        if last_reset_reason:
+            attrs["last_reset_reason"] = last_reset_reason
+        if last_reset_triggered_at and hasattr(last_reset_triggered_at, "isoformat"):
+            attrs["last_reset_triggered_at"] = last_reset_triggered_at.isoformat()
+
+        snapshot = AttributeSnapshot(
+            key,
+            snapshot.version + 1 if snapshot is not None else 1,
+            MappingProxyType(attrs),
+        )
+        self._attribute_snapshots[period] = snapshot
+        return snapshot
+
+    def get_delta_attributes(self, period) -> Mapping[str, Any]:
+        """Return the attribute snapshot plus start/end for a delta sensor."""
+        snapshot = self.get_attribute_snapshot(period)
+        data = self.tracked_data.get(period)
+        start = end = None
+        if data is not None:
+            start = data.start
+            end = self._rollup_value(period, "end") if period in self._rollup_targets else data.end
+        key = (snapshot.version, start, end)
+
+        cached = self._delta_attributes.get(period)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        # start/end are only shown by delta sensors; max/min persist them in
+        # their restore data instead.
+        attrs = dict(snapshot.attributes)
+        if start is not None:
+            attrs["start_value"] = start
+        if end is not None:
+            attrs["end_value"] = end
+        delta_attrs = MappingProxyType(attrs)
+        self._delta_attributes[period] = (key, delta_attrs)
+        return delta_attrs
+
+    def _update_rollup_targets(self) -> None:
+        """Enable or disable roll-up for the current source mode.
+
+        The cumulative offset dead zone evaluates each period against its own
+        max, so roll-up is only used when no offset applies.  Switching it
+        off first folds the live base values into the broader periods.
+        """
+        targets = ()
+        if self.rollup and not (self.offset > 0 and self._source_is_cumulative):
+            targets = tuple(
+                p for p in ROLLUP_PARENTS.get(self._rollup_base, ()) if p in self.tracked_data
+            )
+        if targets == self._rollup_targets:
+            return
+
+        self._fold_rollup()
+        self._rollup_targets = targets
+        self._rollup_push_targets = None
+        if targets:
+            max_targets, min_targets = self._propagation_targets[self._rollup_base]
+            self._rollup_push_targets = (
+                tuple(p for p in max_targets if p not in targets),
+                tuple(p for p in min_targets if p not in targets),
+            )
+
+    def _rollup_base_in_window(self, period) -> bool:
+        """Return True when the base period's window lies inside period's.
+
+        False only in the instant between a broader reset and the base reset
+        at the same boundary, when the base still holds the closed window.
+        """
+        return self._window_starts_within(
+            self.tracked_data[self._rollup_base].last_reset,
+            self.tracked_data[period].last_reset,
+        )
+
+    def _rollup_value(self, period, type_):
+        """Return merge(closed sub-periods, current base) for one field."""
+        closed = self.tracked_data[period].get(type_)
+        if not self._rollup_base_in_window(period):
+            return closed
+        current = self.tracked_data[self._rollup_base].get(type_)
+        if current is None:
+            return closed
+        if closed is None or type_ == "end":
+            return current
+        if type_ == "max":
+            return current if current > closed else closed
+        return current if current < closed else closed
+
+    def _fold_rollup(self) -> None:
+        """Merge the current base window into every rolled-up period.
+
+        Called before the base or a rolled-up period resets, so the closed
+        aggregate is complete when the base starts a new sub-period.
+        """
+        for period in self._rollup_targets:
+            data = self.tracked_data[period]
+            data.max = self._rollup_value(period, "max")
+            data.min = self._rollup_value(period, "min")
+            data.end = self._rollup_value(period, "end")
+
+    @callback
+    def _publish_changes(self, refresh_all=False) -> None:
+        """Notify entities of the (period, field) keys changed since last publish."""
+        if self._unsub_publish_timer is not None:
+            self._unsub_publish_timer()
+            self._unsub_publish_timer = None
+        self._last_publish = time.monotonic()
+        self.changed_keys = None if refresh_all else frozenset(self._pending_changes)
+        self._pending_changes.clear()
+        try:
+            self.async_set_updated_data({})
+        finally:
+            self.changed_keys = None
+            if self.persist_listener is not None:
+                self.persist_listener()
+        if any(average.current is not None for average in self._averages.values()):
+            self._unsub_publish_timer = async_call_later(
+                self.hass, self.publish_interval or AVERAGE_REFRESH_INTERVAL, self._async_flush_publish
+            )
+
+    @callback
+    def _publish_or_defer(self) -> None:
+        """Publish source-driven changes, honouring the publish interval.
+
+        Resets always publish directly (see _perform_reset).  New extremes
+        bypass the window when publish_extremes is enabled.  Otherwise
+        changes accumulate in _pending_changes and are flushed at most once
+        per publish_interval.
+        """
+        if self.publish_interval <= 0:
+            self._publish_changes()
+            return
+
+        if self.publish_extremes and any(
+            field in ("max", "min") for _period, field in self._pending_changes
+        ):
+            self._publish_changes()
+            return
+
+        elapsed = None if self._last_publish is None else time.monotonic() - self._last_publish
+        if elapsed is None or elapsed >= self.publish_interval:
+            self._publish_changes()
+            return
+
+        if self._unsub_publish_timer is None:
+            self._unsub_publish_timer = async_call_later(
+                self.hass, self.publish_interval - elapsed, self._async_flush_publish
+            )
+
+    @callback
+    def _async_flush_publish(self, _now) -> None:
+        """Flush changes held back by the publish interval.
+
+        Averages holding a value move with time alone, so they are
+        republished here too, at most once per interval.
+        """
+        self._unsub_publish_timer = None
+        for period, average in self._averages.items():
+            if average.current is not None:
+                self._pending_changes.add((period, TYPE_AVERAGE))
+        if self._pending_changes:
+            self._publish_changes()
+
     @staticmethod
     def _is_cumulative_state(state) -> bool:
         """Return True when the source state uses a cumulative class."""
@@ -194,6 +663,31 @@ class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
         state_class = state.attributes.get("state_class") if hasattr(state, "attributes") else None
         return state_class in ("total", "total_increasing")
 
+    def _refresh_source_metadata(self, state) -> None:
+        """Update the cached source metadata from a source state.
+
+        Values are only replaced when the source provides them, so the last
+        known unit survives the source going unavailable (e.g. at startup).
+        """
+        if state is None:
+            return
+        attributes = getattr(state, "attributes", None)
+        if attributes is None or attributes is self._source_attributes:
+            return
+        self._source_attributes = attributes
+
+        cached = self.source_metadata
+        unit = attributes.get("unit_of_measurement")
+        if unit is None or state.state in (None, "unknown", "unavailable"):
+            unit = cached.unit
+        device_class = attributes.get("device_class")
+        if device_class is None:
+            device_class = cached.device_class
+        state_class = attributes.get("state_class")
+        if state_class is None:
+            state_class = cached.state_class
+        self.source_metadata = SourceMetadata(unit, device_class, state_class)
+
     def _sync_source_cumulative_mode(self, state) -> None:
         """Update cumulative mode and reschedule when it changes."""
         is_cumulative = self._is_cumulative_state(state)
@@ -201,6 +695,11 @@ class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
             return
 
         self._source_is_cumulative = is_cumulative
+        self._update_rollup_targets()
+        # The offset only applies to cumulative sources, so the due time moves.
+        self._watchdog_due = None
+        if self.watchdog_listener is not None:
+            self.watchdog_listener()
         _LOGGER.debug(
             "Source %s cumulative mode changed to %s; rescheduling resets",
             self.sensor_entity,
@@ -210,16 +709,8 @@ class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
 
     @staticmethod
     def _default_period_data(last_reset=None):
-        """Create a fresh tracked-data dictionary for one period."""
-        return {
-            "max": None,
-            "min": None,
-            "start": None,
-            "end": None,
-            "last_reset": last_reset,
-            "last_reset_reason": None,
-            "last_reset_triggered_at": None,
-        }
+        """Create a fresh tracked-data record for one period."""
+        return PeriodState(last_reset=last_reset)
 
     def _get_source_float(self) -> float | None:
         """Read the current source sensor value as a rounded float, or None."""
@@ -326,20 +817,33 @@ class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
     @staticmethod
     def _is_timestamp_in_period(timestamp: datetime, now: datetime, period: str) -> bool:
         """Return True when timestamp belongs to the current period of now."""
+        return MaxMinDataUpdateCoordinator._in_window(
+            timestamp, MaxMinDataUpdateCoordinator._period_window(now, period)
+        )
+
+    @staticmethod
+    def _period_window(now: datetime, period: str) -> tuple[datetime | None, datetime | None]:
+        """Return (start, next start) of the period containing now (None = unbounded)."""
         if period == PERIOD_ALL_TIME:
-            return True
+            return (None, None)
 
         period_start = MaxMinDataUpdateCoordinator._get_period_start(now, period)
         if period_start is None:
-            return True
+            return (None, None)
 
-        next_period_start = MaxMinDataUpdateCoordinator._compute_next_reset(period_start, period)
+        return (period_start, MaxMinDataUpdateCoordinator._compute_next_reset(period_start, period))
+
+    @staticmethod
+    def _in_window(timestamp: datetime, window) -> bool:
+        """Return True when timestamp lies inside a _period_window()."""
+        period_start, next_period_start = window
+        if period_start is None:
+            return True
         if next_period_start is None:
             return timestamp >= period_start
-
         return period_start <= timestamp < next_period_start
 
-    def _compute_reset_seed(self, period, now=None) -> float | None:
+    def _compute_reset_seed(self, period, now=None) -> ResetSeed:
         """Compute the seed value for a period reset.
 
         Always tries the live sensor value first.  When the source is
@@ -347,6 +851,7 @@ class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
         last recorded end value so that entities keep a numeric state
         and the HA history graph shows a clean break at the period
         boundary instead of a flat line of the previous maximum.
+        ResetSeed.live tells the two apart: a fallback is no reading.
         """
         state = self.hass.states.get(self.sensor_entity)
         value = self._get_source_float()
@@ -371,14 +876,38 @@ class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
                     self._get_state_timestamp(state, now.tzinfo),
                 )
                 if period == PERIOD_DAILY:
-                    return _fallback_end_value()
-                return None
-            return value
+                    return ResetSeed(_fallback_end_value(), False)
+                return ResetSeed(None, False)
+            return ResetSeed(value, True)
         # Fallback: use last known end value regardless of sensor type.
         # For cumulative sensors this preserves the meter reading.
         # For measurement sensors this avoids a None seed that would
         # make the entity unavailable in HA (graph shows stale line).
-        return _fallback_end_value()
+        return ResetSeed(_fallback_end_value(), False)
+
+    def _get_period_bounds(self, now, period):
+        """Return cached (period_start_ts, next_period_start_ts, period_start).
+
+        Boundaries are computed from the local time of ``now`` and reused
+        until ``now`` leaves the cached window or the HA time zone changes.
+        """
+        if self._bounds_tz is not dt_util.DEFAULT_TIME_ZONE:
+            self._period_bounds = {}
+            self._verified_last_reset = {}
+            self._bounds_tz = dt_util.DEFAULT_TIME_ZONE
+
+        timestamp = now.timestamp()
+        bounds = self._period_bounds.get(period)
+        if bounds is not None and bounds[0] <= timestamp < bounds[1]:
+            return bounds
+
+        period_start = self._get_period_start(dt_util.as_local(now), period)
+        if period_start is None:
+            return None
+        next_period_start = self._compute_next_reset(period_start, period)
+        bounds = (period_start.timestamp(), next_period_start.timestamp(), period_start)
+        self._period_bounds[period] = bounds
+        return bounds
 
     def _is_reset_due(self, now, period) -> bool:
         """Check if a period reset is due based on last_reset and period boundaries."""
@@ -389,14 +918,28 @@ class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
         if not data:
             return False
 
-        period_start = self._get_period_start(now, period)
-        if not period_start:
+        # Hot path: last_reset already verified for the cached window.
+        raw_last_reset = data.last_reset
+        bounds = self._period_bounds.get(period)
+        if (
+            bounds is not None
+            and raw_last_reset is not None
+            and self._verified_last_reset.get(period) is raw_last_reset
+            and self._bounds_tz is dt_util.DEFAULT_TIME_ZONE
+            and bounds[0] <= now.timestamp() < bounds[1]
+        ):
             return False
 
-        last_reset = self._normalize_last_reset(data.get("last_reset"), period_start.tzinfo)
+        bounds = self._get_period_bounds(now, period)
+        if not bounds:
+            return False
+        period_start = bounds[2]
+
+        last_reset = self._normalize_last_reset(raw_last_reset, period_start.tzinfo)
         if last_reset:
             try:
                 if last_reset >= period_start:
+                    self._verified_last_reset[period] = raw_last_reset
                     return False
             except TypeError:
                 _LOGGER.warning(
@@ -427,16 +970,192 @@ class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
 
     def _should_skip_history(self, period, type_) -> bool:
         """Return True when restore/propagation should skip a period/type pair."""
-        return "all" in self.reset_history or f"{period}_{type_}" in self.reset_history
+        return self._skip_all_history or f"{period}_{type_}" in self._skip_history
 
     def update_restored_data(self, period, type_, value, last_reset=None):
         """Update data from restored state."""
-        # Check if this specific sensor or all sensors should skip history restore
-        check_type = "delta" if type_ in ("start", "end") else type_
-        if self._should_skip_history(period, check_type):
-            _LOGGER.debug("[%s] Skipping restore for %s %s (surgical reset triggered by config change)", self.config_entry.title, period, type_)
+        self.restore_period_record(period, {type_: value}, last_reset)
+
+    def get_restore_record(self, period) -> dict:
+        """Return the period record persisted as entity restore data.
+
+        max/min/end are the live (rolled-up) values; last_reset is an epoch.
+        With the average type, average is its [integral, duration]; with
+        percentile types, quantiles is {type: sketch state}; with count,
+        mean or std, moments is the Welford [n, mean, M2] triple.
+        """
+        data = self.tracked_data.get(period)
+        last_reset = data.last_reset if data is not None else None
+        record = {
+            "max": self.get_value(period, "max"),
+            "min": self.get_value(period, "min"),
+            "start": self.get_value(period, "start"),
+            "end": self.get_value(period, "end"),
+            "last_reset": last_reset.timestamp() if isinstance(last_reset, datetime) else None,
+            "pending_start_reanchor": period in self._pending_start_reanchor,
+            "pending_extrema_reanchor": period in self._pending_extrema_reanchor,
+        }
+        average = self._averages.get(period)
+        if average is not None:
+            record[TYPE_AVERAGE] = average.as_list(dt_util.now().timestamp())
+        quantiles = self._quantiles.get(period)
+        if quantiles:
+            record["quantiles"] = {type_: quantile.as_list() for type_, quantile in quantiles.items()}
+        moments = self._moments.get(period)
+        if moments is not None:
+            record["moments"] = moments.as_list()
+        return record
+
+    def get_restore_records(self) -> dict:
+        """Return {period: record} for every tracked period.
+
+        The rolling window state, when enabled, is kept under PERIOD_ROLLING.
+        """
+        records = {period: self.get_restore_record(period) for period in self.tracked_data}
+        if self._rolling is not None:
+            records[PERIOD_ROLLING] = self._rolling.as_dict()
+        return records
+
+    def get_rolling_state(self) -> dict | None:
+        """Return the serialised rolling window, or None when disabled."""
+        return self._rolling.as_dict() if self._rolling is not None else None
+
+    def restore_rolling_state(self, state) -> bool:
+        """Restore the rolling window segments saved before a restart.
+
+        What the source did while Home Assistant was down is unknown, so the
+        value held at shutdown is counted until restore time and closed
+        there; the value seeded by the first refresh stays current.  Applied
+        once per setup.
+        """
+        if self._rolling is None or self._rolling_restored or not isinstance(state, dict):
+            return False
+        restored = RollingExtremes.from_dict(state, self._rolling.window)
+        if restored is None:
+            return False
+        now = dt_util.now().timestamp()
+        restored.add(now, self._rolling.current)
+        restored.expire(now)
+        self._rolling = restored
+        self._rolling_restored = True
+        self._pending_changes.update(((PERIOD_ROLLING, "max"), (PERIOD_ROLLING, "min")))
+        self._arm_rolling_timer()
+        return True
+
+    def restore_stored_records(self, records) -> None:
+        """Restore period records loaded from the shared store.
+
+        Periods no longer configured are ignored.  Call inside the restore
+        batch so store and entity records are validated together.
+        """
+        for period, record in records.items():
+            if period == PERIOD_ROLLING:
+                if self.restore_rolling_state(record):
+                    self.stored_periods.add(period)
+                continue
+            if period not in self.tracked_data or not isinstance(record, dict):
+                continue
+            last_reset = record.get("last_reset")
+            try:
+                last_reset = dt_util.utc_from_timestamp(last_reset) if last_reset is not None else None
+            except (TypeError, ValueError, OverflowError):
+                continue
+            self.restore_period_record(
+                period,
+                {field: record.get(field) for field in ("max", "min", "start", "end", TYPE_AVERAGE, "quantiles", "moments")},
+                last_reset,
+                pending_start_reanchor=bool(record.get("pending_start_reanchor")),
+                pending_extrema_reanchor=bool(record.get("pending_extrema_reanchor")),
+            )
+            self.stored_periods.add(period)
+
+    def restore_period_record(
+        self,
+        period,
+        values,
+        last_reset=None,
+        pending_start_reanchor=False,
+        pending_extrema_reanchor=False,
+    ) -> None:
+        """Merge restored values ({field: value}) for one period.
+
+        The record is checked against the current period once, whatever the
+        number of fields.  The pending flags carry a re-anchor that was still
+        outstanding at shutdown (values seeded at a reset, no fresh reading
+        yet) over the restart.  Inside a restore batch the record is only
+        staged until commit_restore_batch().
+        """
+        record = (period, values, last_reset, pending_start_reanchor, pending_extrema_reanchor)
+        if self._restore_batch is not None:
+            self._restore_batch.append(record)
+            return
+
+        now_local = dt_util.as_local(dt_util.now())
+        pushed = self._apply_restored_record(*record, now_local, self._period_window(now_local, period))
+        if pushed:
+            self._propagate_extremes(period, push_max="max" in pushed, push_min="min" in pushed)
+
+    def begin_restore_batch(self) -> None:
+        """Stage restored records until commit_restore_batch().
+
+        Called from async_setup_entry before platform setup so the entities'
+        restores are validated together against one "now".
+        """
+        if self._restore_batch is None:
+            self._restore_batch = []
+
+    def commit_restore_batch(self) -> None:
+        """Apply all staged restored records, then run consistency once.
+
+        Called from async_setup_entry right before start_listeners().
+        """
+        batch = self._restore_batch
+        self._restore_batch = None
+        if not batch:
             return
 
+        now_local = dt_util.as_local(dt_util.now())
+        windows = {}
+        pushed_any = False
+        for record in batch:
+            period = record[0]
+            if period not in windows:
+                windows[period] = self._period_window(now_local, period)
+            if self._apply_restored_record(*record, now_local, windows[period]):
+                pushed_any = True
+
+        if pushed_any:
+            self._check_consistency()
+        # Entities were written during platform setup with pre-restore values.
+        self._publish_changes(refresh_all=True)
+
+    def _apply_restored_record(
+        self,
+        period,
+        values,
+        last_reset,
+        pending_start_reanchor,
+        pending_extrema_reanchor,
+        now_local,
+        window,
+    ) -> frozenset[str]:
+        """Merge one restored record; return the extreme types it restored.
+
+        window is the current period's (start, next start) for now_local.
+        """
+        # Check if this specific sensor or all sensors should skip history restore
+        accepted = {}
+        for type_, value in values.items():
+            if value is None:
+                continue
+            check_type = "delta" if type_ in ("start", "end") else type_
+            if self._should_skip_history(period, check_type):
+                _LOGGER.debug("[%s] Skipping restore for %s %s (surgical reset triggered by config change)", self.config_entry.title, period, type_)
+                continue
+            accepted[type_] = value
+        if not accepted:
+            return frozenset()
+
         if period not in self.tracked_data:
             self.tracked_data[period] = self._default_period_data()
             
@@ -445,11 +1164,10 @@ class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
         # Check if the restored data is stale (from previous period)
         # Accept if last_reset is within the same period (year, month, week, day)
         if last_reset:
-            now_local = dt_util.as_local(dt_util.now())
             last_reset = self._normalize_last_reset(last_reset, now_local.tzinfo)
             if last_reset:
                 last_reset_local = dt_util.as_local(last_reset)
-                same_period = self._is_timestamp_in_period(last_reset_local, now_local, period)
+                same_period = self._in_window(last_reset_local, window)
 
                 if not same_period:
                     _LOGGER.warning(
@@ -458,23 +1176,27 @@ class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
                         last_reset_local,
                         now_local,
                     )
-                    return
+                    return frozenset()
 
                 # If the restored last_reset is newer than what we have, take it
-                current_last_reset = self._normalize_last_reset(data.get("last_reset"), now_local.tzinfo)
+                current_last_reset = self._normalize_last_reset(data.last_reset, now_local.tzinfo)
                 if current_last_reset is None or last_reset_local > current_last_reset:
-                    data["last_reset"] = last_reset_local
+                    data.last_reset = last_reset_local
         else:
             # No last_reset info from restored state.
             # We used to be conservative here, but that caused data loss during updates.
             # Now we allow restoration if the value is more extreme or data is empty.
-            _LOGGER.debug("[%s] Restoring %s %s without last_reset info", self.config_entry.title, period, type_)
+            _LOGGER.debug("[%s] Restoring %s %s without last_reset info", self.config_entry.title, period, ", ".join(accepted))
 
-        # Mark only the restored sensor type as accepted.
+        # Mark only the restored sensor types as accepted.
         # apply_pending_initials() must still apply initials to other types in
         # the same period when a surgical reset blocked their restore.
-        self._restore_accepted.add((period, check_type))
-        self._pending_extrema_reanchor.discard(period)
+        for type_ in accepted:
+            self._restore_accepted.add((period, "delta" if type_ in ("start", "end") else type_))
+        if pending_extrema_reanchor:
+            self._pending_extrema_reanchor.add(period)
+        else:
+            self._pending_extrema_reanchor.discard(period)
 
         # Only update if the restored value extends the current range (or initializes it)
         # Note: stored data might have been initialized by current sensor state in first_refresh
@@ -482,30 +1204,62 @@ class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
         # But we also want to overwrite if the current value is just "current" and the restored is "historical max/min"
         
         # Case Max:
-        if type_ == "max":
-            if data["max"] is None or value > data["max"]:
-                data["max"] = value
+        value = accepted.get("max")
+        if value is not None and (data.max is None or value > data.max):
+            data.max = value
         
         # Case Min:
-        if type_ == "min":
-            if data["min"] is None or value < data["min"]:
-                data["min"] = value
+        value = accepted.get("min")
+        if value is not None and (data.min is None or value < data.min):
+            data.min = value
 
         # Case Start/End (Delta support):
-        if type_ in ("start", "end"):
+        if "start" in accepted or "end" in accepted:
             # We always trust restored start/end values if they passed the staleness check
             # because they represent the true period boundaries from before the restart.
-            data[type_] = value
+            if "start" in accepted:
+                data.start = accepted["start"]
+            if "end" in accepted:
+                data.end = accepted["end"]
             # Safety net: if a premature reset marked this period for
-            # re-anchoring, the valid restored data takes precedence.
-            self._pending_start_reanchor.discard(period)
-
-        self._check_consistency()
+            # re-anchoring, the valid restored data takes precedence, unless
+            # the re-anchor was itself still pending when the state was saved.
+            if pending_start_reanchor:
+                self._pending_start_reanchor.add(period)
+            else:
+                self._pending_start_reanchor.discard(period)
+
+        # Case Average: the closed [integral, duration] of this period.
+        value = accepted.get(TYPE_AVERAGE)
+        average = self._averages.get(period)
+        if average is not None and isinstance(value, (list, tuple)) and len(value) == 2:
+            average.restore(*value)
+
+        # Case Percentiles: {type: sketch state} of this period.
+        value = accepted.get("quantiles")
+        quantiles = self._quantiles.get(period)
+        if quantiles and isinstance(value, dict):
+            for type_, state in value.items():
+                if type_ in quantiles:
+                    restored = P2Quantile.from_list(QUANTILE_TYPES[type_], state)
+                    if restored is not None:
+                        quantiles[type_] = restored
+
+        # Case Count/Mean/Std: the Welford (n, mean, M2) triple.
+        value = accepted.get("moments")
+        if period in self._moments and value is not None:
+            restored = RunningMoments.from_list(value)
+            if restored is not None:
+                self._moments[period] = restored
+
+        self._last_source_state = None
+        return frozenset(accepted).intersection(("max", "min"))
 
     async def async_config_entry_first_refresh(self) -> None:
         """Initialize values and listeners."""
         # Get initial value
         state = self.hass.states.get(self.sensor_entity)
+        self._refresh_source_metadata(state)
         self._sync_source_cumulative_mode(state)
         if state and state.state not in (None, "unknown", "unavailable"):
             current_value = self._get_source_float()
@@ -513,22 +1267,33 @@ class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
                 now = dt_util.now()
                 # Initialize info for all periods
                 for period, data in self.tracked_data.items():
-                    if data["max"] is None or current_value > data["max"]:
-                        data["max"] = current_value
-                    if data["min"] is None or current_value < data["min"]:
-                        data["min"] = current_value
-                    if data.get("last_reset") is None:
-                        data["last_reset"] = self._get_period_start(now, period)
+                    if data.max is None or current_value > data.max:
+                        data.max = current_value
+                    if data.min is None or current_value < data.min:
+                        data.min = current_value
+                    if data.last_reset is None:
+                        data.last_reset = self._get_period_start(now, period)
                     # Delta support: initialize start/end
-                    if data.get("start") is None:
+                    if data.start is None:
                         initial_delta = self._configured_initials.get(period, {}).get("delta")
                         if initial_delta is not None:
-                            data["start"] = current_value - initial_delta
+                            data.start = current_value - initial_delta
                         else:
-                            data["start"] = current_value
-                    if data.get("end") is None:
-                        data["end"] = current_value
-
+                            data.start = current_value
+                    if data.end is None:
+                        data.end = current_value
+
+                if self._rolling is not None:
+                    self._rolling.add(now.timestamp(), current_value)
+                for average in self._averages.values():
+                    average.add(now.timestamp(), current_value)
+                for quantiles in self._quantiles.values():
+                    for quantile in quantiles.values():
+                        if not quantile.count:
+                            quantile.add(current_value)
+                for moments in self._moments.values():
+                    if not moments.count:
+                        moments.add(current_value)
                 self._check_consistency()
             else:
                 _LOGGER.warning("Sensor %s has non-numeric state: %s", self.sensor_entity, state.state)
@@ -546,25 +1311,27 @@ class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
         # setup so that RestoreEntity has already restored state.
 
     @callback
-    def start_listeners(self):
+    def start_listeners(self, source_hub=None):
         """Start state tracking and run startup catch-up.
 
         Must be called AFTER platform setup so that RestoreEntity has
         already restored start/end/last_reset.  Running the watchdog
         before restore causes false resets that wipe delta values.
+
+        With ``source_hub`` (normal setup) the coordinator subscribes to the
+        domain-wide hub, which listens and parses once per source entity;
+        otherwise it listens to the source directly.
         """
         # Startup catch-up: if a period reset was missed while HA/integration
-        # was down, enforce it immediately.
+        # was down, enforce it immediately.  This also computes the first
+        # due time for the shared watchdog, which __init__.py registers
+        # this coordinator with right after (never before restore).
         self._check_watchdog(dt_util.now())
 
-        # Start periodic watchdog (every 1 minute) to catch missed resets.
-        # Must be started here (not in __init__) to avoid false resets
-        # before RestoreEntity has restored state.
-        self._watchdog_unsub = async_track_time_interval(
-            self.hass, self._check_watchdog, WATCHDOG_INTERVAL
-        )
-
         # Listen to sensor changes
+        if source_hub is not None:
+            self._unsub_sensor_state_listener = source_hub.async_subscribe(self)
+            return
         self._unsub_sensor_state_listener = async_track_state_change_event(
             self.hass, [self.sensor_entity], self._handle_sensor_change
         )
@@ -582,6 +1349,7 @@ class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
         current_value = self._get_source_float()
 
         applied = False
+        extremes_applied = []
         for period, initials in self._configured_initials.items():
             data = self.tracked_data.get(period)
             if data is None:
@@ -594,32 +1362,238 @@ class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
             if (
                 initial_max is not None
                 and (period, "max") not in self._restore_accepted
-                and (data["max"] is None or data["max"] < initial_max)
+                and (data.max is None or data.max < initial_max)
             ):
-                data["max"] = initial_max
+                data.max = initial_max
                 applied = True
+                extremes_applied.append(period)
             if (
                 initial_min is not None
                 and (period, "min") not in self._restore_accepted
-                and (data["min"] is None or data["min"] > initial_min)
+                and (data.min is None or data.min > initial_min)
             ):
-                data["min"] = initial_min
+                data.min = initial_min
                 applied = True
+                extremes_applied.append(period)
             if (
                 initial_delta is not None
                 and (period, "delta") not in self._restore_accepted
                 and current_value is not None
             ):
-                data["start"] = current_value - initial_delta
-                data["end"] = current_value
+                data.start = current_value - initial_delta
+                data.end = current_value
                 applied = True
 
         # One-shot: clear so they never interfere again
         self._configured_initials = {}
+        self._last_source_state = None
 
         if applied:
+            for period in extremes_applied:
+                self._propagate_extremes(period)
+            self._publish_changes(refresh_all=True)
+
+    @callback
+    def apply_options(self) -> None:
+        """Apply changed options to the live coordinator without a reload.
+
+        Untouched periods keep their in-memory data and reset timers.
+        Removed periods are dropped with their timers, added periods are
+        seeded from the current source value (plus configured initials) and
+        scheduled, and only an offset change that affects the schedule
+        reschedules every period.  Changes that need the restore sequence
+        (reset_history) still go through a full reload in __init__.py.
+        """
+        old_periods = list(self.periods)
+        old_offset = self.offset
+        old_rolling_window = self.rolling_window
+        # Close the roll-up aggregates while the old base is still valid.
+        self._fold_rollup()
+        self._rollup_targets = ()
+        self._rollup_push_targets = None
+        self._load_options()
+
+        removed = [p for p in old_periods if p not in self.periods]
+        added = [p for p in self.periods if p not in old_periods]
+        for period in removed:
+            for listeners in (self._reset_listeners, self._backup_reset_listeners):
+                unsub = listeners.pop(period, None)
+                if unsub is not None:
+                    unsub()
+            self._next_resets.pop(period, None)
+            self._period_bounds.pop(period, None)
+            self._verified_last_reset.pop(period, None)
+            self._attribute_snapshots.pop(period, None)
+            self._delta_attributes.pop(period, None)
+            self._pending_start_reanchor.discard(period)
+            self._pending_extrema_reanchor.discard(period)
+            self.stored_periods.discard(period)
+            self.tracked_data.pop(period, None)
+
+        current_value = self._get_source_float()
+        now = dt_util.now()
+        for period in added:
+            data = self.tracked_data[period] = self._default_period_data(self._get_period_start(now, period))
+            initials = self._read_configured_initials(period)
+            if current_value is not None:
+                data.max = data.min = data.end = current_value
+                initial_delta = initials["delta"]
+                data.start = current_value - initial_delta if initial_delta is not None else current_value
+            if initials["max"] is not None and (data.max is None or data.max < initials["max"]):
+                data.max = initials["max"]
+            if initials["min"] is not None and (data.min is None or data.min > initials["min"]):
+                data.min = initials["min"]
+
+        self._propagation_targets = self._build_propagation_targets()
+        self._rollup_base = next((p for p in PERIOD_HIERARCHY if p in self.tracked_data), None)
+        self._update_rollup_targets()
+
+        self._sync_averages(now.timestamp(), current_value)
+        self._sync_quantiles(current_value)
+        self._sync_moments(current_value)
+
+        if self.rolling_window != old_rolling_window:
+            # A different window starts over from the current value.
+            self._cancel_rolling_timer()
+            self._rolling = None
+            if self.rolling_window:
+                self._rolling = RollingExtremes(self.rolling_window)
+                self._rolling.add(now.timestamp(), current_value)
+
+        if self.offset != old_offset and self._source_is_cumulative:
+            self._schedule_resets()
+        else:
+            for period in added:
+                reset_time = self._compute_next_reset(now, period)
+                if reset_time:
+                    self._schedule_single_reset(period, reset_time)
+        if added or removed or self.offset != old_offset:
+            self._watchdog_due = None
+            if self.watchdog_listener is not None:
+                self.watchdog_listener()
+
+        if added:
+            # Narrower periods already hold extremes of the new window.
             self._check_consistency()
-            self.async_set_updated_data({})
+        self._last_source_state = None
+        _LOGGER.debug(
+            "Applied options to %s in place (added: %s, removed: %s)",
+            self.config_entry.title, added, removed,
+        )
+        if self.entities_listener is not None:
+            self.entities_listener()
+        self._publish_changes(refresh_all=True)
+
+    @callback
+    def reset_values(self, keys) -> None:
+        """Re-baseline (period, type) pairs on the live coordinator.
+
+        Runtime counterpart of the surgical reset (max_min.reset service): no
+        reload and no restore pass.  Max/min restart from the current source
+        value (the last end value while it is unavailable) and delta from
+        zero.  The period window and its reset metadata are left untouched.
+        """
+        self._apply_manual_values(keys, None)
+
+    @callback
+    def set_values(self, keys, value) -> None:
+        """Set (period, type) pairs to value (max_min.set_value service).
+
+        A delta value keeps the current end and moves start to end - value.
+        """
+        self._apply_manual_values(keys, value)
+
+    def _apply_manual_values(self, keys, value) -> None:
+        """Apply a manual reset (value None) or set, then publish once.
+
+        Broader periods are re-merged with the narrower ones afterwards, so
+        a reset broader extreme never ends up inside a narrower period's
+        current extreme (in roll-up mode that bound is structural).
+        """
+        # Close the roll-up aggregates so their closed part can be rewritten.
+        self._fold_rollup()
+        source_value = self._get_source_float()
+        pending = self._pending_changes
+        for period, type_ in keys:
+            if period == PERIOD_ROLLING:
+                # The window keeps no settable value: a reset forgets the
+                # closed segments, so only the current value remains.
+                if self._rolling is None:
+                    continue
+                if value is not None:
+                    _LOGGER.warning("Cannot set the rolling %s of %s: it follows the source", type_, self.sensor_entity)
+                    continue
+                self._rolling.reset()
+                self._cancel_rolling_timer()
+                pending.update(((PERIOD_ROLLING, TYPE_MAX), (PERIOD_ROLLING, TYPE_MIN)))
+                continue
+            data = self.tracked_data.get(period)
+            if data is None:
+                continue
+            if value is not None:
+                seed = value
+            elif source_value is not None:
+                seed = source_value
+            else:
+                seed = self._compute_reset_seed(period).value
+
+            if type_ == TYPE_AVERAGE:
+                average = self._averages.get(period)
+                if average is None:
+                    continue
+                # The average restarts now (reset) or keeps its weight (set).
+                average.reset(dt_util.now().timestamp(), value)
+                pending.add((period, TYPE_AVERAGE))
+            elif type_ in QUANTILE_TYPES:
+                quantile = self._quantiles.get(period, {}).get(type_)
+                if quantile is None:
+                    continue
+                if value is not None:
+                    _LOGGER.warning("Cannot set the %s %s of %s: it is estimated from readings", period, type_, self.sensor_entity)
+                    continue
+                # Restart the estimate from the current reading, if any (a
+                # fallback seed is not a reading).
+                quantile.reset()
+                if source_value is not None:
+                    quantile.add(source_value)
+                pending.add((period, type_))
+            elif type_ in MOMENT_TYPES:
+                moments = self._moments.get(period)
+                if moments is None:
+                    continue
+                if value is not None:
+                    _LOGGER.warning("Cannot set the %s %s of %s: it is computed from readings", period, type_, self.sensor_entity)
+                    continue
+                # The three types share one accumulator: all restart together,
+                # from the current reading if any.
+                moments.reset()
+                if source_value is not None:
+                    moments.add(source_value)
+                pending.update((period, moment_type) for moment_type in self._moment_types)
+            elif type_ == TYPE_DELTA:
+                if value is None:
+                    data.start = data.end = seed
+                    # A fallback seed is re-anchored on the next fresh reading.
+                    if source_value is None:
+                        self._pending_start_reanchor.add(period)
+                    else:
+                        self._pending_start_reanchor.discard(period)
+                else:
+                    end = data.end if data.end is not None else source_value
+                    if end is None:
+                        _LOGGER.warning("Cannot set %s delta of %s: no end value yet", period, self.sensor_entity)
+                        continue
+                    data.start = end - value
+                    data.end = end
+                pending.update(((period, "start"), (period, "end")))
+            elif type_ in (TYPE_MAX, TYPE_MIN):
+                setattr(data, type_, seed)
+                pending.add((period, type_))
+            _LOGGER.debug("Manual update of %s %s %s: %s", self.sensor_entity, period, type_, seed)
+
+        self._check_consistency()
+        self._last_source_state = None
+        self._publish_changes()
 
     def _handle_offset_deadzone(self, period, data, value, now) -> tuple[bool, bool]:
         """Handle updates that arrive during the cumulative offset dead zone."""
@@ -633,107 +1607,357 @@ class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
         ):
             return False, False
 
-        if data["max"] is not None and value < data["max"]:
+        if data.max is not None and value < data.max:
             _LOGGER.debug("Early reset detected for %s. Triggering reset now.", period)
             self._perform_reset(now, period, reason="early_offset")
             return True, False
 
         changed = False
-        if data["max"] is None or value > data["max"]:
-            data["max"] = value
+        pending = self._pending_changes
+        if data.max is None or value > data.max:
+            data.max = value
+            pending.add((period, "max"))
             changed = True
-        if data["min"] is None or value < data["min"]:
-            data["min"] = value
+        if data.min is None or value < data.min:
+            data.min = value
+            pending.add((period, "min"))
             changed = True
-        if data.get("end") != value:
-            data["end"] = value
+        if data.end != value:
+            data.end = value
+            pending.add((period, "end"))
             changed = True
         return True, changed
 
     def _update_period_normal(self, period, data, value) -> bool:
         """Apply the standard max/min/delta update flow to one period."""
         changed = False
+        pending = self._pending_changes
 
         if period in self._pending_extrema_reanchor:
-            if data.get("max") != value:
-                data["max"] = value
+            if data.max != value:
+                data.max = value
+                pending.add((period, "max"))
                 changed = True
-            if data.get("min") != value:
-                data["min"] = value
+            if data.min != value:
+                data.min = value
+                pending.add((period, "min"))
                 changed = True
             self._pending_extrema_reanchor.discard(period)
         else:
-            if data["max"] is None or value > data["max"]:
-                data["max"] = value
+            if data.max is None or value > data.max:
+                data.max = value
+                pending.add((period, "max"))
                 changed = True
-            if data["min"] is None or value < data["min"]:
-                data["min"] = value
+            if data.min is None or value < data.min:
+                data.min = value
+                pending.add((period, "min"))
                 changed = True
 
         if period in self._pending_start_reanchor:
-            data["start"] = value
-            data["end"] = value
+            data.start = value
+            data.end = value
             self._pending_start_reanchor.discard(period)
+            pending.add((period, "start"))
+            pending.add((period, "end"))
             changed = True
-        elif data.get("start") is None:
+        elif data.start is None:
             initial_delta = self._configured_initials.get(period, {}).get("delta")
             if initial_delta is not None:
-                data["start"] = value - initial_delta
+                data.start = value - initial_delta
             else:
-                data["start"] = value
+                data.start = value
+            pending.add((period, "start"))
             changed = True
 
-        if data.get("end") != value:
-            data["end"] = value
+        if data.end != value:
+            data.end = value
+            pending.add((period, "end"))
             changed = True
 
         return changed
 
+    def _is_repeat_source_state(self, new_state, now) -> bool:
+        """Return True when an event cannot change anything already processed.
+
+        HA fires state_changed for attribute-only updates too.  A repeat of
+        the last raw state string is inert unless the cumulative mode
+        changed, a re-anchor is pending, or a boundary may have been reached.
+        """
+        if new_state is None or self._last_source_state is None:
+            return False
+        if new_state.state != self._last_source_state:
+            return False
+        if self._pending_start_reanchor or self._pending_extrema_reanchor:
+            return False
+        if self._is_cumulative_state(new_state) != self._source_is_cumulative:
+            return False
+        if self._bounds_tz is not dt_util.DEFAULT_TIME_ZONE:
+            return False
+        return now.timestamp() < self._source_state_valid_until
+
+    def _remember_source_state(self, new_state, now) -> None:
+        """Record the processed state string and how long a repeat stays inert."""
+        if new_state is None:
+            self._last_source_state = None
+            return
+
+        timestamp = now.timestamp()
+        offset = self.offset if self.offset > 0 and self._source_is_cumulative else 0
+        valid_until = float("inf")
+        for period in self.periods:
+            if period == PERIOD_ALL_TIME:
+                continue
+            bounds = self._get_period_bounds(now, period)
+            if bounds is None:
+                continue
+            # Entering the offset window before the boundary enables the
+            # early-reset check; leaving it after the boundary makes the
+            # delayed reset due.
+            if offset and timestamp < bounds[0] + offset:
+                valid_until = min(valid_until, bounds[0] + offset)
+            valid_until = min(valid_until, bounds[1] - offset)
+
+        self._last_source_state = new_state.state
+        self._source_state_valid_until = valid_until
+
     @callback
     def _handle_sensor_change(self, event):
-        """Handle sensor state change."""
+        """Handle sensor state change (direct subscription)."""
         new_state = event.data.get("new_state")
+        now = dt_util.now()
+        self._refresh_source_metadata(new_state)
+        if self._is_repeat_source_state(new_state, now):
+            self.events_skipped += 1
+            return
+        self._process_source_state(new_state, parse_source_state(new_state), now)
+
+    @callback
+    def handle_source_update(self, new_state, value, now) -> None:
+        """Handle a source update already parsed by the shared source hub."""
+        self._refresh_source_metadata(new_state)
+        if self._is_repeat_source_state(new_state, now):
+            self.events_skipped += 1
+            return
+        self._process_source_state(new_state, value, now)
+
+    def _process_source_state(self, new_state, value, now) -> None:
+        """Apply one non-repeated source state."""
+        self.events_processed += 1
         self._sync_source_cumulative_mode(new_state)
-        if new_state and new_state.state not in (None, "unknown", "unavailable"):
-            try:
-                # Round to 4 decimals to avoid float precision noise (0.9999999999998)
-                value = round(float(new_state.state), 4)
-                updated = False
-                now = dt_util.now()
+        timestamp = now.timestamp()
+        window_changed = self._rolling is not None and self._update_rolling(value, timestamp)
+        if self._averages:
+            # O(1) per period: close the held value into each integral.
+            for period, average in self._averages.items():
+                average.add(timestamp, value)
+                self._pending_changes.add((period, TYPE_AVERAGE))
+            window_changed = True
+        if value is not None:
+            self._handle_source_value(value, now)
+        if window_changed and self._pending_changes:
+            # Only the rolling window or averages moved (otherwise already published).
+            self._publish_or_defer()
+        self._remember_source_state(new_state, now)
+
+    def _handle_source_value(self, value, now) -> None:
+        """Fold one parsed source reading into every tracked period."""
+        updated = False
+        extremes_changed = []
+        rollup_targets = self._rollup_targets
+        tracked_data = self.tracked_data
 
-                for period in self.periods:
-                    if period not in self.tracked_data:
-                        self.tracked_data[period] = self._default_period_data(
-                            last_reset=self._get_period_start(now, period)
-                        )
-
-                    data = self.tracked_data[period]
-
-                    # 0. Inline period-boundary reset detection
-                    # If a sensor update arrives after the period boundary but before
-                    # the scheduled timer fires, we must reset first so old values
-                    # don't bleed into the new period.  ensure_period_current
-                    # respects cumulative offset.
-                    if period != PERIOD_ALL_TIME:
-                        if self.ensure_period_current(period, now, reason="inline"):
-                            # After reset, data has been re-initialised – refresh ref
-                            data = self.tracked_data[period]
-
-                    handled, changed = self._handle_offset_deadzone(period, data, value, now)
-                    if handled:
-                        if changed:
-                            updated = True
-                        continue
+        for period in self.periods:
+            if period not in tracked_data:
+                tracked_data[period] = self._default_period_data(
+                    last_reset=self._get_period_start(now, period)
+                )
 
-                    if self._update_period_normal(period, data, value):
+            data = tracked_data[period]
+            old_max = data.max
+            old_min = data.min
+
+            # 0. Inline period-boundary reset detection
+            # If a sensor update arrives after the period boundary but before
+            # the scheduled timer fires, we must reset first so old values
+            # don't bleed into the new period.  ensure_period_current
+            # respects cumulative offset.
+            if period != PERIOD_ALL_TIME:
+                if self.ensure_period_current(period, now, reason="inline"):
+                    # After reset, data has been re-initialised – refresh ref
+                    data = tracked_data[period]
+
+            # Percentile sketches take every reading, rolled-up or not.
+            quantiles = self._quantiles.get(period)
+            if quantiles:
+                for type_, quantile in quantiles.items():
+                    old_value = quantile.value
+                    quantile.add(value)
+                    if quantile.value != old_value:
+                        self._pending_changes.add((period, type_))
                         updated = True
+            # Welford update: O(1), shared by the count/mean/std types.
+            moments = self._moments.get(period)
+            if moments is not None:
+                moments.add(value)
+                self._pending_changes.update((period, type_) for type_ in self._moment_types)
+                updated = True
+
+            # Rolled-up periods derive max/min/end from the base; they
+            # only take the raw sample to (re-)anchor start.
+            if (
+                period in rollup_targets
+                and data.start is not None
+                and period not in self._pending_start_reanchor
+                and period not in self._pending_extrema_reanchor
+            ):
+                continue
+
+            handled, changed = self._handle_offset_deadzone(period, data, value, now)
+            if not handled:
+                changed = self._update_period_normal(period, data, value)
+            if changed:
+                updated = True
+                data = tracked_data[period]
+                if data.max != old_max or data.min != old_min:
+                    extremes_changed.append(period)
+
+        if updated:
+            if rollup_targets:
+                self._mark_rollup_changes()
+            for period in extremes_changed:
+                if rollup_targets and period == self._rollup_base:
+                    self._propagate_extremes(period, targets=self._rollup_push_targets)
+                else:
+                    self._propagate_extremes(period)
+            _LOGGER.debug("Sensor updated: %s. Data: %s", value, self.tracked_data)
+            self._publish_or_defer()
+
+    def _sync_averages(self, timestamp=None, value=None) -> None:
+        """Match the average accumulators to the tracked periods and types.
+
+        New accumulators hold value from timestamp (when given).
+        """
+        if TYPE_AVERAGE not in self.types:
+            self._averages.clear()
+            return
+        for period in list(self._averages):
+            if period not in self.tracked_data:
+                del self._averages[period]
+        for period in self.tracked_data:
+            if period not in self._averages:
+                average = self._averages[period] = TimeWeightedAverage()
+                if timestamp is not None:
+                    average.add(timestamp, value)
+
+    def _sync_quantiles(self, value=None) -> None:
+        """Match the percentile sketches to the tracked periods and types.
+
+        New sketches start from value (when given).
+        """
+        types = [type_ for type_ in self.types if type_ in QUANTILE_TYPES]
+        for period in list(self._quantiles):
+            if period not in self.tracked_data or not types:
+                del self._quantiles[period]
+        for period in self.tracked_data if types else ():
+            quantiles = self._quantiles.setdefault(period, {})
+            for type_ in list(quantiles):
+                if type_ not in types:
+                    del quantiles[type_]
+            for type_ in types:
+                if type_ not in quantiles:
+                    quantile = quantiles[type_] = P2Quantile(QUANTILE_TYPES[type_])
+                    if value is not None:
+                        quantile.add(value)
+
+    def _sync_moments(self, value=None) -> None:
+        """Match the count/mean/std accumulators to the tracked periods and types.
+
+        New accumulators start from value (when given).
+        """
+        self._moment_types = tuple(type_ for type_ in MOMENT_TYPES if type_ in self.types)
+        if not self._moment_types:
+            self._moments.clear()
+            return
+        for period in list(self._moments):
+            if period not in self.tracked_data:
+                del self._moments[period]
+        for period in self.tracked_data:
+            if period not in self._moments:
+                moments = self._moments[period] = RunningMoments()
+                if value is not None:
+                    moments.add(value)
+
+    def _update_rolling(self, value, timestamp) -> bool:
+        """Fold a reading (None = unavailable) into the rolling window.
+
+        Marks the rolling fields that moved and returns True if any did.
+        """
+        rolling = self._rolling
+        old_max, old_min = rolling.max, rolling.min
+        rolling.add(timestamp, value)
+        rolling.expire(timestamp)
+        self._arm_rolling_timer()
+        changed = False
+        if rolling.max != old_max:
+            self._pending_changes.add((PERIOD_ROLLING, "max"))
+            changed = True
+        if rolling.min != old_min:
+            self._pending_changes.add((PERIOD_ROLLING, "min"))
+            changed = True
+        return changed
+
+    def _arm_rolling_timer(self) -> None:
+        """Arm the single expiry timer at the next segment expiry instant."""
+        expiry = self._rolling.next_expiry() if self._rolling is not None else None
+        if expiry == self._rolling_timer_at:
+            return
+        self._cancel_rolling_timer()
+        if expiry is None:
+            return
+        self._rolling_timer_at = expiry
+        self._unsub_rolling_timer = async_track_point_in_time(
+            self.hass, self._async_rolling_expire, dt_util.utc_from_timestamp(expiry)
+        )
+
+    def _cancel_rolling_timer(self) -> None:
+        """Cancel the rolling expiry timer, if armed."""
+        if self._unsub_rolling_timer is not None:
+            self._unsub_rolling_timer()
+            self._unsub_rolling_timer = None
+        self._rolling_timer_at = None
 
-                if updated:
-                    self._check_consistency()
-                    _LOGGER.debug("Sensor updated: %s. Data: %s", value, self.tracked_data)
-                    self.async_set_updated_data({})
-            except ValueError:
-                _LOGGER.warning("Invalid sensor value: %s", new_state.state)
+    @callback
+    def _async_rolling_expire(self, now) -> None:
+        """Drop expired segments and publish the new window extremes."""
+        self._unsub_rolling_timer = None
+        self._rolling_timer_at = None
+        if self._rolling is None:
+            return
+        if self._update_rolling(self._rolling.current, now.timestamp()):
+            self._publish_or_defer()
+
+    def _mark_rollup_changes(self) -> None:
+        """Mark rolled-up fields whose live value moved with the base."""
+        base = self._rollup_base
+        pending = self._pending_changes
+        base_max = (base, "max") in pending
+        base_min = (base, "min") in pending
+        # Only Delta entities read a rolled-up period's end.
+        base_end = TYPE_DELTA in self.types and (base, "end") in pending
+        if not (base_max or base_min or base_end):
+            return
+        tracked_data = self.tracked_data
+        base_data = tracked_data[base]
+        for period in self._rollup_targets:
+            data = tracked_data[period]
+            if not self._window_starts_within(base_data.last_reset, data.last_reset):
+                continue
+            if base_max and (data.max is None or base_data.max > data.max):
+                pending.add((period, "max"))
+            if base_min and (data.min is None or base_data.min < data.min):
+                pending.add((period, "min"))
+            if base_end:
+                pending.add((period, "end"))
 
     def _schedule_resets(self):
         """Schedule the next reset for all periods."""
@@ -805,7 +2029,11 @@ class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
         _LOGGER.debug("Handling period reset for %s - %s (source=%s)", self.config_entry.title, period, reason)
 
         try:
-            reset_seed = self._compute_reset_seed(period, now)
+            if self._rollup_targets and (period == self._rollup_base or period in self._rollup_targets):
+                # Close the base sub-period into the broader aggregates (and
+                # make a rolled-up period's end current for the reset seed).
+                self._fold_rollup()
+            reset_seed, seed_is_live = self._compute_reset_seed(period, now)
 
             if period in self.tracked_data:
                 # Log seed provenance when source is unavailable
@@ -831,13 +2059,13 @@ class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
 
                 # Reset max/min to seed — initial values are one-shot
                 # (only applied at entry creation, not on period resets)
-                self.tracked_data[period]["max"] = reset_seed
-                self.tracked_data[period]["min"] = reset_seed
+                self.tracked_data[period].max = reset_seed
+                self.tracked_data[period].min = reset_seed
 
                 # Canonical: last_reset is the period start, not the wall-clock moment
-                self.tracked_data[period]["last_reset"] = self._get_period_start(now, period)
-                self.tracked_data[period]["last_reset_reason"] = reason
-                self.tracked_data[period]["last_reset_triggered_at"] = now
+                self.tracked_data[period].last_reset = self._get_period_start(now, period)
+                self.tracked_data[period].last_reset_reason = reason
+                self.tracked_data[period].last_reset_triggered_at = now
                 # Mark the period for re-anchoring BEFORE start/end assignment
                 # so that if anything below throws, the reanchor is still pending.
                 self._pending_start_reanchor.add(period)
@@ -849,10 +2077,32 @@ class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
                 # reanchor mark ensures the first real sensor update will
                 # overwrite start/end with the truly current value.  This avoids
                 # a race condition when the source also resets at midnight.
-                self.tracked_data[period]["start"] = reset_seed
-                self.tracked_data[period]["end"] = reset_seed
-
-                self.async_set_updated_data({})
+                self.tracked_data[period].start = reset_seed
+                self.tracked_data[period].end = reset_seed
+                self._last_source_state = None
+                # Close out the time-weighted average; the held value carries over.
+                average = self._averages.get(period)
+                if average is not None:
+                    average.reset(now.timestamp())
+                    self._pending_changes.add((period, TYPE_AVERAGE))
+                # Percentiles restart from the live seed, like max/min.  A
+                # fallback seed (source unavailable or stale) is not a
+                # reading: the sketch stays empty until the first fresh one.
+                for type_, quantile in self._quantiles.get(period, {}).items():
+                    quantile.reset()
+                    if seed_is_live:
+                        quantile.add(reset_seed)
+                    self._pending_changes.add((period, type_))
+                # Count/mean/std likewise: a fallback seed is not a reading.
+                moments = self._moments.get(period)
+                if moments is not None:
+                    moments.reset()
+                    if seed_is_live:
+                        moments.add(reset_seed)
+                    self._pending_changes.update((period, type_) for type_ in self._moment_types)
+
+                self._pending_changes.update((period, field) for field in self.tracked_data[period])
+                self._publish_changes()
 
         except Exception as e:
             _LOGGER.exception("Error during reset for %s: %s", period, e)
@@ -873,59 +2123,108 @@ class MaxMinDataUpdateCoordinator(DataUpdateCoordinator):
         self._reset_listeners = {}
         self._backup_reset_listeners = {}
 
-        if self._watchdog_unsub:
-            self._watchdog_unsub()
-            self._watchdog_unsub = None
+        if self._unsub_publish_timer:
+            self._unsub_publish_timer()
+            self._unsub_publish_timer = None
+        self._cancel_rolling_timer()
 
         if self._unsub_sensor_state_listener:
             self._unsub_sensor_state_listener()
             self._unsub_sensor_state_listener = None
 
+    def _build_propagation_targets(self) -> dict[str, tuple[tuple[str, ...], tuple[str, ...]]]:
+        """Precompute, per tracked period, the broader periods it propagates to.
+
+        Built at setup and rebuilt by apply_options(): reset_history cannot
+        change without a reload, so the surgical-reset checks are not
+        repeated on every update.
+        """
+        targets = {}
+        for index, period in enumerate(PERIOD_HIERARCHY):
+            if period not in self.tracked_data:
+                continue
+            broader = [p for p in PERIOD_HIERARCHY[index + 1:] if p in self.tracked_data]
+            targets[period] = (
+                tuple(p for p in broader if not self._should_skip_history(p, "max")),
+                tuple(p for p in broader if not self._should_skip_history(p, "min")),
+            )
+        return targets
+
+    @classmethod
+    def _window_starts_within(cls, narrow_reset, broad_reset) -> bool:
+        """Return True unless the narrower window started before the broader one.
+
+        A week can straddle a month/year boundary: right after the monthly
+        reset, weekly still holds samples from the previous month that must
+        not be pushed into the fresh monthly window.  Unknown resets (None,
+        all-time) never block.
+        """
+        if broad_reset is None or narrow_reset is None:
+            return True
+        if not isinstance(narrow_reset, datetime) or not isinstance(broad_reset, datetime):
+            reference_tz = dt_util.DEFAULT_TIME_ZONE
+            narrow_reset = cls._normalize_last_reset(narrow_reset, reference_tz)
+            broad_reset = cls._normalize_last_reset(broad_reset, reference_tz)
+            if broad_reset is None or narrow_reset is None:
+                return True
+        try:
+            return narrow_reset >= broad_reset
+        except TypeError:
+            return True
+
+    def _propagate_extremes(self, period, push_max=True, push_min=True, targets=None) -> None:
+        """Push one period's max/min outwards to the broader periods.
+
+        Every broader period is updated directly, so no cascading is needed:
+        the result matches a full _check_consistency sweep as long as each
+        period whose extreme changed is pushed.  Broader periods that reset
+        after the narrower window began are skipped.
+        """
+        if targets is None:
+            targets = self._propagation_targets.get(period)
+            if targets is None:
+                return
+        max_targets, min_targets = targets
+        tracked_data = self.tracked_data
+        data = tracked_data[period]
+        pending = self._pending_changes
+
+        n_reset = data.last_reset
+        n_max = data.max if push_max else None
+        if n_max is not None:
+            for broader_p in max_targets:
+                b_data = tracked_data[broader_p]
+                if not self._window_starts_within(n_reset, b_data.last_reset):
+                    continue
+                if b_data.max is None or n_max > b_data.max:
+                    b_data.max = n_max
+                    pending.add((broader_p, "max"))
+
+        n_min = data.min if push_min else None
+        if n_min is not None:
+            for broader_p in min_targets:
+                b_data = tracked_data[broader_p]
+                if not self._window_starts_within(n_reset, b_data.last_reset):
+                    continue
+                if b_data.min is None or n_min < b_data.min:
+                    b_data.min = n_min
+                    pending.add((broader_p, "min"))
+
     def _check_consistency(self):
         """Ensure broader periods encapsulate more extreme values from narrower ones.
         
         This propagates extreme values 'outwards' (e.g. if Daily Min is -5, 
         then Weekly, Monthly, Yearly and All-time must be at least -5).
+
+        Full sweep, used when every period was seeded at once (first
+        refresh).  Single updates call _propagate_extremes for the changed
+        period only.
         
         NOTE: Respects surgical reset - will not propagate to periods in reset_history.
         """
-        # Hierarchy: indices allow relative comparison
-        hierarchy = [
-            PERIOD_DAILY,
-            PERIOD_WEEKLY,
-            PERIOD_MONTHLY,
-            PERIOD_YEARLY,
-            PERIOD_ALL_TIME
-        ]
-        
         # We process from narrowest to broadest to propagate extremes outwards
-        for i in range(len(hierarchy) - 1):
-            narrower_p = hierarchy[i]
-            if narrower_p not in self.tracked_data:
-                continue
-                
-            n_max = self.tracked_data[narrower_p].get("max")
-            n_min = self.tracked_data[narrower_p].get("min")
-            
-            # Compare with all broader periods
-            for j in range(i + 1, len(hierarchy)):
-                broader_p = hierarchy[j]
-                if broader_p not in self.tracked_data:
-                    continue
-                
-                # Skip propagation to periods undergoing surgical reset
-                n_max_propagate = None if self._should_skip_history(broader_p, "max") else n_max
-                n_min_propagate = None if self._should_skip_history(broader_p, "min") else n_min
-                
-                b_data = self.tracked_data[broader_p]
-                
-                if n_max_propagate is not None:
-                    if b_data.get("max") is None or n_max_propagate > b_data["max"]:
-                        b_data["max"] = n_max_propagate
-                        
-                if n_min_propagate is not None:
-                    if b_data.get("min") is None or n_min_propagate < b_data["min"]:
-                        b_data["min"] = n_min_propagate
+        for period in PERIOD_HIERARCHY:
+            self._propagate_extremes(period)
 
         # Initial values are one-shot (applied at entry creation only),
         # so no re-enforcement after consistency propagation.
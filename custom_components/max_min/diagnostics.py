@@ -0,0 +1,40 @@
+"""Diagnostics support for Max Min."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from . import DATA_SOURCE_HUB, DATA_WATCHDOG
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data
+    domain_data = hass.data.get(DOMAIN, {})
+    watchdog = domain_data.get(DATA_WATCHDOG)
+    source_hub = domain_data.get(DATA_SOURCE_HUB)
+
+    return {
+        "entry": {
+            "title": entry.title,
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "source_entity": coordinator.sensor_entity,
+            "source_is_cumulative": coordinator._source_is_cumulative,
+            "source_metadata": coordinator.source_metadata._asdict(),
+            "periods": list(coordinator.periods),
+            "rollup_periods": list(coordinator._rollup_targets),
+            "types": list(coordinator.types),
+            "tracked_data": {period: dict(data) for period, data in coordinator.tracked_data.items()},
+            "watchdog_due": coordinator.watchdog_due,
+            "source_events": coordinator.event_stats,
+        },
+        "watchdog": watchdog.stats if watchdog is not None else None,
+        "source_hub": source_hub.source_stats(coordinator.sensor_entity) if source_hub is not None else None,
+    }
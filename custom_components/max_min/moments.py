@@ -0,0 +1,61 @@
+"""Online count, mean and standard deviation (Welford's algorithm).
+
+Welford's update keeps the count n, the running mean and M2, the sum of
+squared differences from the mean, and folds each reading in O(1)
+without the cancellation errors of a naive sum of squares.  The
+(n, mean, M2) triple is all the state there is, so it is persisted as
+is and the values survive restarts mid-period.
+"""
+
+import math
+
+
+class RunningMoments:
+    """Count, mean and sample standard deviation of the readings."""
+
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self) -> None:
+        """Initialize with no readings."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def reset(self) -> None:
+        """Forget every reading."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: float) -> None:
+        """Fold one reading in."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    @property
+    def std(self) -> float | None:
+        """Return the sample standard deviation (None below two readings)."""
+        if self.count < 2:
+            return None
+        return math.sqrt(max(self.m2, 0.0) / (self.count - 1))
+
+    def as_list(self) -> list[float]:
+        """Return the [n, mean, M2] triple."""
+        return [self.count, self.mean, self.m2]
+
+    @classmethod
+    def from_list(cls, restored) -> "RunningMoments | None":
+        """Rebuild from as_list() output, or None if it is not valid."""
+        try:
+            count, mean, m2 = restored
+            moments = cls()
+            moments.count = int(count)
+            moments.mean = float(mean)
+            moments.m2 = float(m2)
+        except (TypeError, ValueError):
+            return None
+        if moments.count < 0:
+            return None
+        return moments
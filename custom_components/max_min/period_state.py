@@ -0,0 +1,113 @@
+"""Compact per-period state for the Max Min coordinator.
+
+Each ``tracked_data[period]`` is a ``__slots__`` record rather than a
+7-key dict, which matters when several thousand trackers are loaded:
+
+  - the coordinator hot path (``_update_period_normal``, the offset dead
+    zone, propagation) uses plain attribute access (``data.max``);
+  - everything else keeps working through the mapping protocol
+    (``data["max"]``, ``data.get("end")``, ``dict(data)``, ``update``), so
+    restore, ``get_value`` and diagnostics behave exactly as before.
+
+``TrackedData`` converts any mapping assigned to a period into a
+``PeriodState``, so callers may still store plain dicts.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, MutableMapping
+
+PERIOD_FIELDS = (
+    "max",
+    "min",
+    "start",
+    "end",
+    "last_reset",
+    "last_reset_reason",
+    "last_reset_triggered_at",
+)
+_FIELD_SET = frozenset(PERIOD_FIELDS)
+
+
+class PeriodState(MutableMapping):
+    """Tracked values for one period; every field defaults to None."""
+
+    __slots__ = PERIOD_FIELDS
+
+    def __init__(self, last_reset=None, **fields) -> None:
+        """Initialize with None for every field not given."""
+        self.max = None
+        self.min = None
+        self.start = None
+        self.end = None
+        self.last_reset = last_reset
+        self.last_reset_reason = None
+        self.last_reset_triggered_at = None
+        if fields:
+            self.update(fields)
+
+    @classmethod
+    def coerce(cls, value) -> PeriodState:
+        """Return value as a PeriodState (mappings are copied)."""
+        if isinstance(value, cls):
+            return value
+        state = cls()
+        state.update(value)
+        return state
+
+    def __getitem__(self, key):
+        if key not in _FIELD_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value) -> None:
+        if key not in _FIELD_SET:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __delitem__(self, key) -> None:
+        # Fields always exist; deleting one clears it.
+        self[key] = None
+
+    def __iter__(self):
+        return iter(PERIOD_FIELDS)
+
+    def __len__(self) -> int:
+        return len(PERIOD_FIELDS)
+
+    def __contains__(self, key) -> bool:
+        return key in _FIELD_SET
+
+    def get(self, key, default=None):
+        """Return a field value (None when unset, like the old dict)."""
+        if key not in _FIELD_SET:
+            return default
+        return getattr(self, key)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"PeriodState({dict(self.items())!r})"
+
+
+class TrackedData(dict):
+    """``{period: PeriodState}`` that converts assigned mappings."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__()
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, period, state) -> None:
+        super().__setitem__(period, PeriodState.coerce(state))
+
+    def update(self, *args, **kwargs) -> None:
+        for period, state in dict(*args, **kwargs).items():
+            self[period] = state
+
+    def setdefault(self, period, default=None):
+        if period not in self:
+            self[period] = PeriodState() if default is None else default
+        return self[period]
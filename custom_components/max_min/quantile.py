@@ -0,0 +1,121 @@
+"""Streaming quantile estimate with fixed memory (the P² algorithm).
+
+Jain & Chlamtac's P² keeps five markers per quantile: the minimum, the
+maximum, the estimated quantile and two intermediate markers.  Each
+reading moves the marker positions and, when a marker drifts from its
+desired position, adjusts its height with a piecewise-parabolic (or
+linear) prediction.  Memory and time per reading are constant, and the
+state is eleven numbers (see as_list()).
+
+Until five readings are seen the exact quantile of the readings is
+returned (linear interpolation between the sorted values).
+"""
+
+from bisect import insort
+import math
+
+
+class P2Quantile:
+    """Streaming estimate of the ``p`` quantile (0 < p < 1)."""
+
+    __slots__ = ("p", "count", "_heights", "_positions")
+
+    def __init__(self, p: float) -> None:
+        """Initialize an empty estimate of the ``p`` quantile."""
+        self.p = p
+        self.count = 0
+        # Sorted readings until five are seen, then the marker heights.
+        self._heights: list[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+
+    def reset(self) -> None:
+        """Forget every reading."""
+        self.count = 0
+        self._heights = []
+        self._positions = [1, 2, 3, 4, 5]
+
+    def add(self, value: float) -> None:
+        """Fold one reading into the estimate."""
+        self.count += 1
+        heights = self._heights
+        if self.count <= 5:
+            insort(heights, value)
+            return
+
+        positions = self._positions
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+        for index in range(cell + 1, 5):
+            positions[index] += 1
+
+        p = self.p
+        scale = self.count - 1
+        for index, increment in ((1, p / 2), (2, p), (3, (1 + p) / 2)):
+            drift = 1 + scale * increment - positions[index]
+            if (drift >= 1 and positions[index + 1] - positions[index] > 1) or (
+                drift <= -1 and positions[index - 1] - positions[index] < -1
+            ):
+                step = 1 if drift > 0 else -1
+                height = self._parabolic(index, step)
+                if not heights[index - 1] < height < heights[index + 1]:
+                    height = heights[index] + step * (heights[index + step] - heights[index]) / (
+                        positions[index + step] - positions[index]
+                    )
+                heights[index] = height
+                positions[index] += step
+
+    def _parabolic(self, index: int, step: int) -> float:
+        """Return the P² piecewise-parabolic prediction for one marker."""
+        heights, positions = self._heights, self._positions
+        below = positions[index] - positions[index - 1]
+        above = positions[index + 1] - positions[index]
+        return heights[index] + step / (positions[index + 1] - positions[index - 1]) * (
+            (below + step) * (heights[index + 1] - heights[index]) / above
+            + (above - step) * (heights[index] - heights[index - 1]) / below
+        )
+
+    @property
+    def value(self) -> float | None:
+        """Return the current estimate, or None before any reading."""
+        heights = self._heights
+        if self.count > 5:
+            return heights[2]
+        if not heights:
+            return None
+        rank = self.p * (len(heights) - 1)
+        lower = math.floor(rank)
+        upper = min(lower + 1, len(heights) - 1)
+        return heights[lower] + (heights[upper] - heights[lower]) * (rank - lower)
+
+    def as_list(self) -> list[float]:
+        """Return [count, heights..., positions...] (positions once past five readings)."""
+        if self.count > 5:
+            return [self.count, *self._heights, *self._positions]
+        return [self.count, *self._heights]
+
+    @classmethod
+    def from_list(cls, p: float, restored) -> "P2Quantile | None":
+        """Rebuild from as_list() output, or None if it is not valid."""
+        try:
+            count = int(restored[0])
+            values = [float(value) for value in restored[1:]]
+        except (IndexError, TypeError, ValueError):
+            return None
+        if count < 0 or len(values) != (10 if count > 5 else count):
+            return None
+        quantile = cls(p)
+        quantile.count = count
+        if count > 5:
+            quantile._heights = values[:5]
+            quantile._positions = [int(position) for position in values[5:]]
+        else:
+            quantile._heights = sorted(values)
+        return quantile
@@ -0,0 +1,133 @@
+"""Sliding-window max/min ("rolling N hours") with monotonic deques.
+
+The source is treated as a step signal: each reading holds until the next
+one (or until the source becomes unavailable).  A held value becomes a
+closed segment ``(value, end)`` when it is replaced and is pushed into
+two monotonic deques:
+
+  - the max deque keeps decreasing values, the min deque increasing ones;
+    a new segment pops every dominated segment from the back (it ends
+    later and is at least as extreme), so each segment is pushed and
+    popped at most once: amortized O(1) per reading;
+  - segments leave the front once their end is older than the window.
+
+End times are rounded up to ``resolution`` (window / ``MAX_BUCKETS``,
+at least one second), and a segment that ends in the same bucket as the
+back of the deque but is not more extreme is dropped, since both expire
+together.  This bounds each deque to ``MAX_BUCKETS + 1`` entries whatever
+the reading rate; a segment may count for at most one bucket longer than
+the window.  The current (open) value always counts.
+"""
+
+from collections import deque
+import math
+
+# Upper bound on stored segments per deque (24 h window -> 2 min buckets).
+MAX_BUCKETS = 720
+
+
+class RollingExtremes:
+    """Max and min of a step signal over the last ``window`` seconds."""
+
+    __slots__ = ("window", "resolution", "_max", "_min", "_current", "_current_start")
+
+    def __init__(self, window: float) -> None:
+        """Initialize an empty window of ``window`` seconds."""
+        self.window = float(window)
+        self.resolution = max(1.0, self.window / MAX_BUCKETS)
+        # (value, end bucket) of closed segments
+        self._max: deque[tuple[float, int]] = deque()
+        self._min: deque[tuple[float, int]] = deque()
+        self._current: float | None = None
+        self._current_start: float | None = None
+
+    @property
+    def current(self) -> float | None:
+        """Return the value currently held (None while unavailable)."""
+        return self._current
+
+    @property
+    def max(self) -> float | None:
+        """Return the window maximum, or None when nothing is in it."""
+        values = [v for v in (self._current, self._max[0][0] if self._max else None) if v is not None]
+        return max(values) if values else None
+
+    @property
+    def min(self) -> float | None:
+        """Return the window minimum, or None when nothing is in it."""
+        values = [v for v in (self._current, self._min[0][0] if self._min else None) if v is not None]
+        return min(values) if values else None
+
+    def add(self, timestamp: float, value: float | None) -> None:
+        """Start a new held value at ``timestamp`` (None = source unavailable)."""
+        if value == self._current:
+            return
+        if self._current is not None:
+            self._close(self._current, timestamp)
+        self._current = value
+        self._current_start = timestamp if value is not None else None
+
+    def _close(self, value: float, end: float) -> None:
+        """Push a closed segment into both deques."""
+        bucket = math.ceil(end / self.resolution)
+        max_deque = self._max
+        while max_deque and max_deque[-1][0] <= value:
+            max_deque.pop()
+        if not max_deque or max_deque[-1][1] != bucket:
+            max_deque.append((value, bucket))
+        min_deque = self._min
+        while min_deque and min_deque[-1][0] >= value:
+            min_deque.pop()
+        if not min_deque or min_deque[-1][1] != bucket:
+            min_deque.append((value, bucket))
+
+    def expire(self, now: float) -> None:
+        """Drop segments that ended before the window started."""
+        cutoff = now - self.window
+        resolution = self.resolution
+        for segments in (self._max, self._min):
+            while segments and segments[0][1] * resolution <= cutoff:
+                segments.popleft()
+
+    def next_expiry(self) -> float | None:
+        """Return the epoch at which the oldest stored segment expires."""
+        fronts = [segments[0][1] for segments in (self._max, self._min) if segments]
+        if not fronts:
+            return None
+        return min(fronts) * self.resolution + self.window
+
+    def reset(self) -> None:
+        """Forget the closed segments; the current value stays."""
+        self._max.clear()
+        self._min.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored segments (both deques)."""
+        return len(self._max) + len(self._min)
+
+    def as_dict(self) -> dict:
+        """Return a compact, JSON-serialisable representation."""
+        return {
+            "window": self.window,
+            "current": self._current,
+            "current_start": self._current_start,
+            "max": [list(segment) for segment in self._max],
+            "min": [list(segment) for segment in self._min],
+        }
+
+    @classmethod
+    def from_dict(cls, restored, window: float) -> "RollingExtremes | None":
+        """Rebuild from as_dict() output, or None if invalid or for another window."""
+        try:
+            if float(restored["window"]) != float(window):
+                return None
+            rolling = cls(window)
+            current = restored.get("current")
+            rolling._current = float(current) if current is not None else None
+            start = restored.get("current_start")
+            rolling._current_start = float(start) if start is not None and current is not None else None
+            for key, segments in (("max", rolling._max), ("min", rolling._min)):
+                segments.extend((float(value), int(bucket)) for value, bucket in restored[key][-(MAX_BUCKETS + 1):])
+        except (KeyError, TypeError, ValueError):
+            return None
+        return rolling
@@ -1,19 +1,32 @@
 """Sensor platform for Max Min integration."""
 
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+import time
+from typing import Any
+
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.restore_state import ExtraStoredData, RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from .coordinator import MaxMinDataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+from .coordinator import PERIOD_HIERARCHY, MaxMinDataUpdateCoordinator
 from .const import (
     CONF_DEVICE_ID,
+    CONF_ENTITY_MODE,
     CONF_PERIODS,
+    CONF_ROLLING_WINDOW,
     CONF_SENSOR_ENTITY,
     CONF_TYPES,
+    ENTITY_MODE_SUMMARY,
+    SUMMARY_KEY,
+    PERIOD_ROLLING,
     PERIOD_DAILY,
     PERIOD_MONTHLY,
     PERIOD_WEEKLY,
@@ -22,9 +35,129 @@ from .const import (
     TYPE_MAX,
     TYPE_MIN,
     TYPE_DELTA,
+    TYPE_AVERAGE,
+    TYPE_P5,
+    TYPE_P50,
+    TYPE_P95,
+    TYPE_COUNT,
+    TYPE_MEAN,
+    TYPE_STD,
+)
+
+
+# Coordinator fields rendered by every sensor as reset diagnostics.
+_RESET_FIELDS = frozenset({"last_reset", "last_reset_reason", "last_reset_triggered_at"})
+
+# Bookkeeping attributes: visible live and kept in restore data, but not
+# written to the recorder.  end_value changes on nearly every update, which
+# would otherwise create a new state_attributes row per state write.
+_UNRECORDED_ATTRIBUTES = frozenset(
+    {
+        "config_entry_id",
+        "last_reset",
+        "last_reset_reason",
+        "last_reset_triggered_at",
+        "start_value",
+        "end_value",
+    }
 )
 
 
+@dataclass
+class MaxMinExtraStoredData(ExtraStoredData):
+    """Typed period record saved with each sensor's restore state."""
+
+    max: float | None
+    min: float | None
+    start: float | None
+    end: float | None
+    last_reset: float | None  # epoch seconds
+    pending_start_reanchor: bool = False
+    pending_extrema_reanchor: bool = False
+    average: list[float] | None = None  # [integral, duration]
+    quantiles: dict[str, list[float]] | None = None  # {type: sketch state}
+    moments: list[float] | None = None  # Welford [n, mean, M2]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the record."""
+        record = asdict(self)
+        # Only entries tracking the average / percentile / moment types carry them.
+        for key in ("average", "quantiles", "moments"):
+            if record[key] is None:
+                del record[key]
+        return record
+
+    @classmethod
+    def from_dict(cls, restored: dict[str, Any]) -> MaxMinExtraStoredData | None:
+        """Initialize from a dict, or return None if it is not a valid record."""
+        try:
+            values = {}
+            for key in ("max", "min", "start", "end", "last_reset"):
+                value = restored[key]
+                values[key] = float(value) if value is not None else None
+            average = restored.get("average")
+            if average is not None:
+                integral, duration = average
+                average = [float(integral), float(duration)]
+            quantiles = restored.get("quantiles")
+            if quantiles is not None:
+                quantiles = {
+                    str(type_): [float(value) for value in state] for type_, state in quantiles.items()
+                }
+            moments = restored.get("moments")
+            if moments is not None:
+                count, mean, m2 = moments
+                moments = [int(count), float(mean), float(m2)]
+            return cls(
+                **values,
+                pending_start_reanchor=bool(restored.get("pending_start_reanchor", False)),
+                pending_extrema_reanchor=bool(restored.get("pending_extrema_reanchor", False)),
+                average=average,
+                quantiles=quantiles,
+                moments=moments,
+            )
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return None
+
+
+@dataclass
+class MaxMinSummaryStoredData(ExtraStoredData):
+    """Every period's record, saved with the restore state of a summary sensor."""
+
+    records: dict[str, dict[str, Any]]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the records."""
+        return {"records": self.records}
+
+    @classmethod
+    def from_dict(cls, restored: dict[str, Any]) -> MaxMinSummaryStoredData | None:
+        """Initialize from a dict, or return None if it is not valid."""
+        records = restored.get("records")
+        if not isinstance(records, dict):
+            return None
+        return cls(records)
+
+
+@dataclass
+class MaxMinRollingStoredData(ExtraStoredData):
+    """Rolling window segments, saved with the rolling sensors' restore state."""
+
+    state: dict[str, Any]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the window."""
+        return {"state": self.state}
+
+    @classmethod
+    def from_dict(cls, restored: dict[str, Any]) -> MaxMinRollingStoredData | None:
+        """Initialize from a dict, or return None if it is not valid."""
+        state = restored.get("state")
+        if not isinstance(state, dict):
+            return None
+        return cls(state)
+
+
 def _as_float(value):
     """Convert value to float accepting comma decimal separator."""
     if value is None:
@@ -41,53 +174,11 @@ async def async_setup_entry(
 ) -> None:
     """Set up the sensor platform."""
     coordinator = config_entry.runtime_data
-    types = config_entry.options.get(CONF_TYPES, config_entry.data.get(CONF_TYPES, [TYPE_MAX, TYPE_MIN]))
-    periods = config_entry.options.get(CONF_PERIODS, config_entry.data.get(CONF_PERIODS, [PERIOD_DAILY]))
-    # Fallback to verify single list
-    if isinstance(periods, str):
-        periods = [periods]
-
-    # Clean up device association if device is removed
-    device_id = config_entry.options.get(CONF_DEVICE_ID, config_entry.data.get(CONF_DEVICE_ID))
-    if not device_id:
-        # Unlink entities from device
-        ent_reg = er.async_get(hass)
-        entity_entries = er.async_entries_for_config_entry(ent_reg, config_entry.entry_id)
-        for entity_entry in entity_entries:
-            if entity_entry.device_id:
-                 ent_reg.async_update_entity(entity_entry.entity_id, device_id=None)
-        
-        # Unlink config entry from device
-        dev_reg = dr.async_get(hass)
-        devices_to_unlink = [
-            dev.id for dev in dev_reg.devices.values() 
-            if config_entry.entry_id in dev.config_entries
-        ]
-        for dev_id in devices_to_unlink:
-            dev_reg.async_update_device(dev_id, remove_config_entry_id=config_entry.entry_id)
-
-    # Identify and remove stale entities
-    expected_unique_ids = set()
-    for period in periods:
-        if TYPE_MAX in types:
-            expected_unique_ids.add(f"{config_entry.entry_id}_{period}_max")
-        if TYPE_MIN in types:
-            expected_unique_ids.add(f"{config_entry.entry_id}_{period}_min")
-        if TYPE_DELTA in types:
-            expected_unique_ids.add(f"{config_entry.entry_id}_{period}_delta")
-
     ent_reg = er.async_get(hass)
-    entity_entries = er.async_entries_for_config_entry(ent_reg, config_entry.entry_id)
-    for entity_entry in entity_entries:
-        if entity_entry.unique_id not in expected_unique_ids:
-            ent_reg.async_remove(entity_entry.entity_id)
-
-    entities = []
     source_entity = config_entry.data[CONF_SENSOR_ENTITY]
     sensor_name = source_entity
 
     # Try to get valid name from registry or state
-    ent_reg = er.async_get(hass)
     entry = ent_reg.async_get(source_entity)
     if entry and (entry.name or entry.original_name):
         sensor_name = entry.name or entry.original_name
@@ -96,24 +187,92 @@ async def async_setup_entry(
         if sensor_state and sensor_state.attributes.get("friendly_name"):
             sensor_name = sensor_state.attributes.get("friendly_name")
 
-    period_labels = {
-        PERIOD_DAILY: "Daily",
-        PERIOD_WEEKLY: "Weekly",
-        PERIOD_MONTHLY: "Monthly",
-        PERIOD_YEARLY: "Yearly",
-        PERIOD_ALL_TIME: "All time",
-    }
-    
-    for period in periods:
-        period_label = period_labels.get(period, period)
-        if TYPE_MAX in types:
-            entities.append(MaxSensor(coordinator, config_entry, f"{sensor_name} {period_label} (Max)", period))
-        if TYPE_MIN in types:
-            entities.append(MinSensor(coordinator, config_entry, f"{sensor_name} {period_label} (Min)", period))
-        if TYPE_DELTA in types:
-            entities.append(DeltaSensor(coordinator, config_entry, f"{sensor_name} {period_label} (Delta)", period))
-
-    async_add_entities(entities)
+    # {unique_id: entity} added by this platform.
+    entities = {}
+
+    @callback
+    def _async_sync_entities(relink_device: bool = True) -> None:
+        """Match entities and the device link to the current options."""
+        types = config_entry.options.get(CONF_TYPES, config_entry.data.get(CONF_TYPES, [TYPE_MAX, TYPE_MIN]))
+        periods = config_entry.options.get(CONF_PERIODS, config_entry.data.get(CONF_PERIODS, [PERIOD_DAILY]))
+        # Fallback to verify single list
+        if isinstance(periods, str):
+            periods = [periods]
+
+        # Identify stale entities
+        expected = {}
+        if config_entry.options.get(CONF_ENTITY_MODE, config_entry.data.get(CONF_ENTITY_MODE)) == ENTITY_MODE_SUMMARY:
+            # One entity for the whole entry; its state follows the narrowest period.
+            narrowest = next((p for p in PERIOD_HIERARCHY if p in periods), periods[0])
+            expected[f"{config_entry.entry_id}_{SummarySensor._value_key}"] = (
+                SummarySensor, f"{sensor_name} Summary", narrowest
+            )
+        else:
+            for period in periods:
+                period_label = _PERIOD_LABELS.get(period, period)
+                for type_, sensor_cls, label in _SENSOR_TYPES:
+                    if type_ in types:
+                        expected[f"{config_entry.entry_id}_{period}_{type_}"] = (
+                            sensor_cls, f"{sensor_name} {period_label} ({label})", period
+                        )
+            rolling_window = config_entry.options.get(CONF_ROLLING_WINDOW, config_entry.data.get(CONF_ROLLING_WINDOW, 0))
+            if rolling_window:
+                hours = f"{float(rolling_window):g}"
+                for type_, sensor_cls, label in _ROLLING_SENSOR_TYPES:
+                    if type_ in types:
+                        expected[f"{config_entry.entry_id}_{PERIOD_ROLLING}_{type_}"] = (
+                            sensor_cls, f"{sensor_name} Rolling {hours} h ({label})", PERIOD_ROLLING
+                        )
+
+        # One pass over this entry's entities: remove stale ones and, if the
+        # device link changed, move the rest to the configured device.  On
+        # the first setup a configured device is linked through device_info.
+        device_id = config_entry.options.get(CONF_DEVICE_ID, config_entry.data.get(CONF_DEVICE_ID))
+        dev_reg = dr.async_get(hass)
+        if device_id and relink_device and dev_reg.async_get(device_id) is None:
+            device_id = None
+        for entity_entry in er.async_entries_for_config_entry(ent_reg, config_entry.entry_id):
+            if entity_entry.unique_id not in expected:
+                # Removing the registry entry also removes a live entity.
+                entities.pop(entity_entry.unique_id, None)
+                ent_reg.async_remove(entity_entry.entity_id)
+            elif entity_entry.device_id != device_id and (relink_device or not device_id):
+                ent_reg.async_update_entity(entity_entry.entity_id, device_id=device_id)
+
+        # Unlink config entry from other devices (indexed lookup, not a
+        # registry scan).  Setup with a configured device leaves the device
+        # registry alone; only a relink after an options change moves it.
+        if relink_device or not device_id:
+            for device in dr.async_entries_for_config_entry(dev_reg, config_entry.entry_id):
+                if device.id != device_id:
+                    dev_reg.async_update_device(device.id, remove_config_entry_id=config_entry.entry_id)
+        if device_id and relink_device:
+            dev_reg.async_update_device(device_id, add_config_entry_id=config_entry.entry_id)
+
+        new_entities = []
+        for unique_id, (sensor_cls, name, period) in expected.items():
+            if unique_id in entities:
+                # A summary sensor follows the narrowest configured period.
+                entities[unique_id].period = period
+                if entities[unique_id].name != name:
+                    # The rolling sensors' name carries the window length.
+                    entities[unique_id]._attr_name = name
+                    entities[unique_id].async_write_ha_state()
+                continue
+            entities[unique_id] = sensor_cls(coordinator, config_entry, name, period)
+            new_entities.append(entities[unique_id])
+        if new_entities:
+            async_add_entities(new_entities)
+
+    _async_sync_entities(relink_device=False)
+    # Options applied in place (apply_options) re-sync entities and device.
+    coordinator.entities_listener = _async_sync_entities
+
+    @callback
+    def _async_detach() -> None:
+        coordinator.entities_listener = None
+
+    config_entry.async_on_unload(_async_detach)
 
 
 # ---------------------------------------------------------------------------
@@ -124,6 +283,13 @@ class _BaseMaxMinSensor(CoordinatorEntity, SensorEntity, RestoreEntity):
     """Base class with shared properties for Max/Min/Delta sensors."""
 
     _value_key: str  # Subclasses set this to "max", "min", or override native_value
+    _unrecorded_attributes = _UNRECORDED_ATTRIBUTES
+    # Coordinator fields whose change requires a state write for this entity.
+    # Max/Min do not render end, so end-only updates (the common case) do
+    # not rewrite them.
+    _tracked_fields: frozenset[str]
+    # Fields of the stored period record this entity restores.
+    _restore_fields: tuple[str, ...]
 
     def __init__(self, coordinator: MaxMinDataUpdateCoordinator, config_entry: ConfigEntry, name: str, period: str) -> None:
         """Initialize the sensor."""
@@ -136,18 +302,102 @@ class _BaseMaxMinSensor(CoordinatorEntity, SensorEntity, RestoreEntity):
         self._attr_native_unit_of_measurement = None
         self._attr_device_class = None
         self._attr_state_class = None
+        # Deadband reference: last values written by a coordinator update.
+        self._published_values = None
+        self._published_at = 0.0
+        self._deadband_unsub = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when a field rendered by this entity changed.
+
+        With a deadband configured, value-only changes smaller than the
+        band are held back until the value moves far enough or the
+        deadband max age elapses.  Resets and full refreshes always write.
+        """
+        changed = self.coordinator.changed_keys
+        if changed is not None:
+            if not self._is_changed(changed):
+                return
+            if self._within_deadband(changed):
+                self._schedule_deadband_flush()
+                return
+        self._write_published_state()
+
+    def _is_changed(self, changed) -> bool:
+        """Return True when one of this entity's (period, field) keys moved."""
+        return any((self.period, field) in changed for field in self._tracked_fields)
+
+    def _deadband_values(self) -> tuple:
+        """Return the values the deadband compares (the state by default)."""
+        return (self.native_value,)
+
+    def _within_deadband(self, changed) -> bool:
+        """Return True when every new value may be held back."""
+        coordinator = self.coordinator
+        if not (coordinator.deadband or coordinator.deadband_relative):
+            return False
+        if any((self.period, field) in changed for field in _RESET_FIELDS):
+            return False
+        published_values = self._published_values
+        if published_values is None:
+            return False
+        values = self._deadband_values()
+        if len(values) != len(published_values):
+            return False
+        max_age = coordinator.deadband_max_age
+        if max_age and time.monotonic() - self._published_at >= max_age:
+            return False
+        for value, published in zip(values, published_values):
+            if value is None or published is None:
+                if value is not published:
+                    return False
+                continue
+            band = max(coordinator.deadband, abs(published) * coordinator.deadband_relative / 100)
+            if abs(value - published) >= band:
+                return False
+        return True
+
+    def _schedule_deadband_flush(self) -> None:
+        """Write a held-back value once the deadband max age elapses."""
+        max_age = self.coordinator.deadband_max_age
+        if not max_age or self._deadband_unsub is not None or self.hass is None:
+            return
+        delay = max(0.0, self._published_at + max_age - time.monotonic())
+        self._deadband_unsub = async_call_later(self.hass, delay, self._async_deadband_flush)
+
+    @callback
+    def _async_deadband_flush(self, _now) -> None:
+        """Publish the value held back by the deadband."""
+        self._deadband_unsub = None
+        if self._deadband_values() != self._published_values:
+            self._write_published_state()
+
+    @callback
+    def _async_cancel_deadband_flush(self) -> None:
+        """Drop a pending deadband write."""
+        if self._deadband_unsub is not None:
+            self._deadband_unsub()
+            self._deadband_unsub = None
+
+    @callback
+    def _write_published_state(self) -> None:
+        """Write state and remember it as the deadband reference."""
+        self._async_cancel_deadband_flush()
+        super()._handle_coordinator_update()
+        self._published_values = self._deadband_values()
+        self._published_at = time.monotonic()
 
     # -- Source-sensor mirrored properties ----------------------------------
 
     @property
     def native_unit_of_measurement(self):
         """Return the unit of measurement mirrored from the source sensor."""
-        if self.coordinator.hass:
-            state = self.coordinator.hass.states.get(self._source_entity)
-            # Only update if source is available and has a unit.
-            # If source is unavailable (e.g. startup), keep the restored/last known unit.
-            if state and state.state not in (None, "unknown", "unavailable") and "unit_of_measurement" in state.attributes:
-                self._attr_native_unit_of_measurement = state.attributes.get("unit_of_measurement")
+        # The coordinator keeps the last unit seen while the source was
+        # available; until then, keep the restored/last known unit.
+        unit = self.coordinator.source_metadata.unit
+        if unit is not None:
+            self._attr_native_unit_of_measurement = unit
         return self._attr_native_unit_of_measurement
 
     @property
@@ -157,13 +407,11 @@ class _BaseMaxMinSensor(CoordinatorEntity, SensorEntity, RestoreEntity):
         We avoid mirroring classes that enforce state_class: total/total_increasing
         because our sensors are all snapshots/measurements of periods.
         """
-        if self.coordinator.hass:
-            state = self.coordinator.hass.states.get(self._source_entity)
-            if state and "device_class" in state.attributes:
-                dev_cls = state.attributes.get("device_class")
-                if dev_cls in ("energy", "gas", "water", "monetary", "data_size", "data_rate"):
-                    return None
-                return dev_cls
+        dev_cls = self.coordinator.source_metadata.device_class
+        if dev_cls is not None:
+            if dev_cls in ("energy", "gas", "water", "monetary", "data_size", "data_rate"):
+                return None
+            return dev_cls
         return self._attr_device_class
 
     @property
@@ -188,24 +436,14 @@ class _BaseMaxMinSensor(CoordinatorEntity, SensorEntity, RestoreEntity):
     @property
     def extra_state_attributes(self):
         """Return the state attributes including last_reset and config_entry_id."""
-        attrs = {"config_entry_id": self._config_entry.entry_id}
-        last_reset = self.coordinator.get_value(self.period, "last_reset")
-        if last_reset:
-            attrs["last_reset"] = last_reset.isoformat()
-        end = self.coordinator.get_value(self.period, "end")
-        if end is not None:
-            attrs["end_value"] = end
-        last_reset_reason = self.coordinator.get_value(self.period, "last_reset_reason")
-        if last_reset_reason:
-            attrs["last_reset_reason"] = last_reset_reason
-        last_reset_triggered_at = self.coordinator.get_value(self.period, "last_reset_triggered_at")
-        if last_reset_triggered_at and hasattr(last_reset_triggered_at, "isoformat"):
-            attrs["last_reset_triggered_at"] = last_reset_triggered_at.isoformat()
-        return attrs
+        # Shared, read-only snapshot rebuilt by the coordinator only when
+        # reset metadata or start/end change.
+        return self.coordinator.get_attribute_snapshot(self.period).attributes
 
     async def async_added_to_hass(self) -> None:
         """Restore previous state on startup."""
         await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_deadband_flush)
         last_state = await self.async_get_last_state()
         if not last_state:
             return
@@ -216,10 +454,40 @@ class _BaseMaxMinSensor(CoordinatorEntity, SensorEntity, RestoreEntity):
 
         self._attr_native_unit_of_measurement = last_state.attributes.get("unit_of_measurement")
         self._attr_device_class = last_state.attributes.get("device_class")
-        self._restore_sensor_data(last_state)
+        await self._async_restore_records(last_state)
+
+    async def _async_restore_records(self, last_state) -> None:
+        """Restore this entity's period record into the coordinator."""
+        if self.period in self.coordinator.stored_periods:
+            # Already restored from the shared store (fresher than this state).
+            return
+
+        extra_data = await self.async_get_last_extra_data()
+        record = MaxMinExtraStoredData.from_dict(extra_data.as_dict()) if extra_data else None
+        if record is not None and any(getattr(record, field) is not None for field in self._restore_fields):
+            self._restore_record(record)
+        else:
+            # States saved before restore data existed carry it in attributes.
+            self._restore_sensor_data(last_state)
+
+    @property
+    def extra_restore_state_data(self) -> MaxMinExtraStoredData:
+        """Return the period record to persist with the restore state."""
+        return MaxMinExtraStoredData(**self.coordinator.get_restore_record(self.period))
+
+    def _restore_record(self, record: MaxMinExtraStoredData, period: str | None = None) -> None:
+        """Restore this entity's fields from a stored period record."""
+        last_reset = dt_util.utc_from_timestamp(record.last_reset) if record.last_reset is not None else None
+        self.coordinator.restore_period_record(
+            period or self.period,
+            {field: getattr(record, field) for field in self._restore_fields},
+            last_reset,
+            pending_start_reanchor=record.pending_start_reanchor,
+            pending_extrema_reanchor=record.pending_extrema_reanchor,
+        )
 
     def _restore_sensor_data(self, last_state) -> None:
-        """Restore type-specific data from a previous state."""
+        """Restore type-specific data from a previous state's attributes."""
         last_reset = last_state.attributes.get("last_reset")
         end = last_state.attributes.get("end_value")
         if end is not None:
@@ -244,6 +512,8 @@ class MaxSensor(_BaseMaxMinSensor):
     """Representation of a Max sensor."""
 
     _value_key = "max"
+    _tracked_fields = _RESET_FIELDS | {"max"}
+    _restore_fields = ("max", "end")
 
     @property
     def native_value(self):
@@ -255,6 +525,8 @@ class MinSensor(_BaseMaxMinSensor):
     """Representation of a Min sensor."""
 
     _value_key = "min"
+    _tracked_fields = _RESET_FIELDS | {"min"}
+    _restore_fields = ("min", "end")
 
     @property
     def native_value(self):
@@ -266,6 +538,8 @@ class DeltaSensor(_BaseMaxMinSensor):
     """Representation of a Delta sensor (end - start)."""
 
     _value_key = "delta"
+    _tracked_fields = _RESET_FIELDS | {"start", "end"}
+    _restore_fields = ("start", "end")
 
     def __init__(self, coordinator, config_entry, name, period):
         """Initialize the delta sensor."""
@@ -281,7 +555,7 @@ class DeltaSensor(_BaseMaxMinSensor):
                 pass
 
     def _restore_sensor_data(self, last_state) -> None:
-        """Restore delta start/end values from a previous state."""
+        """Restore delta start/end values from a previous state's attributes."""
         start = last_state.attributes.get("start_value")
         end = last_state.attributes.get("end_value")
         last_reset = last_state.attributes.get("last_reset")
@@ -322,14 +596,7 @@ class DeltaSensor(_BaseMaxMinSensor):
     @property
     def extra_state_attributes(self):
         """Return delta-specific attributes (start, end, last_reset)."""
-        attrs = super().extra_state_attributes
-        start = self.coordinator.get_value(self.period, "start")
-        end = self.coordinator.get_value(self.period, "end")
-        if start is not None:
-            attrs["start_value"] = start
-        if end is not None:
-            attrs["end_value"] = end
-        return attrs
+        return self.coordinator.get_delta_attributes(self.period)
 
     @property
     def native_value(self):
@@ -342,3 +609,256 @@ class DeltaSensor(_BaseMaxMinSensor):
         if self._initial_delta is not None:
             return self._initial_delta
         return None
+
+
+class AverageSensor(_BaseMaxMinSensor):
+    """Representation of a time-weighted Average sensor."""
+
+    _value_key = "average"
+    _tracked_fields = _RESET_FIELDS | {"average"}
+    _restore_fields = ("average",)
+
+    @property
+    def native_value(self):
+        """Return the time-weighted average since the period started."""
+        return self.coordinator.get_value(self.period, self._value_key)
+
+    def _restore_sensor_data(self, last_state) -> None:
+        """The average cannot be rebuilt from a state without restore data."""
+
+
+class _QuantileSensor(_BaseMaxMinSensor):
+    """Base class for the streaming percentile sensors."""
+
+    _restore_fields = ("quantiles",)
+
+    @property
+    def native_value(self):
+        """Return the estimated percentile of the period's readings."""
+        return self.coordinator.get_value(self.period, self._value_key)
+
+    def _restore_sensor_data(self, last_state) -> None:
+        """A percentile sketch cannot be rebuilt from a state without restore data."""
+
+
+class P5Sensor(_QuantileSensor):
+    """Representation of a 5th percentile sensor."""
+
+    _value_key = TYPE_P5
+    _tracked_fields = _RESET_FIELDS | {TYPE_P5}
+
+
+class P50Sensor(_QuantileSensor):
+    """Representation of a median (50th percentile) sensor."""
+
+    _value_key = TYPE_P50
+    _tracked_fields = _RESET_FIELDS | {TYPE_P50}
+
+
+class P95Sensor(_QuantileSensor):
+    """Representation of a 95th percentile sensor."""
+
+    _value_key = TYPE_P95
+    _tracked_fields = _RESET_FIELDS | {TYPE_P95}
+
+
+class _MomentSensor(_BaseMaxMinSensor):
+    """Base class for the count / mean / standard deviation sensors."""
+
+    _restore_fields = ("moments",)
+
+    @property
+    def native_value(self):
+        """Return the value computed from the period's readings."""
+        return self.coordinator.get_value(self.period, self._value_key)
+
+    def _restore_sensor_data(self, last_state) -> None:
+        """The (n, mean, M2) triple cannot be rebuilt from a state without restore data."""
+
+
+class CountSensor(_MomentSensor):
+    """Representation of a reading Count sensor."""
+
+    _value_key = TYPE_COUNT
+    _tracked_fields = _RESET_FIELDS | {TYPE_COUNT}
+
+    @property
+    def native_unit_of_measurement(self):
+        """Return None: a count of readings has no unit."""
+        return None
+
+    @property
+    def device_class(self):
+        """Return None: a count of readings is not a source measurement."""
+        return None
+
+
+class MeanSensor(_MomentSensor):
+    """Representation of an arithmetic Mean sensor."""
+
+    _value_key = TYPE_MEAN
+    _tracked_fields = _RESET_FIELDS | {TYPE_MEAN}
+
+
+class StdSensor(_MomentSensor):
+    """Representation of a standard deviation sensor."""
+
+    _value_key = TYPE_STD
+    _tracked_fields = _RESET_FIELDS | {TYPE_STD}
+
+    @property
+    def device_class(self):
+        """Return None: unit conversion with an offset (e.g. °C/°F) would be wrong for a spread."""
+        return None
+
+
+class SummarySensor(_BaseMaxMinSensor):
+    """One sensor for a whole entry: every period/type value as an attribute.
+
+    The state is the narrowest period's value of the first configured type
+    (max, min, delta, average, percentiles, count, mean, std).  It replaces
+    up to 50 per-period entities, their registry entries, restore records
+    and state writes.
+    """
+
+    _value_key = SUMMARY_KEY
+    _restore_fields = ("max", "min", "start", "end", "average", "quantiles", "moments")
+
+    def __init__(self, coordinator, config_entry, name, period):
+        """Initialize the summary sensor."""
+        super().__init__(coordinator, config_entry, name, period)
+        self._attr_unique_id = f"{config_entry.entry_id}_{self._value_key}"
+
+    def _is_changed(self, changed) -> bool:
+        """Return True when any key moved: the summary renders them all."""
+        return bool(changed)
+
+    def _type_value(self, period, type_):
+        """Return one period/type value as its own sensor would show it."""
+        if type_ == TYPE_DELTA:
+            start = self.coordinator.get_value(period, "start")
+            end = self.coordinator.get_value(period, "end")
+            return end - start if start is not None and end is not None else None
+        return self.coordinator.get_value(period, type_)
+
+    def _rendered_values(self):
+        """Yield (attribute, value) for every period/type value shown."""
+        types = self.coordinator.types
+        for period in self.coordinator.periods:
+            for type_, _cls, _label in _SENSOR_TYPES:
+                if type_ in types:
+                    yield f"{period}_{type_}", self._type_value(period, type_)
+        if self.coordinator.rolling_window:
+            for type_ in (TYPE_MAX, TYPE_MIN):
+                if type_ in types:
+                    yield f"{PERIOD_ROLLING}_{type_}", self.coordinator.get_value(PERIOD_ROLLING, type_)
+
+    def _within_deadband(self, changed) -> bool:
+        """Return True when no period reset and every shown value is in band."""
+        if any(field in _RESET_FIELDS for _period, field in changed):
+            return False
+        return super()._within_deadband(changed)
+
+    def _deadband_values(self) -> tuple:
+        """Return the state and every attribute value: all of them are shown."""
+        return (self.native_value, *(value for _name, value in self._rendered_values()))
+
+    @property
+    def native_value(self):
+        """Return the narrowest period's value of the primary type."""
+        types = self.coordinator.types
+        primary = next((type_ for type_, _cls, _label in _SENSOR_TYPES if type_ in types), TYPE_MAX)
+        return self._type_value(self.period, primary)
+
+    @property
+    def extra_state_attributes(self):
+        """Return every configured period/type value plus reset metadata."""
+        attrs = dict(self.coordinator.get_attribute_snapshot(self.period).attributes)
+        attrs["period"] = self.period
+        attrs.update(self._rendered_values())
+        return attrs
+
+    @property
+    def extra_restore_state_data(self) -> MaxMinSummaryStoredData:
+        """Return every period's record to persist with the restore state."""
+        return MaxMinSummaryStoredData(self.coordinator.get_restore_records())
+
+    async def _async_restore_records(self, last_state) -> None:
+        """Restore every period not already restored from the shared store."""
+        extra_data = await self.async_get_last_extra_data()
+        stored = MaxMinSummaryStoredData.from_dict(extra_data.as_dict()) if extra_data else None
+        if stored is None:
+            return
+        for period, restored in stored.records.items():
+            if period in self.coordinator.stored_periods or not isinstance(restored, dict):
+                continue
+            if period == PERIOD_ROLLING:
+                self.coordinator.restore_rolling_state(restored)
+                continue
+            record = MaxMinExtraStoredData.from_dict(restored)
+            if record is not None:
+                self._restore_record(record, period)
+
+
+class _RollingSensorMixin:
+    """Rolling window max/min: restores the window segments, not a period record."""
+
+    @property
+    def extra_state_attributes(self):
+        """Return the window length next to the config entry id."""
+        return {
+            **self.coordinator.get_attribute_snapshot(None).attributes,
+            "window_hours": self.coordinator.rolling_window / 3600,
+        }
+
+    @property
+    def extra_restore_state_data(self) -> MaxMinRollingStoredData | None:
+        """Return the window segments to persist with the restore state."""
+        state = self.coordinator.get_rolling_state()
+        return MaxMinRollingStoredData(state) if state is not None else None
+
+    async def _async_restore_records(self, last_state) -> None:
+        """Restore the window unless the shared store already did."""
+        if PERIOD_ROLLING in self.coordinator.stored_periods:
+            return
+        extra_data = await self.async_get_last_extra_data()
+        stored = MaxMinRollingStoredData.from_dict(extra_data.as_dict()) if extra_data else None
+        if stored is not None:
+            self.coordinator.restore_rolling_state(stored.state)
+
+
+class RollingMaxSensor(_RollingSensorMixin, MaxSensor):
+    """Maximum over the last rolling_window hours."""
+
+
+class RollingMinSensor(_RollingSensorMixin, MinSensor):
+    """Minimum over the last rolling_window hours."""
+
+
+_PERIOD_LABELS = {
+    PERIOD_DAILY: "Daily",
+    PERIOD_WEEKLY: "Weekly",
+    PERIOD_MONTHLY: "Monthly",
+    PERIOD_YEARLY: "Yearly",
+    PERIOD_ALL_TIME: "All time",
+}
+
+# (type, entity class, name suffix) in entity creation order.
+_SENSOR_TYPES = (
+    (TYPE_MAX, MaxSensor, "Max"),
+    (TYPE_MIN, MinSensor, "Min"),
+    (TYPE_DELTA, DeltaSensor, "Delta"),
+    (TYPE_AVERAGE, AverageSensor, "Average"),
+    (TYPE_P5, P5Sensor, "P5"),
+    (TYPE_P50, P50Sensor, "P50"),
+    (TYPE_P95, P95Sensor, "P95"),
+    (TYPE_COUNT, CountSensor, "Count"),
+    (TYPE_MEAN, MeanSensor, "Mean"),
+    (TYPE_STD, StdSensor, "Std dev"),
+)
+
+# Rolling window sensors (max/min only: a step signal has no window delta).
+_ROLLING_SENSOR_TYPES = (
+    (TYPE_MAX, RollingMaxSensor, "Max"),
+    (TYPE_MIN, RollingMinSensor, "Min"),
+)
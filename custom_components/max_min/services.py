@@ -0,0 +1,122 @@
+"""Runtime services acting on live coordinators.
+
+``max_min.reset`` re-baselines and ``max_min.set_value`` overwrites the
+period/type of each targeted Max Min sensor without reloading its entry
+(the options-flow surgical reset writes ``reset_history`` and reloads).
+Targets are grouped per config entry, so one call covering hundreds of
+sensors applies one update, one consistency sweep and one publish per
+coordinator.  Only max, min, delta and average sensors of a period hold a
+value that can be set; summary, rolling, percentile and count/mean/std
+sensors can only be reset.
+"""
+
+import logging
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+from .const import (
+    ATTR_VALUE,
+    DOMAIN,
+    MOMENT_TYPES,
+    PERIOD_ROLLING,
+    QUANTILE_TYPES,
+    SERVICE_RESET,
+    SERVICE_SET_VALUE,
+    SUMMARY_KEY,
+    TYPE_AVERAGE,
+    TYPE_DELTA,
+    TYPE_MAX,
+    TYPE_MIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+RESET_SCHEMA = cv.make_entity_service_schema({})
+SET_VALUE_SCHEMA = cv.make_entity_service_schema({vol.Required(ATTR_VALUE): vol.Coerce(float)})
+
+_SETTABLE_TYPES = (TYPE_MAX, TYPE_MIN, TYPE_DELTA, TYPE_AVERAGE)
+
+
+def _resolve_targets(hass: HomeAssistant, call: ServiceCall, settable: bool = False) -> dict:
+    """Return {coordinator: {(period, type)}} for the call's targets.
+
+    Explicitly targeted entities must be loaded Max Min sensors (with a
+    settable value when ``settable``); entities reached through an area or
+    device are skipped when they are not.
+    """
+    selected = async_extract_referenced_entity_ids(hass, call)
+    ent_reg = er.async_get(hass)
+    targets = {}
+    for entity_id in sorted(selected.referenced | selected.indirectly_referenced):
+        explicit = entity_id in selected.referenced
+        entity_entry = ent_reg.async_get(entity_id)
+        key = None
+        error = "not_max_min_entity"
+        if entity_entry is not None and entity_entry.platform == DOMAIN and entity_entry.config_entry_id:
+            entry_id = entity_entry.config_entry_id
+            suffix = entity_entry.unique_id.removeprefix(f"{entry_id}_")
+            period, _, type_ = suffix.rpartition("_")
+            if suffix == SUMMARY_KEY:
+                # A summary sensor stands for every period/type of its entry.
+                key = (entry_id, None, None)
+            elif period and (type_ in (TYPE_MAX, TYPE_MIN, TYPE_DELTA, TYPE_AVERAGE, *MOMENT_TYPES) or type_ in QUANTILE_TYPES):
+                key = (entry_id, period, type_)
+            if settable and key is not None and (
+                key[1] in (None, PERIOD_ROLLING) or key[2] not in _SETTABLE_TYPES
+            ):
+                key = None
+                error = "value_not_settable"
+        if key is None:
+            if explicit:
+                raise ServiceValidationError(
+                    translation_domain=DOMAIN,
+                    translation_key=error,
+                    translation_placeholders={"entity_id": entity_id},
+                )
+            continue
+
+        entry_id, period, type_ = key
+        config_entry = hass.config_entries.async_get_entry(entry_id)
+        if config_entry is None or config_entry.state is not ConfigEntryState.LOADED:
+            if explicit:
+                raise ServiceValidationError(
+                    translation_domain=DOMAIN,
+                    translation_key="entry_not_loaded",
+                    translation_placeholders={"entity_id": entity_id},
+                )
+            continue
+        coordinator = config_entry.runtime_data
+        keys = targets.setdefault(coordinator, set())
+        if period is None:
+            keys.update((p, t) for p in coordinator.periods for t in coordinator.types)
+            if coordinator.rolling_window:
+                keys.update((PERIOD_ROLLING, t) for t in (TYPE_MAX, TYPE_MIN) if t in coordinator.types)
+        else:
+            keys.add((period, type_))
+    return targets
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Max Min services."""
+
+    @callback
+    def _async_reset(call: ServiceCall) -> None:
+        for coordinator, keys in _resolve_targets(hass, call).items():
+            coordinator.reset_values(keys)
+
+    @callback
+    def _async_set_value(call: ServiceCall) -> None:
+        value = call.data[ATTR_VALUE]
+        for coordinator, keys in _resolve_targets(hass, call, settable=True).items():
+            coordinator.set_values(keys, value)
+
+    hass.services.async_register(DOMAIN, SERVICE_RESET, _async_reset, schema=RESET_SCHEMA)
+    hass.services.async_register(DOMAIN, SERVICE_SET_VALUE, _async_set_value, schema=SET_VALUE_SCHEMA)
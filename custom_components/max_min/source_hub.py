@@ -0,0 +1,103 @@
+"""Domain-wide source hub shared by all config entries.
+
+Several entries often track the same source entity (for example one for
+daily/weekly max/min and another for a yearly delta with a different
+offset).  Instead of one ``async_track_state_change_event`` subscription
+and one parse per coordinator, the hub:
+
+  - subscribes once per source entity, on the first coordinator for it;
+  - parses and validates each new state once (``parse_source_state``) and
+    takes one timestamp;
+  - fans the parsed value out to every coordinator of that source, which
+    still applies its own repeat filter, resets and periods;
+  - drops the subscription when the last coordinator of a source unloads.
+
+Per-source fan-out counts are exposed for diagnostics.
+"""
+
+import logging
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util import dt as dt_util
+
+from .coordinator import parse_source_state
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class MaxMinSourceHub:
+    """Shared state listener keyed by source ``entity_id``."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub (no listeners until a coordinator subscribes)."""
+        self.hass = hass
+        # {entity_id: {entry_id: coordinator}}
+        self._subscribers = {}
+        self._unsub_listeners = {}
+        # {entity_id: events received}; deliveries = events x fan-out
+        self._events = {}
+        self._deliveries = {}
+
+    def source_stats(self, entity_id: str) -> dict:
+        """Return fan-out counters for one source entity."""
+        return {
+            "subscribers": len(self._subscribers.get(entity_id, ())),
+            "events": self._events.get(entity_id, 0),
+            "deliveries": self._deliveries.get(entity_id, 0),
+        }
+
+    @property
+    def stats(self) -> dict:
+        """Return fan-out counters for every subscribed source."""
+        return {entity_id: self.source_stats(entity_id) for entity_id in self._subscribers}
+
+    @callback
+    def async_subscribe(self, coordinator) -> CALLBACK_TYPE:
+        """Subscribe a coordinator to its source and return the unsubscribe callback."""
+        entity_id = coordinator.sensor_entity
+        entry_id = coordinator.config_entry.entry_id
+        self._subscribers.setdefault(entity_id, {})[entry_id] = coordinator
+        if entity_id not in self._unsub_listeners:
+            self._unsub_listeners[entity_id] = async_track_state_change_event(
+                self.hass, [entity_id], self._async_handle_event
+            )
+            self._events.setdefault(entity_id, 0)
+            self._deliveries.setdefault(entity_id, 0)
+
+        @callback
+        def _unsubscribe() -> None:
+            subscribers = self._subscribers.get(entity_id)
+            if not subscribers or subscribers.get(entry_id) is not coordinator:
+                return
+            del subscribers[entry_id]
+            if subscribers:
+                return
+            del self._subscribers[entity_id]
+            self._events.pop(entity_id, None)
+            self._deliveries.pop(entity_id, None)
+            unsub = self._unsub_listeners.pop(entity_id, None)
+            if unsub is not None:
+                unsub()
+
+        return _unsubscribe
+
+    @callback
+    def _async_handle_event(self, event: Event) -> None:
+        """Parse one source state change and fan it out."""
+        entity_id = event.data.get("entity_id")
+        subscribers = self._subscribers.get(entity_id)
+        if not subscribers:
+            return
+
+        new_state = event.data.get("new_state")
+        value = parse_source_state(new_state)
+        now = dt_util.now()
+        self._events[entity_id] += 1
+        self._deliveries[entity_id] += len(subscribers)
+
+        for coordinator in list(subscribers.values()):
+            try:
+                coordinator.handle_source_update(new_state, value, now)
+            except Exception as err:
+                _LOGGER.exception("Source update failed for %s: %s", coordinator.name, err)
@@ -0,0 +1,107 @@
+"""Domain-wide persistence of tracker state.
+
+``RestoreEntity`` state is only dumped periodically and at shutdown, so an
+unclean stop loses the extremes of the last minutes.  One ``Store`` file
+(``.storage/max_min.tracker_state``) shared by every config entry keeps
+each coordinator's period records (``get_restore_record``):
+
+  - loaded with a single JSON read when the first entry is set up, then
+    served from memory to every entry (also on reload);
+  - saved at most once per ``STORE_SAVE_DELAY`` across all entries: the
+    first change arms one delayed write, later changes ride along with it
+    and the records are collected when the write actually happens;
+  - flushed on Home Assistant stop by the Store's final-write hook.
+"""
+
+import asyncio
+import logging
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.tracker_state"
+# Upper bound on disk writes: one per this many seconds, for all entries.
+STORE_SAVE_DELAY = 30
+
+
+class MaxMinStore:
+    """Shared store of every coordinator's tracked period records."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store (nothing is read until async_load)."""
+        self.hass = hass
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+        # {entry_id: {period: record}} for entries not currently registered
+        self._records = {}
+        self._coordinators = {}
+        self._save_pending = False
+        self.saves = 0
+
+    async def async_load(self) -> None:
+        """Read the store file once; later calls return immediately."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            try:
+                data = await self._store.async_load()
+            except Exception as err:  # Corrupt file must not block setup
+                _LOGGER.warning("Could not load %s, starting empty: %s", STORAGE_KEY, err)
+                data = None
+            if isinstance(data, dict) and isinstance(data.get("entries"), dict):
+                self._records = data["entries"]
+            self._loaded = True
+
+    def entry_records(self, entry_id: str) -> dict:
+        """Return the stored {period: record} for a config entry."""
+        return self._records.get(entry_id, {})
+
+    @callback
+    def async_register(self, coordinator) -> CALLBACK_TYPE:
+        """Track a coordinator's records and return the unregister callback."""
+        entry_id = coordinator.config_entry.entry_id
+        self._coordinators[entry_id] = coordinator
+        coordinator.persist_listener = self.async_schedule_save
+
+        @callback
+        def _unregister() -> None:
+            if self._coordinators.get(entry_id) is not coordinator:
+                return
+            del self._coordinators[entry_id]
+            coordinator.persist_listener = None
+            # Keep the latest records in memory for a reload of this entry.
+            self._records[entry_id] = coordinator.get_restore_records()
+            self.async_schedule_save()
+
+        return _unregister
+
+    @callback
+    def async_remove_entry(self, entry_id: str) -> None:
+        """Forget a removed config entry."""
+        self._coordinators.pop(entry_id, None)
+        if self._records.pop(entry_id, None) is not None:
+            self.async_schedule_save()
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Arm one delayed write unless one is already pending."""
+        if self._save_pending:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, STORE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict:
+        """Collect every entry's records at write time."""
+        self._save_pending = False
+        self.saves += 1
+        for entry_id, coordinator in self._coordinators.items():
+            self._records[entry_id] = coordinator.get_restore_records()
+        # Copy: the JSON encoding may run after this callback returns.
+        return {"entries": dict(self._records)}
@@ -0,0 +1,228 @@
+"""Domain-wide watchdog for missed period resets.
+
+One instance is shared by every config entry of the integration (see
+``__init__.py``).  A reset can only be missed around a boundary instant
+or after the wall clock moves unexpectedly, so instead of polling the
+watchdog:
+
+  - sleeps until the earliest pending boundary (plus offset) across all
+    registered coordinators, plus BACKUP_RESET_DELAY, and then only checks
+    the coordinators that are actually due (``is_watchdog_due``);
+  - compares monotonic and wall-clock time on a coarse heartbeat and
+    forces a full check when they diverge (manual clock change, NTP step,
+    suspend/resume — CLOCK_MONOTONIC does not advance while suspended);
+  - forces a full check when Home Assistant finishes starting and when
+    the core configuration (time zone) changes.
+
+The guarantee is the same as the old per-entry minute poll: every
+``ensure_period_current`` that would have fired still fires, just
+without ~1,440 idle callbacks per entry per day.
+"""
+
+from datetime import timedelta
+import logging
+import time
+
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE, EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time, async_track_time_interval
+from homeassistant.util import dt as dt_util
+
+from .coordinator import BACKUP_RESET_DELAY, WATCHDOG_NEVER
+
+_LOGGER = logging.getLogger(__name__)
+
+# Delay before re-checking a coordinator whose due time is unknown
+# (its last check failed, or its cumulative mode just changed).
+WATCHDOG_RETRY_DELAY = timedelta(minutes=1)
+# Heartbeat used only to compare monotonic and wall-clock time.
+CLOCK_CHECK_INTERVAL = timedelta(minutes=5)
+CLOCK_JUMP_TOLERANCE = timedelta(seconds=30)
+
+
+class MaxMinWatchdog:
+    """Shared registry of live coordinators checked for missed resets."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the watchdog (no timers until a coordinator registers)."""
+        self.hass = hass
+        self._coordinators = {}
+        self._unsub_timer = None
+        self._scheduled_at = None
+        self._unsub_clock = None
+        self._unsub_config = None
+        self._unsub_started = None
+        self._clock_ref = None
+        # Per-tick counters, exposed so the saving is observable.
+        self.last_checked = 0
+        self.last_reset = 0
+        self.total_ticks = 0
+        self.total_checked = 0
+        self.total_reset = 0
+        self.clock_jumps = 0
+
+    @property
+    def stats(self) -> dict:
+        """Return watchdog counters for diagnostics."""
+        return {
+            "coordinators": len(self._coordinators),
+            "last_checked": self.last_checked,
+            "last_reset": self.last_reset,
+            "total_ticks": self.total_ticks,
+            "total_checked": self.total_checked,
+            "total_reset": self.total_reset,
+            "clock_jumps": self.clock_jumps,
+            "next_check": self._scheduled_at.isoformat() if self._scheduled_at else None,
+        }
+
+    @callback
+    def async_register(self, coordinator) -> CALLBACK_TYPE:
+        """Register a coordinator and return a callback that unregisters it."""
+        entry_id = coordinator.config_entry.entry_id
+        self._coordinators[entry_id] = coordinator
+        coordinator.watchdog_listener = self.async_schedule
+        if self._unsub_clock is None:
+            self._async_start()
+        self.async_schedule()
+
+        @callback
+        def _unregister() -> None:
+            if self._coordinators.get(entry_id) is coordinator:
+                del self._coordinators[entry_id]
+                coordinator.watchdog_listener = None
+            if not self._coordinators:
+                self._async_stop()
+            else:
+                self.async_schedule()
+
+        return _unregister
+
+    @callback
+    def _async_start(self) -> None:
+        """Start the clock heartbeat and lifecycle listeners."""
+        self._clock_ref = (time.monotonic(), dt_util.utcnow())
+        self._unsub_clock = async_track_time_interval(
+            self.hass, self._async_check_clock, CLOCK_CHECK_INTERVAL
+        )
+        self._unsub_config = self.hass.bus.async_listen(
+            EVENT_CORE_CONFIG_UPDATE, self._async_force_check
+        )
+        if not self.hass.is_running:
+            self._unsub_started = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STARTED, self._async_handle_started
+            )
+
+    @callback
+    def _async_stop(self) -> None:
+        """Cancel every timer and listener once no coordinator is left."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._scheduled_at = None
+        if self._unsub_clock is not None:
+            self._unsub_clock()
+            self._unsub_clock = None
+        if self._unsub_config is not None:
+            self._unsub_config()
+            self._unsub_config = None
+        if self._unsub_started is not None:
+            self._unsub_started()
+            self._unsub_started = None
+
+    @callback
+    def async_schedule(self) -> None:
+        """(Re)arm the timer for the earliest pending due time."""
+        if not self._coordinators:
+            return
+
+        now = dt_util.utcnow()
+        earliest = None
+        for coordinator in self._coordinators.values():
+            due = coordinator.watchdog_due
+            if due is None:
+                due = now + WATCHDOG_RETRY_DELAY - BACKUP_RESET_DELAY
+            elif due == WATCHDOG_NEVER:
+                # No bounded period: only clock jumps and forced checks apply.
+                continue
+            if earliest is None or due < earliest:
+                earliest = due
+
+        if earliest is None:
+            if self._unsub_timer is not None:
+                self._unsub_timer()
+                self._unsub_timer = None
+            self._scheduled_at = None
+            return
+
+        fire_at = dt_util.as_utc(earliest + BACKUP_RESET_DELAY)
+        if fire_at == self._scheduled_at and self._unsub_timer is not None:
+            return
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+        self._scheduled_at = fire_at
+        self._unsub_timer = async_track_point_in_utc_time(self.hass, self._async_tick, fire_at)
+
+    @callback
+    def _async_tick(self, now) -> None:
+        """Check the coordinators whose boundary has passed, then re-arm."""
+        self._unsub_timer = None
+        self._scheduled_at = None
+        self._async_check(now)
+        self.async_schedule()
+
+    @callback
+    def _async_check(self, now, force: bool = False) -> None:
+        """Run the missed-reset check on due coordinators (or all if forced)."""
+        checked = 0
+        reset = 0
+        for coordinator in list(self._coordinators.values()):
+            if not force and not coordinator.is_watchdog_due(now):
+                continue
+            checked += 1
+            try:
+                if coordinator._check_watchdog(now):
+                    reset += 1
+            except Exception as err:
+                _LOGGER.exception("Watchdog failed for %s: %s", coordinator.name, err)
+
+        self.last_checked = checked
+        self.last_reset = reset
+        self.total_ticks += 1
+        self.total_checked += checked
+        self.total_reset += reset
+        _LOGGER.debug(
+            "Watchdog tick: checked %s of %s coordinators, %s reset",
+            checked,
+            len(self._coordinators),
+            reset,
+        )
+
+    @callback
+    def _async_check_clock(self, now) -> None:
+        """Detect wall-clock jumps by comparing against monotonic time."""
+        monotonic_now = time.monotonic()
+        wall_now = dt_util.utcnow()
+        ref_monotonic, ref_wall = self._clock_ref
+        self._clock_ref = (monotonic_now, wall_now)
+
+        drift = (wall_now - ref_wall) - timedelta(seconds=monotonic_now - ref_monotonic)
+        if abs(drift) <= CLOCK_JUMP_TOLERANCE:
+            return
+
+        self.clock_jumps += 1
+        _LOGGER.warning("Wall clock jumped by %s; re-checking all period resets", drift)
+        self._async_check(wall_now, force=True)
+        self.async_schedule()
+
+    @callback
+    def _async_handle_started(self, event) -> None:
+        """Re-check everything once Home Assistant has finished starting."""
+        # async_listen_once removes itself; forget the handle so stop does not.
+        self._unsub_started = None
+        self._async_force_check(event)
+
+    @callback
+    def _async_force_check(self, event=None) -> None:
+        """Check every coordinator (HA started, time zone changed)."""
+        self._async_check(dt_util.utcnow(), force=True)
+        self.async_schedule()
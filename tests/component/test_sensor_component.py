@@ -59,7 +59,7 @@ async def test_sensor_setup(hass, config_entry):
         mock_er_get.return_value = mock_registry
 
         mock_dev_reg = Mock()
-        mock_dev_reg.devices = {} # Empty devices dict
+        mock_dev_reg.devices.get_devices_for_config_entry_id.return_value = []  # No linked devices
         mock_dr_get.return_value = mock_dev_reg
         
         await async_setup_entry(hass, config_entry, async_add_entities)
@@ -94,6 +94,7 @@ async def test_device_cleanup(hass, config_entry):
     # Mock entities that have device_id set
     mock_entity_entry = Mock()
     mock_entity_entry.entity_id = "sensor.test_daily_max"
+    mock_entity_entry.unique_id = "test_entry_daily_max"
     mock_entity_entry.device_id = "old_device_id"
     
     # Mock device registry having a device linked to this config entry
@@ -110,7 +111,7 @@ async def test_device_cleanup(hass, config_entry):
         mock_er_get.return_value = mock_registry
         
         mock_dev_reg = Mock()
-        mock_dev_reg.devices = {"old_device_id": mock_device}
+        mock_dev_reg.devices.get_devices_for_config_entry_id.return_value = [mock_device]
         mock_dr_get.return_value = mock_dev_reg
         
         await async_setup_entry(hass, config_entry, async_add_entities)
@@ -120,6 +121,9 @@ async def test_device_cleanup(hass, config_entry):
         
         # Verify device was updated to remove config entry connection
         mock_dev_reg.async_update_device.assert_called_with("old_device_id", remove_config_entry_id=config_entry.entry_id)
+        # Devices come from the per-config-entry index, not a registry scan
+        mock_dev_reg.devices.get_devices_for_config_entry_id.assert_called_once_with(config_entry.entry_id)
+        mock_dev_reg.devices.values.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -144,7 +148,7 @@ async def test_sensor_setup_periods_string(hass, config_entry):
         mock_er_get.return_value = mock_registry
 
         mock_dev_reg = Mock()
-        mock_dev_reg.devices = {}
+        mock_dev_reg.devices.get_devices_for_config_entry_id.return_value = []
         mock_dr_get.return_value = mock_dev_reg
 
         await async_setup_entry(hass, config_entry, async_add_entities)
@@ -178,7 +182,7 @@ async def test_sensor_setup_friendly_name_fallback(hass, config_entry):
         mock_er_get.return_value = mock_registry
 
         mock_dev_reg = Mock()
-        mock_dev_reg.devices = {}
+        mock_dev_reg.devices.get_devices_for_config_entry_id.return_value = []
         mock_dr_get.return_value = mock_dev_reg
 
         await async_setup_entry(hass, config_entry, async_add_entities)
@@ -208,7 +212,7 @@ async def test_sensor_setup_creates_delta_entity(hass, config_entry):
         mock_er_get.return_value = mock_registry
 
         mock_dev_reg = Mock()
-        mock_dev_reg.devices = {}
+        mock_dev_reg.devices.get_devices_for_config_entry_id.return_value = []
         mock_dr_get.return_value = mock_dev_reg
 
         await async_setup_entry(hass, config_entry, async_add_entities)
@@ -5,6 +5,7 @@ from unittest.mock import Mock, MagicMock, patch
 from homeassistant.util import dt as dt_util
 from datetime import timezone
 
+from custom_components.max_min.coordinator import MaxMinDataUpdateCoordinator
 from custom_components.max_min.const import (
     CONF_OFFSET,
     CONF_PERIODS,
@@ -18,8 +19,15 @@ from custom_components.max_min.const import (
 
 @pytest.fixture(autouse=True)
 def mock_track_time_interval():
-    """Mock async_track_time_interval normally used in coordinator init."""
-    with patch("custom_components.max_min.coordinator.async_track_time_interval") as mock_track:
+    """Mock async_track_time_interval used by the shared domain watchdog."""
+    with patch("custom_components.max_min.watchdog.async_track_time_interval") as mock_track:
+        yield mock_track
+
+
+@pytest.fixture(autouse=True)
+def mock_track_point_in_utc_time():
+    """Mock the boundary timer armed by the shared domain watchdog."""
+    with patch("custom_components.max_min.watchdog.async_track_point_in_utc_time") as mock_track:
         yield mock_track
 
 @pytest.fixture(autouse=True)
@@ -81,3 +89,22 @@ def make_mock_hass(state="10.0", state_class=None, tz=None, data=None, attrs=Non
         mock_state.attributes["state_class"] = state_class
     hass.states.get.return_value = mock_state
     return hass
+
+
+def make_coordinator(hass, periods=None, types=None, now=None, values=None, offset=0, entry_id=None, **options):
+    """Create a coordinator whose periods are all current at ``now``.
+
+    Publishing and reset scheduling are mocked.  ``values`` ({field: value})
+    seeds every tracked period; ``options`` become the entry options.
+    """
+    entry = make_config_entry(periods=periods, types=types, offset=offset, options=options)
+    if entry_id is not None:
+        entry.entry_id = entry_id
+    coordinator = MaxMinDataUpdateCoordinator(hass, entry)
+    coordinator.async_set_updated_data = Mock()
+    coordinator._schedule_single_reset = Mock()
+    now = now or dt_util.now()
+    for period, data in coordinator.tracked_data.items():
+        data.update(values or {})
+        data.last_reset = coordinator._get_period_start(now, period)
+    return coordinator
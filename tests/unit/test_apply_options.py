@@ -0,0 +1,102 @@
+"""Tests for applying options changes to a live coordinator (no reload)."""
+
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+from conftest import make_coordinator, make_mock_hass
+
+from custom_components.max_min.const import (
+    CONF_OFFSET,
+    CONF_PERIODS,
+    CONF_ROLLUP,
+    CONF_TYPES,
+    PERIOD_ALL_TIME,
+    PERIOD_DAILY,
+    PERIOD_MONTHLY,
+    PERIOD_WEEKLY,
+    TYPE_MAX,
+    TYPE_MIN,
+)
+
+NOW = datetime(2026, 3, 11, 12, 0, tzinfo=timezone.utc)  # Wednesday
+
+
+VALUES = {"max": 25.0, "min": 5.0, "start": 5.0, "end": 10.0}
+
+
+def _apply(coordinator, **options):
+    coordinator.config_entry.options = options
+    with patch("custom_components.max_min.coordinator.dt_util.now", return_value=NOW):
+        coordinator.apply_options()
+
+
+def test_apply_options_keeps_untouched_periods():
+    """Removed periods are dropped, added ones seeded, untouched ones kept."""
+    hass = make_mock_hass(state="12.0")
+    coordinator = make_coordinator(hass, [PERIOD_DAILY, PERIOD_WEEKLY], now=NOW, values=VALUES)
+    unsub_weekly = Mock()
+    coordinator._reset_listeners[PERIOD_WEEKLY] = unsub_weekly
+    coordinator._pending_start_reanchor.add(PERIOD_WEEKLY)
+    daily = coordinator.tracked_data[PERIOD_DAILY]
+    coordinator.entities_listener = Mock()
+    coordinator.watchdog_listener = Mock()
+
+    _apply(coordinator, **{CONF_PERIODS: [PERIOD_DAILY, PERIOD_MONTHLY], CONF_TYPES: [TYPE_MAX, TYPE_MIN]})
+
+    assert coordinator.tracked_data[PERIOD_DAILY] is daily
+    assert (daily.max, daily.min, daily.end) == (25.0, 5.0, 10.0)
+    assert PERIOD_WEEKLY not in coordinator.tracked_data
+    assert PERIOD_WEEKLY not in coordinator._pending_start_reanchor
+    unsub_weekly.assert_called_once()
+
+    monthly = coordinator.tracked_data[PERIOD_MONTHLY]
+    assert monthly.last_reset == coordinator._get_period_start(NOW, PERIOD_MONTHLY)
+    # Seeded from the source, then widened by today's extremes.
+    assert (monthly.max, monthly.min, monthly.start, monthly.end) == (25.0, 5.0, 12.0, 12.0)
+    assert coordinator._propagation_targets[PERIOD_DAILY] == ((PERIOD_MONTHLY,), (PERIOD_MONTHLY,))
+
+    # Only the added period is scheduled.
+    assert [c.args[0] for c in coordinator._schedule_single_reset.call_args_list] == [PERIOD_MONTHLY]
+    assert coordinator.watchdog_due is None
+    coordinator.watchdog_listener.assert_called_once()
+    coordinator.entities_listener.assert_called_once()
+    coordinator.async_set_updated_data.assert_called_once()
+
+
+def test_apply_options_offset_reschedules_cumulative_source():
+    """An offset change moves every boundary of a cumulative source."""
+    hass = make_mock_hass(state_class="total_increasing")
+    coordinator = make_coordinator(hass, [PERIOD_DAILY, PERIOD_WEEKLY], now=NOW, values=VALUES)
+    coordinator._source_is_cumulative = True
+
+    _apply(coordinator, **{CONF_OFFSET: 30})
+
+    assert coordinator.offset == 30
+    assert {c.args[0] for c in coordinator._schedule_single_reset.call_args_list} == {PERIOD_DAILY, PERIOD_WEEKLY}
+
+
+def test_apply_options_unchanged_is_cheap():
+    """A title-only update keeps timers and data."""
+    hass = make_mock_hass()
+    coordinator = make_coordinator(hass, [PERIOD_DAILY], now=NOW, values=VALUES)
+    coordinator.watchdog_listener = Mock()
+
+    _apply(coordinator)
+
+    coordinator._schedule_single_reset.assert_not_called()
+    coordinator.watchdog_listener.assert_not_called()
+    assert coordinator.tracked_data[PERIOD_DAILY].max == 25.0
+
+
+def test_apply_options_rollup_base_removed():
+    """Removing the roll-up base folds it into the broader periods first."""
+    hass = make_mock_hass(state="12.0")
+    coordinator = make_coordinator(hass, [PERIOD_DAILY, PERIOD_ALL_TIME], now=NOW, values=VALUES, **{CONF_ROLLUP: True})
+    assert coordinator._rollup_targets == (PERIOD_ALL_TIME,)
+    coordinator.tracked_data[PERIOD_DAILY].max = 40.0
+
+    _apply(coordinator, **{CONF_PERIODS: [PERIOD_WEEKLY, PERIOD_ALL_TIME], CONF_ROLLUP: True})
+
+    assert coordinator._rollup_base == PERIOD_WEEKLY
+    assert coordinator._rollup_targets == (PERIOD_ALL_TIME,)
+    assert coordinator.get_value(PERIOD_ALL_TIME, "max") == 40.0
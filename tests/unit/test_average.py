@@ -0,0 +1,154 @@
+"""Tests for the time-weighted average type (average.py and its coordinator wiring)."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+from conftest import make_coordinator, make_mock_hass
+
+from custom_components.max_min.average import TimeWeightedAverage
+from custom_components.max_min.const import PERIOD_DAILY, PERIOD_WEEKLY, TYPE_AVERAGE, TYPE_MAX
+from custom_components.max_min.coordinator import AVERAGE_REFRESH_INTERVAL
+
+NOW = datetime(2026, 3, 11, 12, 0, tzinfo=timezone.utc)
+TYPES = [TYPE_MAX, TYPE_AVERAGE]
+
+
+def test_average_weights_by_time_and_skips_unavailable():
+    """Each value counts for as long as it was held; gaps count for nothing."""
+    average = TimeWeightedAverage()
+    assert average.value(0.0) is None
+
+    average.add(0.0, 10.0)
+    assert average.value(0.0) == 10.0
+    average.add(30.0, 40.0)
+    average.add(40.0, None)  # unavailable for 60 s
+    average.add(100.0, 20.0)
+    # 10 x 30 s + 40 x 10 s + 20 x 20 s over 60 s
+    assert average.value(120.0) == pytest.approx((300 + 400 + 400) / 60)
+    assert average.as_list(120.0) == [1100.0, 60.0]
+
+    average.reset(120.0)
+    assert average.value(120.0) == 20.0
+    average.add(130.0, 50.0)
+    assert average.value(140.0) == pytest.approx(35.0)
+
+    # A manual set keeps the weight accumulated so far.
+    average.reset(140.0, 5.0)
+    assert average.as_list(140.0) == [100.0, 20.0]
+
+
+def test_average_set_before_time_accrues():
+    """A set with no weight yet is reported until the held value adds some."""
+    average = TimeWeightedAverage()
+    average.add(0.0, 10.0)
+    average.reset(0.0, 42.0)
+    assert average.value(0.0) == 42.0
+    assert average.as_list(0.0) == [0.0, 0.0]
+
+    # Still no reading: the set value holds while the source is unavailable.
+    empty = TimeWeightedAverage()
+    empty.reset(0.0, 42.0)
+    empty.add(10.0, None)
+    assert empty.value(20.0) == 42.0
+
+    # Once time accrues the held value takes over; a plain reset drops it.
+    assert average.value(30.0) == 10.0
+    average.reset(30.0, 42.0)
+    average.reset(30.0)
+    assert average.value(30.0) == 10.0
+
+
+@pytest.fixture(autouse=True)
+def mock_call_later():
+    """Capture the average refresh timer instead of arming it."""
+    with patch("custom_components.max_min.coordinator.async_call_later") as call_later:
+        yield call_later
+
+
+def _feed(coordinator, value, now):
+    state = Mock(state=str(value), attributes={})
+    coordinator._process_source_state(state, value, now)
+
+
+def _value(coordinator, period, now):
+    with patch("custom_components.max_min.coordinator.dt_util.now", return_value=now):
+        return coordinator.get_value(period, TYPE_AVERAGE)
+
+
+def test_coordinator_average_closed_out_at_reset():
+    """Readings update every period's integral; a reset restarts only its own."""
+    hass = make_mock_hass(state="10.0")
+    coordinator = make_coordinator(hass, [PERIOD_DAILY, PERIOD_WEEKLY], TYPES, now=NOW)
+    published = []
+    coordinator.async_set_updated_data.side_effect = lambda _data: published.append(coordinator.changed_keys)
+
+    _feed(coordinator, 10.0, NOW)
+    _feed(coordinator, 30.0, NOW + timedelta(hours=1))
+    assert (PERIOD_DAILY, TYPE_AVERAGE) in published[-1]
+    assert _value(coordinator, PERIOD_DAILY, NOW + timedelta(hours=2)) == 20.0
+
+    coordinator._perform_reset(NOW + timedelta(hours=2), PERIOD_DAILY)
+    assert _value(coordinator, PERIOD_DAILY, NOW + timedelta(hours=3)) == 30.0
+    assert _value(coordinator, PERIOD_WEEKLY, NOW + timedelta(hours=3)) == pytest.approx(70 / 3, abs=1e-4)
+
+
+def test_coordinator_average_persisted_across_restart():
+    """The [integral, duration] record restores the closed part of the period."""
+    hass = make_mock_hass(state="10.0")
+    before = make_coordinator(hass, types=TYPES, now=NOW)
+    _feed(before, 10.0, NOW)
+    _feed(before, 30.0, NOW + timedelta(hours=1))
+    with patch("custom_components.max_min.coordinator.dt_util.now", return_value=NOW + timedelta(hours=2)):
+        records = before.get_restore_records()
+    assert records[PERIOD_DAILY][TYPE_AVERAGE] == [10.0 * 3600 + 30.0 * 3600, 7200.0]
+
+    after = make_coordinator(hass, types=TYPES, now=NOW)
+    _feed(after, 30.0, NOW + timedelta(hours=3))
+    with patch("custom_components.max_min.coordinator.dt_util.now", return_value=NOW + timedelta(hours=3)):
+        after.restore_stored_records(records)
+    # Downtime (hours 2-3) is not counted; 30.0 is held again from hour 3.
+    assert _value(after, PERIOD_DAILY, NOW + timedelta(hours=4)) == pytest.approx(70 / 3, abs=1e-4)
+
+
+def test_coordinator_average_republished_while_source_is_flat(mock_call_later):
+    """A held value moves the average without events, so it is republished on a timer."""
+    hass = make_mock_hass(state="10.0")
+    coordinator = make_coordinator(hass, types=TYPES, now=NOW)
+    published = []
+    coordinator.async_set_updated_data.side_effect = lambda _data: published.append(coordinator.changed_keys)
+
+    _feed(coordinator, 10.0, NOW)
+    _feed(coordinator, 30.0, NOW + timedelta(hours=1))
+    assert mock_call_later.call_args[0][1] == AVERAGE_REFRESH_INTERVAL
+    flush = mock_call_later.call_args[0][2]
+
+    # No further source event: the refresh alone publishes the moving average.
+    count = len(published)
+    flush(None)
+    assert published[count:] == [frozenset({(PERIOD_DAILY, TYPE_AVERAGE)})]
+    assert mock_call_later.call_count == 3
+
+    # While the source is unavailable the average holds still: no refresh.
+    _feed(coordinator, None, NOW + timedelta(hours=2))
+    mock_call_later.reset_mock()
+    flush(None)
+    mock_call_later.assert_not_called()
+
+    # A publish interval sets the refresh cadence.
+    coordinator.publish_interval = 300
+    _feed(coordinator, 20.0, NOW + timedelta(hours=3))
+    mock_call_later.call_args[0][2](None)
+    assert mock_call_later.call_args[0][1] == 300
+
+
+def test_coordinator_average_set_right_after_reset():
+    """set_value at the start of a period is not lost for lack of weight."""
+    hass = make_mock_hass(state="10.0")
+    coordinator = make_coordinator(hass, types=TYPES, now=NOW)
+    _feed(coordinator, 10.0, NOW)
+    with patch("custom_components.max_min.coordinator.dt_util.now", return_value=NOW):
+        coordinator.reset_values({(PERIOD_DAILY, TYPE_AVERAGE)})
+        coordinator.set_values({(PERIOD_DAILY, TYPE_AVERAGE)}, 42.0)
+    assert _value(coordinator, PERIOD_DAILY, NOW) == 42.0
+    assert _value(coordinator, PERIOD_DAILY, NOW + timedelta(hours=1)) == 10.0
@@ -10,6 +10,7 @@ from homeassistant.data_entry_flow import FlowResult, FlowResultType
 from custom_components.max_min.config_flow import (
     MaxMinConfigFlow,
     MaxMinOptionsFlow,
+    _build_entry_title,
     _coerce_localized_float,
 )
 from custom_components.max_min.const import (
@@ -18,11 +19,20 @@ from custom_components.max_min.const import (
     CONF_TYPES,
     CONF_INITIAL_MAX,
     CONF_INITIAL_MIN,
+    CONF_PUBLISH_EXTREMES,
+    CONF_PUBLISH_INTERVAL,
+    CONF_ROLLUP,
     DOMAIN,
     PERIOD_DAILY,
     TYPE_MAX,
     TYPE_MIN,
     TYPE_DELTA,
+    TYPE_AVERAGE,
+    TYPE_COUNT,
+    TYPE_MEAN,
+    TYPE_P50,
+    TYPE_P95,
+    TYPE_STD,
 )
 
 
@@ -131,6 +141,31 @@ async def test_config_flow_user_form_uses_default_values(hass):
     assert types_key.default() == [TYPE_MAX, TYPE_MIN]
 
 
+@pytest.mark.asyncio
+async def test_performance_fields_in_user_and_options_forms(hass):
+    """Both forms expose the publish window and roll-up, off by default."""
+    flow = MaxMinConfigFlow()
+    flow.hass = Mock()
+    user_schema = (await flow.async_step_user())["data_schema"].schema
+
+    config_entry = MagicMock()
+    config_entry.options = {CONF_PUBLISH_INTERVAL: 30, CONF_PUBLISH_EXTREMES: True, CONF_ROLLUP: True}
+    config_entry.data = {CONF_SENSOR_ENTITY: "sensor.test"}
+    options_flow = MaxMinOptionsFlow(config_entry)
+    options_flow.hass = Mock()
+    options_schema = (await options_flow.async_step_init())["data_schema"].schema
+
+    def _default(schema, name):
+        return next(key for key in schema if isinstance(key, vol.Marker) and key.schema == name).default()
+
+    assert _default(user_schema, CONF_PUBLISH_INTERVAL) == 0
+    assert _default(user_schema, CONF_PUBLISH_EXTREMES) is False
+    assert _default(options_schema, CONF_PUBLISH_INTERVAL) == 30
+    assert _default(options_schema, CONF_PUBLISH_EXTREMES) is True
+    assert _default(user_schema, CONF_ROLLUP) is False
+    assert _default(options_schema, CONF_ROLLUP) is True
+
+
 @pytest.mark.asyncio
 async def test_config_flow_duplicate_unique_id_abort_returned(hass):
     """Abort results from the unique-id check are returned unchanged."""
@@ -586,6 +621,19 @@ async def test_options_flow_update_title_delta(hass):
     assert call_args[1]["title"] == "sensor.test (Max/Min/Delta)"
 
 
+def test_entry_title_names_statistics_types():
+    """Average, percentile and moment types appear in the entry title."""
+    assert _build_entry_title(None, "sensor.test", [TYPE_AVERAGE]) == "sensor.test (Average)"
+    assert (
+        _build_entry_title(None, "sensor.test", [TYPE_P95, TYPE_MAX, TYPE_P50])
+        == "sensor.test (Max/P50/P95)"
+    )
+    assert (
+        _build_entry_title(None, "sensor.test", [TYPE_STD, TYPE_MEAN, TYPE_COUNT])
+        == "sensor.test (Count/Mean/Std dev)"
+    )
+
+
 @pytest.mark.asyncio
 async def test_config_flow_validation_requirements(hass):
     """Test that validation fails if periods or types are empty."""
@@ -735,3 +783,26 @@ async def test_options_flow_overwrite_with_new_value(hass):
 
 
 
+
+
+@pytest.mark.asyncio
+async def test_entity_mode_in_user_and_options_forms(hass):
+    """Both forms offer the summary entity mode, per-sensor by default."""
+    from custom_components.max_min.const import CONF_ENTITY_MODE, ENTITY_MODE_SENSORS, ENTITY_MODE_SUMMARY
+
+    flow = MaxMinConfigFlow()
+    flow.hass = Mock()
+    user_schema = (await flow.async_step_user())["data_schema"].schema
+
+    config_entry = MagicMock()
+    config_entry.options = {CONF_ENTITY_MODE: ENTITY_MODE_SUMMARY}
+    config_entry.data = {CONF_SENSOR_ENTITY: "sensor.test"}
+    options_flow = MaxMinOptionsFlow(config_entry)
+    options_flow.hass = Mock()
+    options_schema = (await options_flow.async_step_init())["data_schema"].schema
+
+    def _default(schema, name):
+        return next(key for key in schema if isinstance(key, vol.Marker) and key.schema == name).default()
+
+    assert _default(user_schema, CONF_ENTITY_MODE) == ENTITY_MODE_SENSORS
+    assert _default(options_schema, CONF_ENTITY_MODE) == ENTITY_MODE_SUMMARY
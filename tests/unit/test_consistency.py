@@ -3,7 +3,7 @@
 
 import pytest
 from datetime import datetime, timezone
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, patch
 from conftest import make_config_entry, make_mock_hass
 
 from custom_components.max_min.coordinator import MaxMinDataUpdateCoordinator
@@ -166,3 +166,85 @@ def test_consistency_propagates_without_initial_override(hass):
     coordinator._check_consistency()
 
     assert coordinator.get_value(PERIOD_YEARLY, "max") == 15.0
+
+
+def test_propagation_targets_precomputed_per_entry(hass):
+    """Broader targets are built once and exclude surgical-reset pairs."""
+    entry = make_config_entry(
+        periods=[PERIOD_ALL_TIME, PERIOD_DAILY, PERIOD_MONTHLY],
+        types=[TYPE_MAX, TYPE_MIN],
+    )
+    entry.options = {CONF_RESET_HISTORY: ["monthly_max"]}
+
+    coordinator = MaxMinDataUpdateCoordinator(hass, entry)
+
+    assert coordinator._propagation_targets == {
+        PERIOD_DAILY: ((PERIOD_ALL_TIME,), (PERIOD_MONTHLY, PERIOD_ALL_TIME)),
+        PERIOD_MONTHLY: ((PERIOD_ALL_TIME,), (PERIOD_ALL_TIME,)),
+        PERIOD_ALL_TIME: ((), ()),
+    }
+
+
+def test_sensor_update_pushes_only_changed_extreme(hass):
+    """A new daily max reaches broader periods without a full sweep."""
+    entry = make_config_entry(periods=[PERIOD_DAILY, PERIOD_WEEKLY, PERIOD_ALL_TIME])
+    coordinator = MaxMinDataUpdateCoordinator(hass, entry)
+    coordinator.async_set_updated_data = Mock()
+    now = datetime(2026, 3, 18, 12, tzinfo=timezone.utc)
+    for period, data in coordinator.tracked_data.items():
+        data.update({"max": 20.0, "min": 5.0, "start": 5.0, "end": 10.0,
+                     "last_reset": coordinator._get_period_start(now, period)})
+
+    event = Mock(data={"new_state": Mock(state="25.0", attributes={})})
+    with patch("custom_components.max_min.coordinator.dt_util.now", return_value=now), \
+         patch.object(coordinator, "_check_consistency") as full_sweep, \
+         patch.object(coordinator, "_should_skip_history") as skip_check:
+        coordinator._handle_sensor_change(event)
+
+    full_sweep.assert_not_called()
+    skip_check.assert_not_called()
+    assert coordinator.get_value(PERIOD_WEEKLY, "max") == 25.0
+    assert coordinator.get_value(PERIOD_ALL_TIME, "max") == 25.0
+    assert coordinator.get_value(PERIOD_ALL_TIME, "min") == 5.0
+    assert (PERIOD_ALL_TIME, "min") not in coordinator._pending_changes
+
+
+def test_restore_pushes_only_restored_type(hass):
+    """A restored min propagates outwards without touching max."""
+    entry = make_config_entry(periods=[PERIOD_DAILY, PERIOD_YEARLY])
+    coordinator = MaxMinDataUpdateCoordinator(hass, entry)
+    coordinator.tracked_data[PERIOD_DAILY]["max"] = 50.0
+
+    coordinator.update_restored_data(PERIOD_DAILY, "min", -2.0)
+
+    assert coordinator.get_value(PERIOD_YEARLY, "min") == -2.0
+    assert coordinator.tracked_data[PERIOD_YEARLY]["max"] is None
+
+
+def test_straddling_week_does_not_leak_into_fresh_month(hass):
+    """Without roll-up, a week begun last month keeps its extremes out of the new month."""
+    entry = make_config_entry(periods=[PERIOD_WEEKLY, PERIOD_MONTHLY, PERIOD_ALL_TIME])
+    coordinator = MaxMinDataUpdateCoordinator(hass, entry)
+    coordinator.async_set_updated_data = Mock()
+    # Wednesday 1 April: the week started on Monday 30 March, the month today.
+    now = datetime(2026, 4, 1, 12, tzinfo=timezone.utc)
+    for period, data in coordinator.tracked_data.items():
+        data.update({"max": 10.0, "min": 10.0, "start": 10.0, "end": 10.0,
+                     "last_reset": coordinator._get_period_start(now, period)})
+    coordinator.tracked_data[PERIOD_ALL_TIME].update({"max": 40.0, "min": 1.0})
+
+    coordinator.update_restored_data(PERIOD_WEEKLY, "max", 30.0)
+    coordinator.update_restored_data(PERIOD_WEEKLY, "min", 2.0)
+    coordinator._check_consistency()
+
+    assert coordinator.get_value(PERIOD_MONTHLY, "max") == 10.0
+    assert coordinator.get_value(PERIOD_MONTHLY, "min") == 10.0
+    # All-time spans both windows and still takes the week's extremes.
+    coordinator.update_restored_data(PERIOD_WEEKLY, "max", 45.0)
+    assert coordinator.get_value(PERIOD_ALL_TIME, "max") == 45.0
+
+    # A week that began within the month keeps propagating into it.
+    coordinator.tracked_data[PERIOD_WEEKLY]["last_reset"] = datetime(2026, 4, 6, tzinfo=timezone.utc)
+    coordinator._check_consistency()
+    assert coordinator.get_value(PERIOD_MONTHLY, "max") == 45.0
+    assert coordinator.get_value(PERIOD_MONTHLY, "min") == 2.0
@@ -7,7 +7,7 @@ import pytest
 from freezegun import freeze_time
 from conftest import make_config_entry
 
-from custom_components.max_min.coordinator import MaxMinDataUpdateCoordinator
+from custom_components.max_min.coordinator import MaxMinDataUpdateCoordinator, SourceMetadata
 from custom_components.max_min.const import (
     CONF_PERIODS,
     CONF_SENSOR_ENTITY,
@@ -806,3 +806,185 @@ async def test_coordinator_unload_clears_reset_listener_state(hass):
     unsub.assert_called_once()
     assert coordinator._reset_listeners == {}
     assert coordinator._unsub_sensor_state_listener is None
+
+
+def test_period_bounds_cached_until_boundary(hass):
+    """The boundary table is reused inside a period and rebuilt after it."""
+    coordinator = MaxMinDataUpdateCoordinator(hass, make_config_entry())
+    morning = datetime(2026, 3, 18, 8, 0, 0, tzinfo=timezone.utc)
+    evening = datetime(2026, 3, 18, 20, 0, 0, tzinfo=timezone.utc)
+    next_day = datetime(2026, 3, 19, 0, 0, 0, tzinfo=timezone.utc)
+
+    with patch.object(
+        MaxMinDataUpdateCoordinator,
+        "_get_period_start",
+        wraps=MaxMinDataUpdateCoordinator._get_period_start,
+    ) as mock_start:
+        first = coordinator._get_period_bounds(morning, PERIOD_DAILY)
+        assert coordinator._get_period_bounds(evening, PERIOD_DAILY) is first
+        assert mock_start.call_count == 1
+
+        rolled = coordinator._get_period_bounds(next_day, PERIOD_DAILY)
+        assert mock_start.call_count == 2
+
+    assert first[:2] == (
+        datetime(2026, 3, 18, tzinfo=timezone.utc).timestamp(),
+        next_day.timestamp(),
+    )
+    assert rolled[2] == next_day
+
+
+def test_reset_check_hot_path_skips_period_math(hass):
+    """A verified last_reset makes the per-event check a float comparison."""
+    coordinator = MaxMinDataUpdateCoordinator(hass, make_config_entry())
+    now = datetime(2026, 3, 18, 8, 0, 0, tzinfo=timezone.utc)
+    coordinator.tracked_data[PERIOD_DAILY]["last_reset"] = datetime(2026, 3, 18, tzinfo=timezone.utc)
+
+    assert coordinator._is_reset_due(now, PERIOD_DAILY) is False
+    with patch.object(coordinator, "_get_period_bounds") as mock_bounds:
+        assert coordinator._is_reset_due(now, PERIOD_DAILY) is False
+    mock_bounds.assert_not_called()
+
+    # Replacing last_reset (restore, tests, reset) invalidates the shortcut.
+    coordinator.tracked_data[PERIOD_DAILY]["last_reset"] = datetime(2026, 3, 17, tzinfo=timezone.utc)
+    assert coordinator._is_reset_due(now, PERIOD_DAILY) is True
+
+
+def _publish_window_coordinator(hass, **options):
+    """Build a coordinator with a publish interval and a current daily period."""
+    coordinator = MaxMinDataUpdateCoordinator(hass, make_config_entry(options=options))
+    coordinator.tracked_data[PERIOD_DAILY].update(
+        {"max": 20.0, "min": 5.0, "start": 5.0, "end": 10.0,
+         "last_reset": datetime(2026, 3, 18, tzinfo=timezone.utc)}
+    )
+    coordinator.async_set_updated_data = Mock()
+    return coordinator
+
+
+def _event(value):
+    return Mock(data={"new_state": Mock(state=value, attributes={})})
+
+
+@freeze_time("2026-03-18 12:00:00")
+def test_publish_interval_coalesces_state_writes(hass):
+    """Inside the window tracked_data is exact but entities are notified once."""
+    coordinator = _publish_window_coordinator(hass, publish_interval=60)
+
+    with patch("custom_components.max_min.coordinator.time.monotonic", side_effect=[100.0, 110.0, 120.0]), \
+         patch("custom_components.max_min.coordinator.async_call_later") as mock_later:
+        coordinator._handle_sensor_change(_event("11.0"))  # first event publishes
+        coordinator._handle_sensor_change(_event("12.0"))  # deferred
+        coordinator._handle_sensor_change(_event("13.0"))  # still deferred, timer reused
+
+    assert coordinator.async_set_updated_data.call_count == 1
+    assert coordinator.get_value(PERIOD_DAILY, "end") == 13.0
+    mock_later.assert_called_once()
+    assert mock_later.call_args[0][1] == 50.0
+
+    flush = mock_later.call_args[0][2]
+    with patch("custom_components.max_min.coordinator.time.monotonic", return_value=160.0):
+        flush(None)
+    assert coordinator.async_set_updated_data.call_count == 2
+    assert coordinator._pending_changes == set()
+
+
+@freeze_time("2026-03-18 12:00:00")
+def test_publish_interval_extremes_flush_immediately_when_enabled(hass):
+    """A new extreme bypasses the window only when the option is set."""
+    for publish_extremes, expected_calls in ((False, 1), (True, 2)):
+        coordinator = _publish_window_coordinator(
+            hass, publish_interval=60, publish_extremes_immediately=publish_extremes
+        )
+        with patch("custom_components.max_min.coordinator.time.monotonic", return_value=100.0), \
+             patch("custom_components.max_min.coordinator.async_call_later"):
+            coordinator._handle_sensor_change(_event("11.0"))
+            coordinator._handle_sensor_change(_event("25.0"))
+
+        assert coordinator.async_set_updated_data.call_count == expected_calls
+
+
+@freeze_time("2026-03-18 12:00:00")
+def test_publish_interval_reset_flushes_and_cancels_timer(hass):
+    """A period reset publishes at once, including deferred changes."""
+    coordinator = _publish_window_coordinator(hass, publish_interval=60)
+    timer_unsub = Mock()
+
+    with patch("custom_components.max_min.coordinator.time.monotonic", return_value=100.0), \
+         patch("custom_components.max_min.coordinator.async_call_later", return_value=timer_unsub):
+        coordinator._handle_sensor_change(_event("11.0"))
+        coordinator._handle_sensor_change(_event("12.0"))
+        assert coordinator.async_set_updated_data.call_count == 1
+
+        with patch("custom_components.max_min.coordinator.async_track_point_in_time"):
+            coordinator._perform_reset(datetime(2026, 3, 19, tzinfo=timezone.utc), PERIOD_DAILY)
+
+    assert coordinator.async_set_updated_data.call_count == 2
+    timer_unsub.assert_called_once()
+    assert coordinator._unsub_publish_timer is None
+
+
+@freeze_time("2026-03-18 12:00:00")
+def test_repeat_source_state_skipped_until_something_relevant_changes(hass):
+    """Attribute-only repeats are skipped; mode changes and resets are not."""
+    coordinator = _publish_window_coordinator(hass)
+
+    coordinator._handle_sensor_change(_event("11.0"))
+    coordinator._handle_sensor_change(_event("11.0"))  # attribute-only repeat
+    assert coordinator.event_stats == {"processed": 1, "skipped": 1}
+    assert coordinator.async_set_updated_data.call_count == 1
+
+    # state_class switching to total must still re-sync cumulative mode
+    cumulative = Mock(data={"new_state": Mock(state="11.0", attributes={"state_class": "total"})})
+    with patch.object(coordinator, "_schedule_resets"):
+        coordinator._handle_sensor_change(cumulative)
+    assert coordinator._source_is_cumulative is True
+    assert coordinator.event_stats == {"processed": 2, "skipped": 1}
+
+    # A reset marks the period for re-anchoring, so the same string is processed
+    with patch.object(coordinator, "_schedule_single_reset"):
+        coordinator._perform_reset(datetime(2026, 3, 18, 12, tzinfo=timezone.utc), PERIOD_DAILY, reason="test")
+    with patch.object(coordinator, "_schedule_resets"):
+        coordinator._handle_sensor_change(cumulative)
+    assert coordinator.event_stats["processed"] == 3
+    assert PERIOD_DAILY not in coordinator._pending_start_reanchor
+
+
+def test_repeat_source_state_processed_after_boundary(hass):
+    """A repeated state after midnight still triggers the inline reset."""
+    coordinator = _publish_window_coordinator(hass)
+
+    with freeze_time("2026-03-18 23:59:00"):
+        coordinator._handle_sensor_change(_event("11.0"))
+    with freeze_time("2026-03-19 00:00:05"):
+        coordinator._handle_sensor_change(_event("11.0"))
+
+    assert coordinator.event_stats == {"processed": 2, "skipped": 0}
+    assert coordinator.tracked_data[PERIOD_DAILY]["last_reset"] == datetime(2026, 3, 19, tzinfo=timezone.utc)
+    assert coordinator.get_value(PERIOD_DAILY, "max") == 11.0
+
+
+@freeze_time("2026-03-18 12:00:00")
+def test_source_metadata_cached_from_events(hass):
+    """Unit/device_class/state_class come from events, keeping the last known unit."""
+    coordinator = _publish_window_coordinator(hass)
+    assert coordinator.source_metadata == SourceMetadata()
+
+    attrs = {"unit_of_measurement": "°C", "device_class": "temperature", "state_class": "measurement"}
+    coordinator._handle_sensor_change(Mock(data={"new_state": Mock(state="11.0", attributes=attrs)}))
+    assert coordinator.source_metadata == SourceMetadata("°C", "temperature", "measurement")
+
+    # Attribute-only change on a repeated state is skipped but still refreshes the cache
+    coordinator._handle_sensor_change(Mock(data={"new_state": Mock(state="11.0", attributes={**attrs, "unit_of_measurement": "°F"})}))
+    assert coordinator.event_stats["skipped"] == 1
+    assert coordinator.source_metadata.unit == "°F"
+
+    # An unavailable source does not clear the unit
+    coordinator._handle_sensor_change(Mock(data={"new_state": Mock(state="unavailable", attributes={"unit_of_measurement": "K"})}))
+    assert coordinator.source_metadata.unit == "°F"
+
+    # Unchanged attributes object: no re-read
+    same = Mock(state="12.0", attributes=attrs)
+    coordinator._refresh_source_metadata(same)
+    coordinator.source_metadata = SourceMetadata()
+    coordinator._refresh_source_metadata(same)
+    assert coordinator.source_metadata == SourceMetadata()
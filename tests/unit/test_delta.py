@@ -253,6 +253,9 @@ async def test_legacy_migration_does_not_corrupt_after_reset(hass):
     with patch(
         "custom_components.max_min.sensor.RestoreEntity.async_get_last_state",
         return_value=mock_last_state,
+    ), patch(
+        "custom_components.max_min.sensor.RestoreEntity.async_get_last_extra_data",
+        return_value=None,
     ):
         await sensor.async_added_to_hass()
 
@@ -481,7 +484,7 @@ async def test_delta_sensor_async_added_to_hass(hass):
 
 
 def test_delta_sensor_device_class_with_attributes(hass):
-    """DeltaSensor.device_class reads from source entity attributes."""
+    """DeltaSensor.device_class reads the coordinator's cached source attributes."""
     entry = MockConfigEntry(
         domain=DOMAIN,
         data={
@@ -493,10 +496,10 @@ def test_delta_sensor_device_class_with_attributes(hass):
         unique_id="sensor.test",
     )
     coordinator = MaxMinDataUpdateCoordinator(hass, entry)
-    hass.states.get.return_value = Mock(
+    coordinator._refresh_source_metadata(Mock(
         state="10.0",
         attributes={"device_class": "temperature"},
-    )
+    ))
     sensor = DeltaSensor(coordinator, entry, "Test Delta", PERIOD_DAILY)
     assert sensor.device_class == "temperature"
 
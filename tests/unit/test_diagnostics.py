@@ -0,0 +1,36 @@
+"""Test diagnostics."""
+
+from unittest.mock import Mock
+
+import pytest
+from homeassistant.util import dt as dt_util
+from conftest import make_config_entry
+
+from custom_components.max_min.const import DOMAIN, PERIOD_DAILY
+from custom_components.max_min.coordinator import MaxMinDataUpdateCoordinator
+from custom_components.max_min.diagnostics import async_get_config_entry_diagnostics
+from custom_components.max_min.watchdog import MaxMinWatchdog
+
+
+@pytest.mark.asyncio
+async def test_config_entry_diagnostics(hass):
+    """Diagnostics expose tracked data, event counters and watchdog stats."""
+    entry = make_config_entry()
+    coordinator = MaxMinDataUpdateCoordinator(hass, entry)
+    coordinator.async_set_updated_data = Mock()
+    coordinator.tracked_data[PERIOD_DAILY]["last_reset"] = coordinator._get_period_start(dt_util.now(), PERIOD_DAILY)
+    entry.runtime_data = coordinator
+    hass.data[DOMAIN] = {"watchdog": MaxMinWatchdog(hass)}
+
+    event = Mock(data={"new_state": Mock(state="12.5", attributes={})})
+    coordinator._handle_sensor_change(event)
+    coordinator._handle_sensor_change(event)
+
+    result = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert result["entry"]["title"] == "Test Entry"
+    assert result["coordinator"]["source_entity"] == "sensor.test"
+    assert result["coordinator"]["tracked_data"][PERIOD_DAILY]["max"] == 12.5
+    assert result["coordinator"]["source_events"] == {"processed": 1, "skipped": 1}
+    assert result["watchdog"]["coordinators"] == 0
+    assert result["source_hub"] is None
@@ -18,6 +18,14 @@ def hass():
     return hass
 
 
+@pytest.fixture(autouse=True)
+def mock_store():
+    """Replace the on-disk tracker store with an empty in-memory one."""
+    with patch("custom_components.max_min.store.Store") as store_cls:
+        store_cls.return_value.async_load = AsyncMock(return_value=None)
+        yield store_cls.return_value
+
+
 @pytest.mark.asyncio
 async def test_async_setup(hass):
     """Test async setup."""
@@ -35,6 +43,7 @@ async def test_async_setup_entry_success(hass):
     # Mock coordinator
     mock_coordinator = Mock()
     mock_coordinator.async_config_entry_first_refresh = AsyncMock()
+    mock_coordinator.watchdog_due = None
 
     with patch("custom_components.max_min.MaxMinDataUpdateCoordinator", return_value=mock_coordinator):
         hass.config_entries.async_forward_entry_setups = AsyncMock()
@@ -55,6 +64,7 @@ async def test_async_setup_entry_forward_failure(hass):
 
     mock_coordinator = Mock()
     mock_coordinator.async_config_entry_first_refresh = AsyncMock()
+    mock_coordinator.watchdog_due = None
 
     with patch("custom_components.max_min.MaxMinDataUpdateCoordinator", return_value=mock_coordinator):
         hass.config_entries.async_forward_entry_setups = AsyncMock(side_effect=Exception("Forward failed"))
@@ -102,10 +112,27 @@ async def test_async_reload_entry(hass):
     
     config_entry = Mock()
     config_entry.entry_id = "test_entry"
+    config_entry.options = {CONF_RESET_HISTORY: ["daily_max"]}
     hass.config_entries.async_reload = AsyncMock()
 
     await async_reload_entry(hass, config_entry)
     hass.config_entries.async_reload.assert_called_once_with("test_entry")
+    config_entry.runtime_data.apply_options.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_reload_entry_applies_options_in_place(hass):
+    """Options without a surgical reset are applied to the live coordinator."""
+    from custom_components.max_min import async_reload_entry
+
+    config_entry = Mock()
+    config_entry.entry_id = "test_entry"
+    config_entry.options = {"periods": ["daily", "weekly"]}
+    hass.config_entries.async_reload = AsyncMock()
+
+    await async_reload_entry(hass, config_entry)
+    hass.config_entries.async_reload.assert_not_called()
+    config_entry.runtime_data.apply_options.assert_called_once_with()
 
 
 @pytest.mark.asyncio
@@ -123,6 +150,7 @@ async def test_reset_history_cleaned_before_listener(hass):
 
     mock_coordinator = Mock()
     mock_coordinator.async_config_entry_first_refresh = AsyncMock()
+    mock_coordinator.watchdog_due = None
 
     # Track the order of operations
     call_order = []
@@ -154,4 +182,59 @@ async def test_reset_history_cleaned_before_listener(hass):
     # Verify CONF_RESET_HISTORY was actually removed from options
     hass.config_entries.async_update_entry.assert_called_once()
     _, kwargs = hass.config_entries.async_update_entry.call_args
-    assert CONF_RESET_HISTORY not in kwargs.get("options", {})
\ No newline at end of file
+    assert CONF_RESET_HISTORY not in kwargs.get("options", {})
+
+
+@pytest.mark.asyncio
+async def test_setup_entry_registers_with_shared_watchdog(hass):
+    """All entries share one domain watchdog; unload callback unregisters."""
+    hass.data = {}
+    entries = []
+    for entry_id in ("entry_a", "entry_b"):
+        config_entry = Mock()
+        config_entry.entry_id = entry_id
+        config_entry.data = {"sensor_entity": "sensor.test", "types": ["max"], "periods": ["daily"]}
+        config_entry.options = {}
+        mock_coordinator = Mock()
+        mock_coordinator.async_config_entry_first_refresh = AsyncMock()
+        mock_coordinator.watchdog_due = None
+        mock_coordinator.config_entry = config_entry
+
+        with patch("custom_components.max_min.MaxMinDataUpdateCoordinator", return_value=mock_coordinator):
+            assert await async_setup_entry(hass, config_entry) is True
+        entries.append(config_entry)
+
+    watchdog = hass.data[DOMAIN]["watchdog"]
+    assert watchdog.stats["coordinators"] == 2
+
+    # First async_on_unload registration is the watchdog unregister callback
+    entries[0].async_on_unload.call_args_list[0][0][0]()
+    assert watchdog.stats["coordinators"] == 1
+
+
+@pytest.mark.asyncio
+async def test_setup_entry_commits_restore_batch_before_listeners(hass):
+    """Restores are staged during platform setup and committed before listeners start."""
+    config_entry = Mock()
+    config_entry.entry_id = "test_entry"
+    config_entry.data = {"sensor_entity": "sensor.test", "types": ["max"], "periods": ["daily"]}
+    config_entry.options = {}
+
+    calls = []
+    mock_coordinator = Mock()
+    mock_coordinator.async_config_entry_first_refresh = AsyncMock()
+    mock_coordinator.watchdog_due = None
+    mock_coordinator.config_entry = config_entry
+    mock_coordinator.begin_restore_batch.side_effect = lambda: calls.append("begin")
+    mock_coordinator.commit_restore_batch.side_effect = lambda: calls.append("commit")
+    mock_coordinator.start_listeners.side_effect = lambda *_: calls.append("listeners")
+
+    async def forward(*_args):
+        calls.append("platforms")
+
+    with patch("custom_components.max_min.MaxMinDataUpdateCoordinator", return_value=mock_coordinator):
+        hass.config_entries.async_forward_entry_setups = forward
+        hass.data = {}
+        assert await async_setup_entry(hass, config_entry) is True
+
+    assert calls == ["begin", "platforms", "commit", "listeners"]
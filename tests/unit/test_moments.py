@@ -0,0 +1,108 @@
+"""Tests for the count / mean / std types (moments.py and its coordinator wiring)."""
+
+from datetime import datetime, timedelta, timezone
+import random
+import statistics
+from unittest.mock import patch
+
+import pytest
+from conftest import make_coordinator, make_mock_hass
+
+from custom_components.max_min.const import (
+    PERIOD_DAILY,
+    PERIOD_WEEKLY,
+    TYPE_COUNT,
+    TYPE_MAX,
+    TYPE_MEAN,
+    TYPE_STD,
+)
+from custom_components.max_min.moments import RunningMoments
+
+NOW = datetime(2026, 3, 11, 12, 0, tzinfo=timezone.utc)
+PERIODS = [PERIOD_DAILY, PERIOD_WEEKLY]
+TYPES = [TYPE_MAX, TYPE_COUNT, TYPE_MEAN, TYPE_STD]
+
+
+def test_welford_matches_two_pass_statistics():
+    """Online mean and sample std match a two-pass computation, even with a large offset."""
+    rng = random.Random(5)
+    values = [1e6 + rng.uniform(-1.0, 1.0) for _ in range(5000)]
+    moments = RunningMoments()
+    assert (moments.count, moments.std) == (0, None)
+    for value in values:
+        moments.add(value)
+
+    assert moments.count == len(values)
+    assert moments.mean == pytest.approx(statistics.fmean(values), rel=1e-12)
+    assert moments.std == pytest.approx(statistics.stdev(values), rel=1e-6)
+    restored = RunningMoments.from_list(moments.as_list())
+    assert restored.as_list() == moments.as_list()
+    assert RunningMoments.from_list([1, 2.0]) is None
+
+
+def test_coordinator_moments_update_reset_and_restore():
+    """Every reading updates each period; restore keeps the (n, mean, M2) triple."""
+    hass = make_mock_hass(state="6.0")
+    coordinator = make_coordinator(hass, PERIODS, TYPES, now=NOW)
+    published = []
+    coordinator.async_set_updated_data.side_effect = lambda _data: published.append(coordinator.changed_keys)
+    for minute, value in enumerate((2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0)):
+        coordinator._handle_source_value(value, NOW + timedelta(minutes=minute))
+
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_COUNT) == 8
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_MEAN) == 5.0
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_STD) == pytest.approx(2.1381, abs=1e-4)
+    assert {(PERIOD_DAILY, TYPE_COUNT), (PERIOD_DAILY, TYPE_STD)} <= published[-1]
+    records = coordinator.get_restore_records()
+    assert records[PERIOD_DAILY]["moments"] == [8, 5.0, 32.0]
+
+    coordinator._perform_reset(NOW + timedelta(hours=12), PERIOD_DAILY)
+    # Restarted from the reset seed (the current source value).
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_COUNT) == 1
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_MEAN) == 6.0
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_STD) is None
+    assert coordinator.get_value(PERIOD_WEEKLY, TYPE_COUNT) == 8
+
+    restored = make_coordinator(hass, PERIODS, TYPES, now=NOW)
+    with patch("custom_components.max_min.coordinator.dt_util.now", return_value=NOW + timedelta(hours=2)):
+        restored.restore_stored_records(records)
+    restored._handle_source_value(5.0, NOW + timedelta(hours=2))
+    assert restored.get_value(PERIOD_DAILY, TYPE_COUNT) == 9
+    assert restored.get_value(PERIOD_DAILY, TYPE_MEAN) == 5.0
+
+
+def test_reset_while_source_unavailable_does_not_count_seed():
+    """The fallback seed (last end value) is not counted as a reading."""
+    hass = make_mock_hass(state="unavailable")
+    coordinator = make_coordinator(hass, PERIODS, TYPES, now=NOW)
+    for minute, value in enumerate((2.0, 4.0, 9.0)):
+        coordinator._handle_source_value(value, NOW + timedelta(minutes=minute))
+
+    coordinator._perform_reset(NOW + timedelta(hours=12), PERIOD_DAILY)
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_COUNT) == 0
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_MEAN) is None
+
+    for minute, value in enumerate((10.0, 11.0)):
+        coordinator._handle_source_value(value, NOW + timedelta(hours=12, minutes=minute + 1))
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_COUNT) == 2
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_MEAN) == 10.5
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_STD) == pytest.approx(0.7071, abs=1e-4)
+    assert coordinator.get_value(PERIOD_WEEKLY, TYPE_COUNT) == 5
+
+
+def test_reset_with_stale_source_state_does_not_count_seed():
+    """A source state from the previous period is no reading of the new one."""
+    hass = make_mock_hass(state="3.0")
+    state = hass.states.get.return_value
+    state.last_reported = state.last_updated = state.last_changed = NOW
+    coordinator = make_coordinator(hass, PERIODS, TYPES, now=NOW)
+    for minute, value in enumerate((2.0, 4.0, 3.0)):
+        coordinator._handle_source_value(value, NOW + timedelta(minutes=minute))
+
+    coordinator._perform_reset(NOW + timedelta(hours=12), PERIOD_DAILY)
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_COUNT) == 0
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_MEAN) is None
+
+    coordinator._handle_source_value(5.0, NOW + timedelta(hours=12, minutes=1))
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_COUNT) == 1
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_MEAN) == 5.0
@@ -767,7 +767,8 @@ async def test_nr20_delta_legacy_state_migration(hass):
         }
     )
 
-    with patch("custom_components.max_min.sensor.RestoreEntity.async_get_last_state", return_value=mock_last_state):
+    with patch("custom_components.max_min.sensor.RestoreEntity.async_get_last_state", return_value=mock_last_state), \
+         patch("custom_components.max_min.sensor.RestoreEntity.async_get_last_extra_data", return_value=None):
         await sensor.async_added_to_hass()
 
     # Legacy migration removed (was harmful — corrupted start after resets).
@@ -793,7 +794,8 @@ async def test_nr20_delta_legacy_state_migration(hass):
     # Reset coordinator data
     coord.tracked_data["weekly"] = {"max": None, "min": None, "start": None, "end": None, "last_reset": None}
 
-    with patch("custom_components.max_min.sensor.RestoreEntity.async_get_last_state", return_value=mock_last_state_migrated):
+    with patch("custom_components.max_min.sensor.RestoreEntity.async_get_last_state", return_value=mock_last_state_migrated), \
+         patch("custom_components.max_min.sensor.RestoreEntity.async_get_last_extra_data", return_value=None):
         await sensor.async_added_to_hass()
 
     # Restored as-is
@@ -838,7 +840,8 @@ async def test_nr21_delta_legacy_state_migration_partial_restore(hass):
         }
     )
 
-    with patch("custom_components.max_min.sensor.RestoreEntity.async_get_last_state", return_value=mock_last_state_start_only):
+    with patch("custom_components.max_min.sensor.RestoreEntity.async_get_last_state", return_value=mock_last_state_start_only), \
+         patch("custom_components.max_min.sensor.RestoreEntity.async_get_last_extra_data", return_value=None):
         await sensor.async_added_to_hass()
 
     assert coord.tracked_data["weekly"]["start"] == 1000.0
@@ -858,7 +861,8 @@ async def test_nr21_delta_legacy_state_migration_partial_restore(hass):
         }
     )
 
-    with patch("custom_components.max_min.sensor.RestoreEntity.async_get_last_state", return_value=mock_last_state_end_only):
+    with patch("custom_components.max_min.sensor.RestoreEntity.async_get_last_state", return_value=mock_last_state_end_only), \
+         patch("custom_components.max_min.sensor.RestoreEntity.async_get_last_extra_data", return_value=None):
         await sensor.async_added_to_hass()
 
     assert coord.tracked_data["weekly"]["start"] is None
@@ -900,7 +904,8 @@ async def test_nr22_delta_restore_reconstructs_boundaries_when_attrs_missing(has
         },
     )
 
-    with patch("custom_components.max_min.sensor.RestoreEntity.async_get_last_state", return_value=mock_last_state):
+    with patch("custom_components.max_min.sensor.RestoreEntity.async_get_last_state", return_value=mock_last_state), \
+         patch("custom_components.max_min.sensor.RestoreEntity.async_get_last_extra_data", return_value=None):
         await sensor.async_added_to_hass()
 
     assert coord.tracked_data["weekly"]["end"] == pytest.approx(121.6)
@@ -939,7 +944,8 @@ async def test_nr23_delta_restore_reconstructs_without_last_reset(hass):
         },
     )
 
-    with patch("custom_components.max_min.sensor.RestoreEntity.async_get_last_state", return_value=mock_last_state):
+    with patch("custom_components.max_min.sensor.RestoreEntity.async_get_last_state", return_value=mock_last_state), \
+         patch("custom_components.max_min.sensor.RestoreEntity.async_get_last_extra_data", return_value=None):
         await sensor.async_added_to_hass()
 
     assert coord.tracked_data["weekly"]["end"] == pytest.approx(240.5)
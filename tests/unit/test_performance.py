@@ -0,0 +1,213 @@
+"""Cost guards for coordinator hot paths.
+
+Each test counts the work an optimisation avoids (calls into the slow
+path, rebuilt objects, record sizes) instead of timing it, so the
+assertions are deterministic under coverage and on loaded CI runners.
+"""
+
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from conftest import make_config_entry, make_mock_hass
+from custom_components.max_min.coordinator import MaxMinDataUpdateCoordinator
+from custom_components.max_min.const import (
+    CONF_ROLLUP,
+    PERIOD_ALL_TIME,
+    PERIOD_DAILY,
+    PERIOD_MONTHLY,
+    PERIOD_WEEKLY,
+    PERIOD_YEARLY,
+)
+from custom_components.max_min.period_state import PeriodState
+
+ALL_PERIODS = [PERIOD_DAILY, PERIOD_WEEKLY, PERIOD_MONTHLY, PERIOD_YEARLY, PERIOD_ALL_TIME]
+NOW = datetime(2026, 3, 18, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _seeded_coordinator(**options):
+    """Build a 5-period coordinator whose periods are all current at NOW."""
+    coordinator = MaxMinDataUpdateCoordinator(
+        make_mock_hass(), make_config_entry(periods=ALL_PERIODS, options=options)
+    )
+    coordinator.async_set_updated_data = Mock()
+    for period in ALL_PERIODS:
+        coordinator.tracked_data[period].update(
+            {
+                "max": 20.0,
+                "min": 5.0,
+                "start": 5.0,
+                "end": 10.0,
+                "last_reset": MaxMinDataUpdateCoordinator._get_period_start(NOW, period),
+            }
+        )
+    return coordinator
+
+
+def _spy(coordinator, name):
+    """Wrap a coordinator method in a Mock that still calls it."""
+    spy = Mock(wraps=getattr(coordinator, name))
+    setattr(coordinator, name, spy)
+    return spy
+
+
+def _event(value):
+    return SimpleNamespace(data={"new_state": SimpleNamespace(state=str(value), attributes={})})
+
+
+def test_reset_check_uses_boundary_table():
+    """Once the boundary table is warm, events compute no period boundary."""
+    coordinator = _seeded_coordinator()
+    get_period_start = _spy(coordinator, "_get_period_start")
+
+    with patch("custom_components.max_min.coordinator.dt_util.now", return_value=NOW):
+        coordinator._handle_sensor_change(_event(10.0))
+        warmed = get_period_start.call_count
+        for value in range(11, 111):
+            coordinator._handle_sensor_change(_event(value))
+
+    assert warmed > 0
+    assert get_period_start.call_count == warmed
+
+
+def test_repeat_state_prefilter():
+    """Attribute-only repeats of the last state skip parsing and the period walk."""
+    coordinator = _seeded_coordinator()
+    process = _spy(coordinator, "_process_source_state")
+
+    with patch("custom_components.max_min.coordinator.dt_util.now", return_value=NOW):
+        for _ in range(100):
+            coordinator._handle_sensor_change(_event(10.0))
+
+    assert process.call_count == 1
+    assert coordinator.events_skipped == 99
+
+
+def test_restore_burst_incremental_propagation():
+    """Startup restores push only the restored extreme instead of a full sweep."""
+    incremental = _seeded_coordinator()
+    swept = _seeded_coordinator()
+    check_consistency = _spy(incremental, "_check_consistency")
+
+    with patch("custom_components.max_min.coordinator.dt_util.now", return_value=NOW):
+        for period, value in zip(ALL_PERIODS, (30.0, 25.0, 22.0, 21.0, 20.5)):
+            for coordinator in (incremental, swept):
+                coordinator.update_restored_data(period, "max", value)
+                coordinator.update_restored_data(period, "min", 30.0 - value)
+            swept._check_consistency()
+
+    check_consistency.assert_not_called()
+    assert incremental.tracked_data == swept.tracked_data
+
+
+def test_period_state_memory():
+    """Slotted period records are smaller than the old 7-key dicts."""
+    as_dict = {
+        "max": 20.0,
+        "min": 5.0,
+        "start": 5.0,
+        "end": 10.0,
+        "last_reset": NOW,
+        "last_reset_reason": None,
+        "last_reset_triggered_at": None,
+    }
+    record = PeriodState(last_reset=NOW, max=20.0, min=5.0, start=5.0, end=10.0)
+
+    assert not hasattr(record, "__dict__")
+    assert sys.getsizeof(record) < sys.getsizeof(as_dict)
+
+
+def _bytes_per_tracker(make_record, trackers=1000):
+    """Allocated bytes per tracker for ``trackers`` x 5 period records."""
+    # The float values exist up front, so only the records are measured.
+    values = [(20.0 + i, 5.0 + i, 5.0 + i, 10.0 + i) for i in range(trackers)]
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        records = [[make_record(*row) for _ in ALL_PERIODS] for row in values]
+        allocated = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    assert len(records) == trackers
+    return allocated / trackers
+
+
+def test_period_state_memory_per_tracker():
+    """1,000 entries x 5 periods: slotted records take well under half the dicts' memory."""
+    as_dicts = _bytes_per_tracker(
+        lambda high, low, start, end: {
+            "max": high,
+            "min": low,
+            "start": start,
+            "end": end,
+            "last_reset": NOW,
+            "last_reset_reason": None,
+            "last_reset_triggered_at": None,
+        }
+    )
+    as_records = _bytes_per_tracker(
+        lambda high, low, start, end: PeriodState(
+            last_reset=NOW, max=high, min=low, start=start, end=end
+        )
+    )
+
+    # About 1.5 kB vs 0.6 kB per tracker on CPython 3.13.
+    assert as_records < as_dicts / 2
+
+
+def test_rollup_per_event():
+    """With roll-up only the daily period takes the raw sample."""
+    calls = {}
+    for rollup in (False, True):
+        coordinator = _seeded_coordinator(**{CONF_ROLLUP: rollup})
+        update = _spy(coordinator, "_update_period_normal")
+        with patch("custom_components.max_min.coordinator.dt_util.now", return_value=NOW):
+            # Rising values: every event is a new max, the worst case for raw mode.
+            for value in range(21, 121):
+                coordinator._handle_sensor_change(_event(value))
+        calls[rollup] = update.call_count
+        assert coordinator.get_value(PERIOD_YEARLY, "max") == 120.0
+
+    assert calls == {False: 100 * len(ALL_PERIODS), True: 100}
+
+
+def test_attribute_snapshot_reused():
+    """Attribute snapshots are rebuilt only when the rendered fields change."""
+    coordinator = _seeded_coordinator()
+    coordinator.tracked_data[PERIOD_DAILY].update(
+        {"last_reset_reason": "scheduled", "last_reset_triggered_at": NOW}
+    )
+
+    snapshot = coordinator.get_attribute_snapshot(PERIOD_DAILY)
+    assert snapshot.attributes["last_reset_reason"] == "scheduled"
+    for value in range(100):
+        # end changes on every reading; the max/min snapshot must not follow.
+        coordinator.tracked_data[PERIOD_DAILY].end = float(value)
+        assert coordinator.get_attribute_snapshot(PERIOD_DAILY) is snapshot
+        assert coordinator.get_delta_attributes(PERIOD_DAILY)["end_value"] == float(value)
+
+    coordinator.tracked_data[PERIOD_DAILY].last_reset_reason = "watchdog"
+    assert coordinator.get_attribute_snapshot(PERIOD_DAILY) is not snapshot
+
+
+def test_restore_batch_validates_once_per_period():
+    """A staged restore computes "now" once and each period window once."""
+    coordinator = _seeded_coordinator()
+    records = [
+        (period, {field: value}, MaxMinDataUpdateCoordinator._get_period_start(NOW, period))
+        for period in ALL_PERIODS
+        for field, value in (("max", 30.0), ("min", 1.0), ("start", 2.0), ("end", 3.0))
+    ]
+    period_window = _spy(coordinator, "_period_window")
+
+    with patch("custom_components.max_min.coordinator.dt_util.now", return_value=NOW) as now:
+        coordinator.begin_restore_batch()
+        for period, values, last_reset in records:
+            coordinator.restore_period_record(period, values, last_reset)
+        coordinator.commit_restore_batch()
+
+    assert now.call_count == 1
+    assert period_window.call_count == len(ALL_PERIODS)
+    assert coordinator.tracked_data[PERIOD_DAILY].max == 30.0
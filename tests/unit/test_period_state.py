@@ -0,0 +1,65 @@
+"""Tests for the slotted per-period state record."""
+
+from datetime import datetime, timezone
+
+import pytest
+from conftest import make_config_entry, make_mock_hass
+
+from custom_components.max_min.const import PERIOD_DAILY, PERIOD_WEEKLY
+from custom_components.max_min.coordinator import MaxMinDataUpdateCoordinator
+from custom_components.max_min.period_state import PERIOD_FIELDS, PeriodState, TrackedData
+
+
+def test_period_state_has_no_instance_dict():
+    """Slots only: no per-instance __dict__."""
+    state = PeriodState()
+    assert not hasattr(state, "__dict__")
+    with pytest.raises(AttributeError):
+        state.unexpected = 1
+
+
+def test_period_state_mapping_protocol_matches_old_dict():
+    """Item access, get, iteration and equality behave like the old dict."""
+    last_reset = datetime(2026, 3, 18, tzinfo=timezone.utc)
+    state = PeriodState(last_reset=last_reset, max=20.0)
+
+    assert state["max"] == 20.0
+    assert state.max == 20.0
+    assert state.get("min") is None
+    assert state.get("unknown", "fallback") == "fallback"
+    assert list(state) == list(PERIOD_FIELDS)
+    assert "last_reset_reason" in state
+    assert dict(state)["last_reset"] == last_reset
+
+    state["min"] = 5.0
+    state.update({"end": 10.0})
+    assert state == {
+        "max": 20.0,
+        "min": 5.0,
+        "start": None,
+        "end": 10.0,
+        "last_reset": last_reset,
+        "last_reset_reason": None,
+        "last_reset_triggered_at": None,
+    }
+
+    with pytest.raises(KeyError):
+        state["unknown"] = 1
+    with pytest.raises(KeyError):
+        state["unknown"]
+
+
+def test_tracked_data_converts_assigned_dicts():
+    """Plain dicts assigned to a period, or to tracked_data, become records."""
+    coordinator = MaxMinDataUpdateCoordinator(make_mock_hass(), make_config_entry())
+    assert isinstance(coordinator.tracked_data, TrackedData)
+    assert isinstance(coordinator.tracked_data[PERIOD_DAILY], PeriodState)
+
+    coordinator.tracked_data[PERIOD_DAILY] = {"max": 10.0, "min": 1.0}
+    assert coordinator.tracked_data[PERIOD_DAILY].max == 10.0
+    assert coordinator.tracked_data[PERIOD_DAILY].end is None
+
+    coordinator.tracked_data = {PERIOD_WEEKLY: {"max": 3.0}}
+    assert isinstance(coordinator.tracked_data[PERIOD_WEEKLY], PeriodState)
+    assert coordinator.get_value(PERIOD_WEEKLY, "max") == 3.0
+    assert coordinator.get_value(PERIOD_DAILY, "max") is None
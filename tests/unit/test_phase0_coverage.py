@@ -23,6 +23,7 @@ from custom_components.max_min.const import (
 )
 from custom_components.max_min.coordinator import (
     MaxMinDataUpdateCoordinator,
+    SourceMetadata,
     _as_float as coordinator_as_float,
 )
 from custom_components.max_min.sensor import (
@@ -119,7 +120,7 @@ def test_compute_reset_seed_invalid_end_string_returns_none(hass):
     hass.states.get.return_value = Mock(state="unavailable", attributes={})
     coordinator = MaxMinDataUpdateCoordinator(hass, make_config_entry())
     coordinator.tracked_data[PERIOD_DAILY]["end"] = "not-a-number"
-    assert coordinator._compute_reset_seed(PERIOD_DAILY) is None
+    assert coordinator._compute_reset_seed(PERIOD_DAILY) == (None, False)
 
 
 def test_is_reset_due_short_circuits_defensive_paths(hass):
@@ -257,25 +258,26 @@ def test_schedule_single_reset_backup_callback_uses_backup_reason(hass):
 
 
 @pytest.mark.asyncio
-async def test_async_unload_cleans_backup_and_watchdog_listeners(hass):
-    """Unload unsubscribes backup listeners and watchdog callbacks."""
+async def test_async_unload_cleans_backup_listeners(hass):
+    """Unload unsubscribes backup listeners and the state listener."""
     coordinator = MaxMinDataUpdateCoordinator(hass, make_config_entry())
-    coordinator._backup_reset_listeners[PERIOD_DAILY] = Mock()
-    coordinator._watchdog_unsub = Mock()
+    backup_unsub = Mock()
+    state_unsub = Mock()
+    coordinator._backup_reset_listeners[PERIOD_DAILY] = backup_unsub
+    coordinator._unsub_sensor_state_listener = state_unsub
 
     await coordinator.async_unload()
 
+    backup_unsub.assert_called_once()
+    state_unsub.assert_called_once()
     assert coordinator._backup_reset_listeners == {}
-    assert coordinator._watchdog_unsub is None
+    assert coordinator._unsub_sensor_state_listener is None
 
 
 def test_sensor_device_class_filters_total_classes(coordinator):
     """Sensors do not mirror unsupported totalizing device classes."""
     config_entry = make_config_entry()
-    coordinator.hass.states.get.return_value = Mock(
-        state="10.0",
-        attributes={"device_class": "energy"},
-    )
+    coordinator.source_metadata = SourceMetadata(device_class="energy")
     sensor = MaxSensor(coordinator, config_entry, "Test Max", PERIOD_DAILY)
     assert sensor.device_class is None
 
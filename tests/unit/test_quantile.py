@@ -0,0 +1,109 @@
+"""Tests for the streaming percentile types (quantile.py and its coordinator wiring)."""
+
+from datetime import datetime, timedelta, timezone
+import random
+from unittest.mock import patch
+
+import pytest
+from conftest import make_coordinator, make_mock_hass
+
+from custom_components.max_min.const import PERIOD_DAILY, PERIOD_WEEKLY, TYPE_MAX, TYPE_P5, TYPE_P95
+from custom_components.max_min.quantile import P2Quantile
+
+NOW = datetime(2026, 3, 11, 12, 0, tzinfo=timezone.utc)
+PERIODS = [PERIOD_DAILY, PERIOD_WEEKLY]
+TYPES = [TYPE_MAX, TYPE_P5, TYPE_P95]
+
+
+def _exact(values, p):
+    values = sorted(values)
+    return values[round(p * (len(values) - 1))]
+
+
+@pytest.mark.parametrize("p", [0.05, 0.5, 0.95])
+def test_p2_tracks_exact_quantile(p):
+    """The five-marker estimate stays close to the exact quantile."""
+    rng = random.Random(3)
+    values = [rng.gauss(20.0, 5.0) for _ in range(20000)]
+    quantile = P2Quantile(p)
+    for value in values:
+        quantile.add(value)
+
+    assert quantile.count == len(values)
+    assert quantile.value == pytest.approx(_exact(values, p), abs=0.25)
+    assert len(quantile.as_list()) == 11
+
+
+def test_p2_small_counts_and_serialisation():
+    """Below five readings the exact quantile is used; state round-trips."""
+    quantile = P2Quantile(0.5)
+    assert quantile.value is None
+    for value in (3.0, 1.0, 2.0):
+        quantile.add(value)
+    assert quantile.value == 2.0
+    assert P2Quantile.from_list(0.5, quantile.as_list()).value == 2.0
+
+    for value in range(10):
+        quantile.add(float(value))
+    restored = P2Quantile.from_list(0.5, quantile.as_list())
+    assert restored.as_list() == quantile.as_list()
+    assert P2Quantile.from_list(0.5, [9, 1.0, 2.0]) is None
+    assert P2Quantile.from_list(0.5, None) is None
+
+
+def test_coordinator_percentiles_update_reset_and_restore():
+    """Readings feed every period's sketch; a reset restarts only its own."""
+    hass = make_mock_hass(state="50.0")
+    coordinator = make_coordinator(hass, PERIODS, TYPES, now=NOW)
+    for minute, value in enumerate(range(1, 101)):
+        coordinator._handle_source_value(float(value), NOW + timedelta(minutes=minute))
+
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_P95) == pytest.approx(95.0, abs=1.5)
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_P5) == pytest.approx(6.0, abs=1.5)
+    records = coordinator.get_restore_records()
+    assert set(records[PERIOD_DAILY]["quantiles"]) == {TYPE_P5, TYPE_P95}
+
+    coordinator._perform_reset(NOW + timedelta(hours=12), PERIOD_DAILY)
+    # Restarted from the reset seed (the current source value).
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_P95) == 50.0
+    assert coordinator.get_value(PERIOD_WEEKLY, TYPE_P95) == pytest.approx(95.0, abs=1.5)
+
+    restored = make_coordinator(hass, PERIODS, TYPES, now=NOW)
+    with patch("custom_components.max_min.coordinator.dt_util.now", return_value=NOW + timedelta(hours=2)):
+        restored.restore_stored_records(records)
+    assert restored.get_value(PERIOD_DAILY, TYPE_P95) == pytest.approx(95.0, abs=1.5)
+
+
+def test_reset_while_source_unavailable_does_not_seed_sketch():
+    """The fallback seed (last end value) is not counted as a reading."""
+    hass = make_mock_hass(state="unavailable")
+    coordinator = make_coordinator(hass, PERIODS, TYPES, now=NOW)
+    for minute, value in enumerate(range(1, 101)):
+        coordinator._handle_source_value(float(value), NOW + timedelta(minutes=minute))
+
+    coordinator._perform_reset(NOW + timedelta(hours=12), PERIOD_DAILY)
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_MAX) == 100.0  # provisional
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_P95) is None
+
+    for minute, value in enumerate((10.0, 11.0)):
+        coordinator._handle_source_value(value, NOW + timedelta(hours=12, minutes=minute + 1))
+    assert coordinator._quantiles[PERIOD_DAILY][TYPE_P95].count == 2
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_P95) == pytest.approx(10.95)
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_MAX) == 11.0
+
+
+def test_reset_with_stale_source_state_does_not_seed_sketch():
+    """A source state from the previous period is no reading of the new one."""
+    hass = make_mock_hass(state="3.0")
+    state = hass.states.get.return_value
+    state.last_reported = state.last_updated = state.last_changed = NOW
+    coordinator = make_coordinator(hass, PERIODS, TYPES, now=NOW)
+    for minute, value in enumerate(range(1, 101)):
+        coordinator._handle_source_value(float(value), NOW + timedelta(minutes=minute))
+
+    coordinator._perform_reset(NOW + timedelta(hours=12), PERIOD_DAILY)
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_P95) is None
+
+    coordinator._handle_source_value(4.0, NOW + timedelta(hours=12, minutes=1))
+    assert coordinator._quantiles[PERIOD_DAILY][TYPE_P95].count == 1
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_P95) == 4.0
@@ -1,9 +1,10 @@
 """Test restore state functionality."""
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, Mock, patch
 from zoneinfo import ZoneInfo
 
 import pytest
+from conftest import make_coordinator, make_mock_hass
 from homeassistant.util import dt as dt_util
 
 from custom_components.max_min.const import (
@@ -13,10 +14,24 @@ from custom_components.max_min.const import (
     PERIOD_YEARLY,
     PERIOD_DAILY,
     CONF_RESET_HISTORY,
+    CONF_ROLLING_WINDOW,
+    PERIOD_ROLLING,
+    PERIOD_WEEKLY,
+    TYPE_DELTA,
     TYPE_MAX,
     TYPE_MIN
 )
-from custom_components.max_min.sensor import MaxSensor, MinSensor
+from custom_components.max_min.sensor import (
+    DeltaSensor,
+    MaxMinExtraStoredData,
+    MaxMinRollingStoredData,
+    MaxMinSummaryStoredData,
+    MaxSensor,
+    MinSensor,
+    RollingMaxSensor,
+    RollingMinSensor,
+    SummarySensor,
+)
 from custom_components.max_min.coordinator import MaxMinDataUpdateCoordinator
 
 @pytest.fixture
@@ -317,3 +332,147 @@ async def test_restore_path_keeps_surgical_max_reset_when_min_restores(mock_hass
 
     assert coordinator.tracked_data[PERIOD_YEARLY]["max"] == 85.0
     assert coordinator.tracked_data[PERIOD_YEARLY]["min"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_extra_restore_data_round_trip(mock_hass, mock_config_entry):
+    """Sensors persist a typed period record and restore it in one structured load."""
+    now = dt_util.now()
+    last_reset = MaxMinDataUpdateCoordinator._get_period_start(now, PERIOD_DAILY)
+    source = MaxMinDataUpdateCoordinator(mock_hass, mock_config_entry)
+    source.tracked_data[PERIOD_DAILY].update(
+        {"max": 30.0, "min": -2.0, "start": 4.0, "end": 9.0, "last_reset": last_reset}
+    )
+    source._pending_start_reanchor.add(PERIOD_DAILY)
+
+    stored = {
+        cls: cls(source, mock_config_entry, "Saved", PERIOD_DAILY).extra_restore_state_data.as_dict()
+        for cls in (MaxSensor, MinSensor, DeltaSensor)
+    }
+    assert stored[MaxSensor] == {
+        "max": 30.0, "min": -2.0, "start": 4.0, "end": 9.0,
+        "last_reset": last_reset.timestamp(),
+        "pending_start_reanchor": True, "pending_extrema_reanchor": False,
+    }
+
+    target = MaxMinDataUpdateCoordinator(mock_hass, mock_config_entry)
+    target.update_restored_data = Mock(wraps=target.update_restored_data)
+    for cls, data in stored.items():
+        sensor = cls(target, mock_config_entry, "Restored", PERIOD_DAILY)
+        sensor.async_get_last_state = AsyncMock(
+            return_value=Mock(state="unknown", attributes={"config_entry_id": "test_entry"})
+        )
+        sensor.async_get_last_extra_data = AsyncMock(return_value=MaxMinExtraStoredData.from_dict(data))
+        await sensor.async_added_to_hass()
+
+    target.update_restored_data.assert_not_called()
+    for field in ("max", "min", "start", "end"):
+        assert target.get_value(PERIOD_DAILY, field) == source.get_value(PERIOD_DAILY, field)
+    assert target.get_value(PERIOD_DAILY, "last_reset") == last_reset
+    assert PERIOD_DAILY in target._pending_start_reanchor
+
+
+def test_extra_restore_data_rejects_malformed_payload():
+    """Unknown or malformed payloads fall back to attribute-based restore."""
+    assert MaxMinExtraStoredData.from_dict({"max": 1.0}) is None
+    assert MaxMinExtraStoredData.from_dict(
+        {"max": "x", "min": None, "start": None, "end": None, "last_reset": None}
+    ) is None
+
+
+def test_restore_batch_applies_at_commit(mock_hass, mock_config_entry):
+    """Staged restores apply at commit with one now, one consistency sweep and one publish."""
+    coordinator = MaxMinDataUpdateCoordinator(mock_hass, mock_config_entry)
+    coordinator.async_set_updated_data = Mock()
+    now = dt_util.now()
+    last_reset = MaxMinDataUpdateCoordinator._get_period_start(now, PERIOD_DAILY)
+
+    coordinator.begin_restore_batch()
+    coordinator.restore_period_record(PERIOD_DAILY, {"max": 25.0, "end": 9.0}, last_reset)
+    coordinator.restore_period_record(PERIOD_DAILY, {"min": -3.0, "end": 9.0}, last_reset)
+    assert coordinator.get_value(PERIOD_DAILY, "max") is None
+
+    with patch("custom_components.max_min.coordinator.dt_util.now", return_value=now) as mock_now, \
+         patch.object(coordinator, "_check_consistency", wraps=coordinator._check_consistency) as mock_sweep:
+        coordinator.commit_restore_batch()
+
+    assert mock_now.call_count == 1
+    assert mock_sweep.call_count == 1
+    coordinator.async_set_updated_data.assert_called_once()
+    assert coordinator.get_value(PERIOD_DAILY, "max") == 25.0
+    assert coordinator.get_value(PERIOD_DAILY, "min") == -3.0
+    assert coordinator.get_value(PERIOD_DAILY, "last_reset") == last_reset
+    assert {(PERIOD_DAILY, "max"), (PERIOD_DAILY, "min")} <= coordinator._restore_accepted
+
+    # After commit, restores apply immediately again
+    coordinator.restore_period_record(PERIOD_DAILY, {"max": 30.0}, last_reset)
+    assert coordinator.get_value(PERIOD_DAILY, "max") == 30.0
+
+
+def _restoring(sensor, extra_data):
+    """Give a sensor a saved state and restore data to load on startup."""
+    sensor.async_get_last_state = AsyncMock(
+        return_value=Mock(state="20.0", attributes={"config_entry_id": "test_entry"})
+    )
+    sensor.async_get_last_extra_data = AsyncMock(return_value=extra_data)
+    return sensor
+
+
+@pytest.mark.asyncio
+async def test_summary_sensor_restore_round_trip():
+    """A summary sensor saves every period and restores those the store did not."""
+    periods, types = [PERIOD_DAILY, PERIOD_WEEKLY], [TYPE_MAX, TYPE_MIN, TYPE_DELTA]
+    source = make_coordinator(
+        make_mock_hass(), periods, types, values={"max": 30.0, "min": -2.0, "start": 4.0, "end": 9.0}
+    )
+    saved = SummarySensor(source, source.config_entry, "Saved", PERIOD_DAILY).extra_restore_state_data.as_dict()
+    assert set(saved["records"]) == {PERIOD_DAILY, PERIOD_WEEKLY}
+
+    target = make_coordinator(
+        make_mock_hass(), periods, types, values=dict.fromkeys(("max", "min", "start", "end"), 12.0)
+    )
+    target.stored_periods.add(PERIOD_WEEKLY)
+    sensor = _restoring(
+        SummarySensor(target, target.config_entry, "Restored", PERIOD_DAILY),
+        MaxMinSummaryStoredData.from_dict(saved),
+    )
+    await sensor.async_added_to_hass()
+
+    assert (target.get_value(PERIOD_DAILY, "max"), target.get_value(PERIOD_DAILY, "min")) == (30.0, -2.0)
+    assert (target.get_value(PERIOD_DAILY, "start"), target.get_value(PERIOD_DAILY, "end")) == (4.0, 9.0)
+    # Restored from the shared store already: left alone (its max only takes
+    # the daily max, which lies inside the week).
+    assert (target.get_value(PERIOD_WEEKLY, "start"), target.get_value(PERIOD_WEEKLY, "end")) == (12.0, 12.0)
+    assert target.get_value(PERIOD_WEEKLY, "max") == 30.0
+
+
+@pytest.mark.asyncio
+async def test_rolling_sensor_restore_round_trip():
+    """Rolling sensors save the window segments and restore them once."""
+    now = dt_util.now()
+    with patch("custom_components.max_min.coordinator.async_track_point_in_time", return_value=Mock()):
+        source = make_coordinator(make_mock_hass(), **{CONF_ROLLING_WINDOW: 1})
+        for minutes, value in ((20, 40.0), (10, 10.0)):
+            source._process_source_state(
+                Mock(state=str(value), attributes={}), value, now - timedelta(minutes=minutes)
+            )
+        saved = RollingMaxSensor(
+            source, source.config_entry, "Saved", PERIOD_ROLLING
+        ).extra_restore_state_data.as_dict()
+
+        target = make_coordinator(make_mock_hass(), **{CONF_ROLLING_WINDOW: 1})
+        for cls in (RollingMaxSensor, RollingMinSensor):
+            sensor = _restoring(
+                cls(target, target.config_entry, "Restored", PERIOD_ROLLING),
+                MaxMinRollingStoredData.from_dict(saved),
+            )
+            await sensor.async_added_to_hass()
+
+    assert (target.get_value(PERIOD_ROLLING, TYPE_MAX), target.get_value(PERIOD_ROLLING, TYPE_MIN)) == (40.0, 10.0)
+    assert target.restore_rolling_state(saved["state"]) is False
+
+    # Restored from the shared store already: the sensor's own data is not read.
+    target.stored_periods.add(PERIOD_ROLLING)
+    sensor = _restoring(RollingMaxSensor(target, target.config_entry, "Again", PERIOD_ROLLING), None)
+    await sensor.async_added_to_hass()
+    sensor.async_get_last_extra_data.assert_not_awaited()
@@ -0,0 +1,153 @@
+"""Tests for the rolling-window max/min (rolling.py and its coordinator wiring)."""
+
+from datetime import datetime, timedelta, timezone
+import random
+from unittest.mock import Mock, patch
+
+from conftest import make_coordinator, make_mock_hass
+
+from custom_components.max_min.const import (
+    CONF_ROLLING_WINDOW,
+    PERIOD_ROLLING,
+    TYPE_MAX,
+    TYPE_MIN,
+)
+from custom_components.max_min.rolling import MAX_BUCKETS, RollingExtremes
+
+NOW = datetime(2026, 3, 11, 12, 0, tzinfo=timezone.utc)
+
+
+def _brute_force(readings, now, window):
+    """Extremes of the step signal over (now - window, now], from scratch."""
+    values = []
+    for index, (timestamp, value) in enumerate(readings):
+        end = readings[index + 1][0] if index + 1 < len(readings) else now
+        if value is not None and end > now - window:
+            values.append(value)
+    return (max(values), min(values)) if values else (None, None)
+
+
+def test_rolling_matches_brute_force():
+    """Deque extremes equal a full rescan at every reading (1 s resolution)."""
+    rng = random.Random(7)
+    window = 600.0  # resolution 1 s: readings on whole seconds are exact
+    rolling = RollingExtremes(window)
+    readings = []
+    timestamp = 1_000_000.0
+    for _ in range(2000):
+        timestamp += rng.randint(1, 40)
+        value = None if rng.random() < 0.05 else float(rng.randint(-50, 50))
+        readings.append((timestamp, value))
+        rolling.add(timestamp, value)
+        rolling.expire(timestamp)
+        assert (rolling.max, rolling.min) == _brute_force(readings, timestamp, window)
+
+
+def test_rolling_memory_is_bounded():
+    """A fast source never stores more than MAX_BUCKETS + 1 segments per deque."""
+    rolling = RollingExtremes(3600.0)
+    for step in range(20000):
+        timestamp = step * 0.5
+        # Alternating values defeat the monotonic pruning on their own.
+        rolling.add(timestamp, float(step % 2) + step * 1e-6 * (-1) ** step)
+        rolling.expire(timestamp)
+    assert len(rolling) <= 2 * (MAX_BUCKETS + 1)
+
+
+def test_rolling_expiry_and_serialisation():
+    """Segments leave at next_expiry(); as_dict() round-trips."""
+    rolling = RollingExtremes(3600.0)
+    rolling.add(0.0, 30.0)
+    rolling.add(60.0, 10.0)
+    rolling.add(120.0, 20.0)
+    assert (rolling.max, rolling.min) == (30.0, 10.0)
+
+    expiry = rolling.next_expiry()
+    assert expiry == 3600.0 + 60.0
+    restored = RollingExtremes.from_dict(rolling.as_dict(), 3600.0)
+    assert restored.as_dict() == rolling.as_dict()
+    assert RollingExtremes.from_dict(rolling.as_dict(), 7200.0) is None
+    assert RollingExtremes.from_dict({"window": 3600.0}, 3600.0) is None
+
+    rolling.expire(expiry)
+    assert (rolling.max, rolling.min) == (20.0, 10.0)
+    rolling.expire(3600.0 + 120.0)
+    assert (rolling.max, rolling.min) == (20.0, 20.0)
+    assert rolling.next_expiry() is None
+
+
+def _feed(coordinator, value, now):
+    state = Mock(state=str(value), attributes={})
+    coordinator._process_source_state(state, value, now)
+
+
+def test_coordinator_rolling_timer_drives_expiry():
+    """Readings arm one timer at the next expiry; firing it publishes the drop."""
+    hass = make_mock_hass(state="10.0")
+    coordinator = make_coordinator(hass, now=NOW, **{CONF_ROLLING_WINDOW: 1})
+    timers = []
+
+    def _track(_hass, action, when):
+        timers.append((action, when))
+        return Mock()
+
+    with patch("custom_components.max_min.coordinator.async_track_point_in_time", side_effect=_track):
+        _feed(coordinator, 30.0, NOW)
+        _feed(coordinator, 12.0, NOW + timedelta(minutes=5))
+        assert coordinator.get_value(PERIOD_ROLLING, TYPE_MAX) == 30.0
+        assert coordinator.get_value(PERIOD_ROLLING, TYPE_MIN) == 12.0
+        action, when = timers[-1]
+        assert when == NOW + timedelta(hours=1, minutes=5)
+
+        coordinator.async_set_updated_data.reset_mock()
+        published = []
+        coordinator.async_set_updated_data.side_effect = lambda _data: published.append(coordinator.changed_keys)
+        action(when)
+
+    assert coordinator.get_value(PERIOD_ROLLING, TYPE_MAX) == 12.0
+    assert published == [frozenset({(PERIOD_ROLLING, TYPE_MAX)})]
+
+
+def test_coordinator_rolling_restore_and_reset():
+    """Restored segments survive a restart; the reset service clears them."""
+    hass = make_mock_hass(state="10.0")
+    with patch("custom_components.max_min.coordinator.async_track_point_in_time", return_value=Mock()):
+        before = make_coordinator(hass, now=NOW, **{CONF_ROLLING_WINDOW: 1})
+        _feed(before, 40.0, NOW)
+        _feed(before, 10.0, NOW + timedelta(minutes=10))
+        records = before.get_restore_records()
+
+        after = make_coordinator(hass, now=NOW, **{CONF_ROLLING_WINDOW: 1})
+        after._rolling.add(NOW.timestamp(), 15.0)
+        with patch("custom_components.max_min.coordinator.dt_util.now", return_value=NOW + timedelta(minutes=20)):
+            after.restore_stored_records(records)
+        assert PERIOD_ROLLING in after.stored_periods
+        assert (after.get_value(PERIOD_ROLLING, TYPE_MAX), after.get_value(PERIOD_ROLLING, TYPE_MIN)) == (40.0, 10.0)
+        # Restored only once per setup.
+        assert after.restore_rolling_state(records[PERIOD_ROLLING]) is False
+
+        after.reset_values({(PERIOD_ROLLING, TYPE_MAX)})
+    assert (after.get_value(PERIOD_ROLLING, TYPE_MAX), after.get_value(PERIOD_ROLLING, TYPE_MIN)) == (15.0, 15.0)
+
+
+def test_coordinator_rolling_restore_counts_held_value_until_restart():
+    """The value held at shutdown stays in the window through the downtime."""
+    hass = make_mock_hass(state="15.0")
+    restart = NOW + timedelta(hours=2)
+    with patch("custom_components.max_min.coordinator.async_track_point_in_time", return_value=Mock()):
+        before = make_coordinator(hass, now=NOW, **{CONF_ROLLING_WINDOW: 1})
+        _feed(before, 40.0, NOW)
+        _feed(before, 10.0, NOW + timedelta(minutes=10))
+        records = before.get_restore_records()
+
+        after = make_coordinator(hass, now=restart, **{CONF_ROLLING_WINDOW: 1})
+        after._rolling.add(restart.timestamp(), 15.0)
+        with patch("custom_components.max_min.coordinator.dt_util.now", return_value=restart):
+            after.restore_stored_records(records)
+
+    # 40.0 was replaced 110 minutes ago and has left the 1 h window; 10.0 was
+    # still held at shutdown, so it counts until the restart.
+    assert (after.get_value(PERIOD_ROLLING, TYPE_MAX), after.get_value(PERIOD_ROLLING, TYPE_MIN)) == (15.0, 10.0)
+    assert after._rolling.next_expiry() == restart.timestamp() + 3600
+    after._rolling.expire(after._rolling.next_expiry())
+    assert (after.get_value(PERIOD_ROLLING, TYPE_MAX), after.get_value(PERIOD_ROLLING, TYPE_MIN)) == (15.0, 15.0)
@@ -0,0 +1,129 @@
+"""Tests for hierarchical roll-up mode (only the narrowest period sees samples)."""
+
+import random
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+from conftest import make_coordinator, make_mock_hass
+
+from custom_components.max_min.const import (
+    CONF_ROLLUP,
+    PERIOD_ALL_TIME,
+    PERIOD_DAILY,
+    PERIOD_MONTHLY,
+    PERIOD_WEEKLY,
+    PERIOD_YEARLY,
+    TYPE_DELTA,
+    TYPE_MAX,
+    TYPE_MIN,
+)
+
+ALL_PERIODS = [PERIOD_DAILY, PERIOD_WEEKLY, PERIOD_MONTHLY, PERIOD_YEARLY, PERIOD_ALL_TIME]
+START = datetime(2025, 12, 29, 0, 30, tzinfo=timezone.utc)  # Monday, spans a year boundary
+TYPES = [TYPE_MAX, TYPE_MIN, TYPE_DELTA]
+
+
+def _snapshot(coordinator):
+    return {
+        (period, field): coordinator.get_value(period, field)
+        for period in coordinator.periods
+        for field in ("max", "min", "start", "end")
+    }
+
+
+def _feed(hass, coordinators, now, value):
+    source = hass.states.get.return_value
+    source.state = str(value)
+    event = Mock(data={"new_state": Mock(state=str(value), attributes=source.attributes)})
+    with patch("custom_components.max_min.coordinator.dt_util.now", return_value=now):
+        for coordinator in coordinators:
+            coordinator._handle_sensor_change(event)
+
+
+def test_rollup_targets_only_aligned_periods():
+    """Weekly cannot be rolled into monthly/yearly: a week straddles them."""
+    hass = make_mock_hass()
+    assert make_coordinator(hass, ALL_PERIODS, TYPES, now=START, **{CONF_ROLLUP: True})._rollup_targets == (
+        PERIOD_WEEKLY, PERIOD_MONTHLY, PERIOD_YEARLY, PERIOD_ALL_TIME,
+    )
+    weekly_base = make_coordinator(hass, [PERIOD_WEEKLY, PERIOD_MONTHLY, PERIOD_ALL_TIME], TYPES, now=START, **{CONF_ROLLUP: True})
+    assert weekly_base._rollup_targets == (PERIOD_ALL_TIME,)
+    assert make_coordinator(hass, ALL_PERIODS, TYPES, now=START, **{CONF_ROLLUP: False})._rollup_targets == ()
+
+
+def test_rollup_matches_raw_processing_across_boundaries():
+    """Every period reports identical values with and without roll-up."""
+    rng = random.Random(42)
+    hass = make_mock_hass()
+    raw = make_coordinator(hass, ALL_PERIODS, TYPES, now=START, **{CONF_ROLLUP: False})
+    rolled = make_coordinator(hass, ALL_PERIODS, TYPES, now=START, **{CONF_ROLLUP: True})
+
+    now = START
+    while now < START + timedelta(days=6):
+        _feed(hass, (raw, rolled), now, round(rng.uniform(-20, 40), 1))
+        assert _snapshot(rolled) == _snapshot(raw), now
+        now += timedelta(minutes=rng.randint(20, 200))
+
+    assert rolled.tracked_data[PERIOD_YEARLY].last_reset == datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def test_rollup_broader_reset_before_base_reset():
+    """A broader timer firing before the daily one does not leak the old day."""
+    hass = make_mock_hass()
+    raw = make_coordinator(hass, ALL_PERIODS, TYPES, now=START, **{CONF_ROLLUP: False})
+    rolled = make_coordinator(hass, ALL_PERIODS, TYPES, now=START, **{CONF_ROLLUP: True})
+    _feed(hass, (raw, rolled), datetime(2025, 12, 31, 22, tzinfo=timezone.utc), 35.0)
+
+    boundary = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    hass.states.get.return_value.state = "unavailable"
+    for coordinator in (raw, rolled):
+        coordinator._perform_reset(boundary, PERIOD_YEARLY, reason="scheduler")
+        assert coordinator.get_value(PERIOD_YEARLY, "max") == 35.0  # fallback seed
+    assert rolled.get_value(PERIOD_ALL_TIME, "max") == 35.0
+
+    _feed(hass, (raw, rolled), boundary + timedelta(minutes=5), 12.0)
+
+    assert _snapshot(rolled) == _snapshot(raw)
+    assert rolled.get_value(PERIOD_YEARLY, "max") == 12.0
+    assert rolled.get_value(PERIOD_ALL_TIME, "max") == 35.0
+
+
+def test_rollup_skips_broader_period_updates():
+    """Ordinary samples only touch the base period's tracked data."""
+    hass = make_mock_hass()
+    rolled = make_coordinator(hass, ALL_PERIODS, TYPES, now=START, **{CONF_ROLLUP: True})
+    _feed(hass, (rolled,), START, 10.0)
+    _feed(hass, (rolled,), START + timedelta(hours=1), 30.0)
+
+    assert rolled.tracked_data[PERIOD_WEEKLY].max == 10.0  # closed aggregate only
+    assert rolled.get_value(PERIOD_WEEKLY, "max") == 30.0
+    assert rolled.get_value(PERIOD_WEEKLY, "end") == 30.0
+    assert rolled.get_value(PERIOD_WEEKLY, "start") == 10.0
+
+
+def test_rollup_marks_broader_entities_dirty():
+    """Broader entities are refreshed when the merged live value moves."""
+    hass = make_mock_hass()
+    rolled = make_coordinator(hass, ALL_PERIODS, TYPES, now=START, **{CONF_ROLLUP: True})
+    _feed(hass, (rolled,), START, 10.0)
+    rolled.tracked_data[PERIOD_YEARLY].max = 50.0  # restored closed aggregate
+
+    published = []
+    rolled.async_set_updated_data = Mock(side_effect=lambda _data: published.append(rolled.changed_keys))
+    _feed(hass, (rolled,), START + timedelta(hours=1), 30.0)
+
+    assert (PERIOD_WEEKLY, "max") in published[0]
+    assert (PERIOD_WEEKLY, "end") in published[0]
+    assert (PERIOD_YEARLY, "end") in published[0]
+    assert (PERIOD_YEARLY, "max") not in published[0]
+
+
+def test_rollup_disabled_for_cumulative_offset():
+    """The offset dead zone needs per-period state, so roll-up turns off."""
+    hass = make_mock_hass(state_class="total_increasing")
+    rolled = make_coordinator(hass, ALL_PERIODS, TYPES, now=START, offset=30, **{CONF_ROLLUP: True})
+    _feed(hass, (rolled,), START, 10.0)
+    assert rolled._rollup_targets == ()
+
+    _feed(hass, (rolled,), START + timedelta(hours=1), 30.0)
+    assert rolled.tracked_data[PERIOD_WEEKLY].max == 30.0
@@ -76,7 +76,7 @@ from custom_components.max_min.const import (
     TYPE_MAX,
     TYPE_MIN
 )
-from custom_components.max_min.coordinator import MaxMinDataUpdateCoordinator
+from custom_components.max_min.coordinator import AttributeSnapshot, MaxMinDataUpdateCoordinator, SourceMetadata
 from custom_components.max_min.sensor import MaxSensor, MinSensor, DeltaSensor
 from homeassistant.helpers import device_registry as dr
 
@@ -104,6 +104,17 @@ def coordinator():
         "unit_of_measurement": "°C",
         "device_class": "measurement"
     }
+    coord.source_metadata = SourceMetadata(unit="°C", device_class="measurement")
+    coord.get_attribute_snapshot.return_value = AttributeSnapshot(
+        key=(None, None, None),
+        version=1,
+        attributes={"config_entry_id": "test_entry", "end_value": 6.0},
+    )
+    coord.get_delta_attributes.return_value = {
+        "config_entry_id": "test_entry",
+        "end_value": 6.0,
+        "start_value": 4.0,
+    }
     return coord
 def test_delta_sensor(coordinator, config_entry, hass):
     """Test delta sensor basic functionality."""
@@ -131,11 +142,13 @@ def test_delta_sensor_no_unit(coordinator, config_entry, hass):
     source_state.attributes = {}
     hass.states.get.return_value = source_state
     coordinator.hass = hass
+    coordinator.source_metadata = SourceMetadata()
     sensor = DeltaSensor(coordinator, config_entry, "Delta Test", PERIOD_DAILY)
     assert sensor.native_unit_of_measurement is None
 def test_delta_sensor_no_hass(coordinator, config_entry):
     """Test delta sensor without hass."""
     coordinator.hass = None
+    coordinator.source_metadata = SourceMetadata()
     sensor = DeltaSensor(coordinator, config_entry, "Delta Test", PERIOD_DAILY)
     assert sensor.native_unit_of_measurement is None
 def test_delta_sensor_attributes(coordinator, config_entry, hass):
@@ -270,6 +283,7 @@ def test_sensor_no_unit(coordinator, config_entry, hass):
     hass.states.get.return_value = source_state
     coordinator.hass = hass
     
+    coordinator.source_metadata = SourceMetadata()
     sensor = MaxSensor(coordinator, config_entry, "Max Test", PERIOD_DAILY)
     assert sensor.unit_of_measurement is None
 
@@ -278,6 +292,7 @@ def test_max_sensor_no_hass(coordinator, config_entry):
     """Test max sensor without hass."""
     # coordinator.hass is already None
     coordinator.hass = None
+    coordinator.source_metadata = SourceMetadata()
     sensor = MaxSensor(coordinator, config_entry, "Max Test", PERIOD_DAILY)
     assert sensor.unit_of_measurement is None
 
@@ -286,6 +301,7 @@ def test_min_sensor_no_hass(coordinator, config_entry):
     """Test min sensor without hass."""
     # coordinator.hass is already None
     coordinator.hass = None
+    coordinator.source_metadata = SourceMetadata()
     sensor = MinSensor(coordinator, config_entry, "Min Test", PERIOD_DAILY)
     assert sensor.unit_of_measurement is None
 
@@ -295,6 +311,7 @@ def test_sensor_source_unavailable(coordinator, config_entry, hass):
     hass.states.get.return_value = None
     coordinator.hass = hass
     
+    coordinator.source_metadata = SourceMetadata()
     sensor = MaxSensor(coordinator, config_entry, "Max Test", PERIOD_DAILY)
     assert sensor.unit_of_measurement is None
 
@@ -362,6 +379,45 @@ def test_sensor_extra_state_attributes(hass):
     assert "last_reset" not in max_sensor.extra_state_attributes
 
 
+def test_attribute_snapshot_shared_until_attributes_change(hass):
+    """Entities share one cached mapping; only reset metadata/start/end bump the version."""
+    entry = Mock()
+    entry.entry_id = "test_entry"
+    entry.data = {CONF_SENSOR_ENTITY: "sensor.test", CONF_PERIODS: [PERIOD_DAILY], "types": [TYPE_MAX, TYPE_MIN]}
+    entry.options = {}
+
+    coordinator = MaxMinDataUpdateCoordinator(hass, entry)
+    now = datetime(2023, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+    coordinator.tracked_data[PERIOD_DAILY] = {"max": 10.0, "min": 5.0, "start": 5.0, "end": 7.0, "last_reset": now}
+
+    max_sensor = MaxSensor(coordinator, entry, "Test Max", PERIOD_DAILY)
+    delta_sensor = DeltaSensor(coordinator, entry, "Test Delta", PERIOD_DAILY)
+    attrs = max_sensor.extra_state_attributes
+    assert attrs == {"config_entry_id": "test_entry", "last_reset": now.isoformat()}
+    assert delta_sensor.extra_state_attributes == {**attrs, "start_value": 5.0, "end_value": 7.0}
+    version = coordinator.get_attribute_snapshot(PERIOD_DAILY).version
+
+    # max/min changes keep the same snapshot object
+    coordinator.tracked_data[PERIOD_DAILY]["max"] = 12.0
+    assert max_sensor.extra_state_attributes is attrs
+    assert coordinator.get_attribute_snapshot(PERIOD_DAILY).version == version
+
+    # start/end changes rebuild only the delta copy
+    delta_attrs = delta_sensor.extra_state_attributes
+    assert delta_sensor.extra_state_attributes is delta_attrs
+    coordinator.tracked_data[PERIOD_DAILY]["end"] = 8.0
+    assert delta_sensor.extra_state_attributes["end_value"] == 8.0
+    assert max_sensor.extra_state_attributes is attrs
+    assert coordinator.get_attribute_snapshot(PERIOD_DAILY).version == version
+
+    coordinator.tracked_data[PERIOD_DAILY]["last_reset_reason"] = "manual"
+    assert max_sensor.extra_state_attributes["last_reset_reason"] == "manual"
+    assert delta_sensor.extra_state_attributes["last_reset_reason"] == "manual"
+    assert coordinator.get_attribute_snapshot(PERIOD_DAILY).version == version + 1
+    with pytest.raises(TypeError):
+        delta_sensor.extra_state_attributes["end_value"] = 1.0
+
+
 def test_extra_state_attributes_include_reset_diagnostics(hass):
     """Sensor attributes expose reset diagnostics for troubleshooting."""
     entry = Mock()
@@ -389,3 +445,216 @@ def test_extra_state_attributes_include_reset_diagnostics(hass):
     attrs = sensor.extra_state_attributes
     assert attrs["last_reset_reason"] == "watchdog"
     assert attrs["last_reset_triggered_at"] == now.isoformat()
+
+
+NOW_WED = datetime(2026, 3, 18, 12, 0, tzinfo=timezone.utc)
+
+
+def _dirty_tracking_setup():
+    """Build a real 2-period coordinator with one sensor of each type per period."""
+    from conftest import make_config_entry, make_mock_hass
+    from custom_components.max_min.const import PERIOD_WEEKLY
+
+    entry = make_config_entry(periods=[PERIOD_DAILY, PERIOD_WEEKLY], types=[TYPE_MAX, TYPE_MIN, "delta"])
+    coordinator = MaxMinDataUpdateCoordinator(make_mock_hass(), entry)
+    for period in (PERIOD_DAILY, PERIOD_WEEKLY):
+        coordinator.tracked_data[period].update(
+            {"max": 20.0, "min": 5.0, "start": 5.0, "end": 10.0,
+             "last_reset": MaxMinDataUpdateCoordinator._get_period_start(NOW_WED, period)}
+        )
+    sensors = {}
+    for period in (PERIOD_DAILY, PERIOD_WEEKLY):
+        for cls in (MaxSensor, MinSensor, DeltaSensor):
+            sensor = cls(coordinator, entry, f"{period} {cls.__name__}", period)
+            sensor.async_write_ha_state = Mock()
+            coordinator.async_add_listener(sensor._handle_coordinator_update)
+            sensors[(period, cls._value_key)] = sensor
+    return coordinator, sensors
+
+
+def _source_event(value):
+    event = Mock()
+    event.data = {"new_state": Mock(state=value, attributes={})}
+    return event
+
+
+def test_only_sensors_with_changed_fields_write_state():
+    """An end-only update writes the delta sensors, not max/min."""
+    coordinator, sensors = _dirty_tracking_setup()
+
+    with patch("custom_components.max_min.coordinator.dt_util.now",
+               return_value=NOW_WED):
+        coordinator._handle_sensor_change(_source_event("12.0"))
+
+    written = {key for key, sensor in sensors.items() if sensor.async_write_ha_state.called}
+    assert written == {(PERIOD_DAILY, "delta"), ("weekly", "delta")}
+    assert coordinator.changed_keys is None
+
+
+def test_new_extreme_writes_matching_sensors():
+    """A new max writes the max sensors (incl. propagated broader period)."""
+    coordinator, sensors = _dirty_tracking_setup()
+    coordinator.tracked_data["weekly"]["max"] = 25.0
+
+    with patch("custom_components.max_min.coordinator.dt_util.now",
+               return_value=NOW_WED):
+        coordinator._handle_sensor_change(_source_event("22.0"))
+
+    written = {key for key, sensor in sensors.items() if sensor.async_write_ha_state.called}
+    assert written == {(PERIOD_DAILY, "max"), (PERIOD_DAILY, "delta"), ("weekly", "delta")}
+
+
+def test_reset_and_full_refresh_write_every_period_sensor():
+    """A reset dirties all fields of its period; refresh_all writes everything."""
+    coordinator, sensors = _dirty_tracking_setup()
+
+    with patch("custom_components.max_min.coordinator.async_track_point_in_time"):
+        coordinator._perform_reset(datetime(2026, 3, 19, 0, 0, tzinfo=timezone.utc), PERIOD_DAILY)
+
+    written = {key for key, sensor in sensors.items() if sensor.async_write_ha_state.called}
+    assert written == {(PERIOD_DAILY, "max"), (PERIOD_DAILY, "min"), (PERIOD_DAILY, "delta")}
+
+    coordinator._publish_changes(refresh_all=True)
+    assert all(sensor.async_write_ha_state.called for sensor in sensors.values())
+
+
+def test_bookkeeping_attributes_not_recorded():
+    """Bookkeeping attributes are excluded from the recorder for every sensor type."""
+    expected = {
+        "config_entry_id", "last_reset", "last_reset_reason",
+        "last_reset_triggered_at", "start_value", "end_value",
+    }
+    for sensor_cls in (MaxSensor, MinSensor, DeltaSensor):
+        assert expected <= sensor_cls._unrecorded_attributes
+        assert expected <= sensor_cls._Entity__combined_unrecorded_attributes
+
+
+def test_summary_sensor_values_and_attributes():
+    """The summary shows the narrowest period's first type and all values as attributes."""
+    from custom_components.max_min.sensor import SummarySensor
+
+    coordinator, _sensors = _dirty_tracking_setup()
+    coordinator.tracked_data["weekly"]["max"] = 25.0
+    summary = SummarySensor(coordinator, coordinator.config_entry, "Summary", PERIOD_DAILY)
+    summary.async_write_ha_state = Mock()
+    coordinator.async_add_listener(summary._handle_coordinator_update)
+
+    assert summary.unique_id == "test_entry_summary"
+    assert summary.native_value == 20.0
+    attrs = summary.extra_state_attributes
+    assert attrs["period"] == PERIOD_DAILY
+    assert (attrs["daily_max"], attrs["daily_min"], attrs["daily_delta"]) == (20.0, 5.0, 5.0)
+    assert (attrs["weekly_max"], attrs["weekly_min"], attrs["weekly_delta"]) == (25.0, 5.0, 5.0)
+
+    # Any moved key rewrites the one summary entity.
+    with patch("custom_components.max_min.coordinator.dt_util.now", return_value=NOW_WED):
+        coordinator._handle_sensor_change(_source_event("12.0"))
+    summary.async_write_ha_state.assert_called_once()
+    assert set(summary.extra_restore_state_data.as_dict()["records"]) == {PERIOD_DAILY, "weekly"}
+
+
+def test_deadband_holds_back_small_changes():
+    """Value-only moves smaller than the deadband are not written."""
+    coordinator, sensors = _dirty_tracking_setup()
+    coordinator.deadband = 0.5
+    delta = sensors[(PERIOD_DAILY, "delta")]
+    coordinator._publish_changes(refresh_all=True)
+    delta.async_write_ha_state.reset_mock()
+
+    with patch("custom_components.max_min.coordinator.dt_util.now", return_value=NOW_WED):
+        coordinator._handle_sensor_change(_source_event("10.2"))
+        assert not delta.async_write_ha_state.called
+        coordinator._handle_sensor_change(_source_event("10.6"))
+    # Compared with the published 5.0, not the held-back 5.2.
+    delta.async_write_ha_state.assert_called_once()
+    assert coordinator.get_value(PERIOD_DAILY, "end") == 10.6
+
+
+def test_deadband_summary_compares_every_shown_value():
+    """A summary whose state holds still is written when an attribute leaves the band."""
+    from custom_components.max_min.sensor import SummarySensor
+
+    coordinator, _sensors = _dirty_tracking_setup()
+    coordinator.deadband = 0.5
+    summary = SummarySensor(coordinator, coordinator.config_entry, "Summary", PERIOD_DAILY)
+    summary.async_write_ha_state = Mock()
+    coordinator.async_add_listener(summary._handle_coordinator_update)
+    coordinator._publish_changes(refresh_all=True)
+    summary.async_write_ha_state.reset_mock()
+
+    with patch("custom_components.max_min.coordinator.dt_util.now", return_value=NOW_WED):
+        coordinator._handle_sensor_change(_source_event("10.2"))
+        assert not summary.async_write_ha_state.called
+        coordinator._handle_sensor_change(_source_event("0.0"))
+    # The state (daily max) is still 20.0, but daily_min fell from 5.0 to 0.0.
+    assert summary.native_value == 20.0
+    summary.async_write_ha_state.assert_called_once()
+    assert summary.extra_state_attributes["daily_min"] == 0.0
+
+
+def test_deadband_relative_and_max_age():
+    """A relative band scales with the value; max age forces the write."""
+    coordinator, sensors = _dirty_tracking_setup()
+    coordinator.deadband_relative = 10
+    coordinator.deadband_max_age = 60
+    delta = sensors[(PERIOD_DAILY, "delta")]
+    with patch("custom_components.max_min.sensor.time.monotonic", return_value=1000.0):
+        coordinator._publish_changes(refresh_all=True)
+    delta.async_write_ha_state.reset_mock()
+
+    with patch("custom_components.max_min.coordinator.dt_util.now", return_value=NOW_WED), \
+         patch("custom_components.max_min.sensor.time.monotonic", return_value=1030.0):
+        coordinator._handle_sensor_change(_source_event("10.4"))  # 5.0 -> 5.4, band 0.5
+    assert not delta.async_write_ha_state.called
+
+    with patch("custom_components.max_min.coordinator.dt_util.now", return_value=NOW_WED), \
+         patch("custom_components.max_min.sensor.time.monotonic", return_value=1061.0):
+        coordinator._handle_sensor_change(_source_event("10.3"))
+    delta.async_write_ha_state.assert_called_once()
+
+
+def test_deadband_flush_timer_writes_held_value():
+    """A held-back value is written by one timer at the max age; a write cancels it."""
+    coordinator, sensors = _dirty_tracking_setup()
+    coordinator.deadband = 0.5
+    coordinator.deadband_max_age = 60
+    delta = sensors[(PERIOD_DAILY, "delta")]
+    delta.hass = Mock()
+    unsub = Mock()
+    with patch("custom_components.max_min.sensor.time.monotonic", return_value=1000.0):
+        coordinator._publish_changes(refresh_all=True)
+    delta.async_write_ha_state.reset_mock()
+
+    with patch("custom_components.max_min.coordinator.dt_util.now", return_value=NOW_WED), \
+         patch("custom_components.max_min.sensor.time.monotonic", return_value=1010.0), \
+         patch("custom_components.max_min.sensor.async_call_later", return_value=unsub) as call_later:
+        coordinator._handle_sensor_change(_source_event("10.2"))
+        coordinator._handle_sensor_change(_source_event("10.3"))
+    # One timer for the first held-back value, due at the max age.
+    call_later.assert_called_once_with(delta.hass, 50.0, delta._async_deadband_flush)
+    assert not delta.async_write_ha_state.called
+
+    with patch("custom_components.max_min.sensor.time.monotonic", return_value=1060.0):
+        delta._async_deadband_flush(None)
+    delta.async_write_ha_state.assert_called_once()
+    assert delta._published_values == (pytest.approx(5.3),)
+    assert delta._deadband_unsub is None
+
+    # Back inside the band of what was published: the flush writes nothing.
+    with patch("custom_components.max_min.coordinator.dt_util.now", return_value=NOW_WED), \
+         patch("custom_components.max_min.sensor.time.monotonic", return_value=1070.0), \
+         patch("custom_components.max_min.sensor.async_call_later", return_value=unsub):
+        coordinator._handle_sensor_change(_source_event("10.4"))
+        coordinator._handle_sensor_change(_source_event("10.3"))
+    delta._async_deadband_flush(None)
+    delta.async_write_ha_state.assert_called_once()
+
+    # A write (here a full refresh) cancels the pending timer.
+    with patch("custom_components.max_min.coordinator.dt_util.now", return_value=NOW_WED), \
+         patch("custom_components.max_min.sensor.time.monotonic", return_value=1080.0), \
+         patch("custom_components.max_min.sensor.async_call_later", return_value=unsub):
+        coordinator._handle_sensor_change(_source_event("10.5"))
+    assert delta._deadband_unsub is unsub
+    coordinator._publish_changes(refresh_all=True)
+    unsub.assert_called_once()
+    assert delta._deadband_unsub is None
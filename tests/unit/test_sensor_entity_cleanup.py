@@ -70,11 +70,11 @@ async def test_sensor_cleanup_on_options_update(hass, mock_registry_entry):
     # Also need to patch dr.async_get because it's called in the device cleanup block
     
     mock_dr = Mock()
-    mock_dr.devices = {}  # Empty devices for this test
     
     with patch("custom_components.max_min.sensor.er.async_get", return_value=mock_er), \
-         patch("custom_components.max_min.sensor.er.async_entries_for_config_entry", return_value=[entry_max, entry_min]), \
-         patch("custom_components.max_min.sensor.dr.async_get", return_value=mock_dr):
+         patch("custom_components.max_min.sensor.er.async_entries_for_config_entry", return_value=[entry_max, entry_min]) as mock_entries, \
+         patch("custom_components.max_min.sensor.dr.async_get", return_value=mock_dr), \
+         patch("custom_components.max_min.sensor.dr.async_entries_for_config_entry", return_value=[]):
         
         # Configure hass mock states for source entity
         mock_state = Mock()
@@ -93,6 +93,10 @@ async def test_sensor_cleanup_on_options_update(hass, mock_registry_entry):
         assert len(call_args_list) == 1
         assert call_args_list[0][0][0] == "sensor.min"
 
+        # A single pass over the entity registry
+        assert mock_entries.call_count == 1
+        assert mock_er.async_get.call_count == 1  # source name lookup only
+
 @pytest.mark.asyncio
 async def test_sensor_cleanup_on_period_change(hass, mock_registry_entry):
     """Test that stale entities are removed when periods change."""
@@ -120,11 +124,11 @@ async def test_sensor_cleanup_on_period_change(hass, mock_registry_entry):
     entry_daily.device_id = None
     
     mock_dr = Mock()
-    mock_dr.devices = {}
     
     with patch("custom_components.max_min.sensor.er.async_get", return_value=mock_er), \
          patch("custom_components.max_min.sensor.er.async_entries_for_config_entry", return_value=[entry_daily]), \
-         patch("custom_components.max_min.sensor.dr.async_get", return_value=mock_dr):
+         patch("custom_components.max_min.sensor.dr.async_get", return_value=mock_dr), \
+         patch("custom_components.max_min.sensor.dr.async_entries_for_config_entry", return_value=[]):
         
         hass.states.get.return_value = Mock(name="Source")
         
@@ -138,3 +142,111 @@ async def test_sensor_cleanup_on_period_change(hass, mock_registry_entry):
     new_entities = async_add_entities.call_args[0][0]
     assert len(new_entities) == 1
     assert new_entities[0].period == "weekly"
+
+
+@pytest.mark.asyncio
+async def test_sensor_sync_after_in_place_options_update(hass):
+    """Options applied in place add missing entities and re-link the device."""
+    config_entry = Mock()
+    config_entry.runtime_data = Mock()
+    config_entry.entry_id = "test_entry"
+    config_entry.data = {
+        CONF_SENSOR_ENTITY: "sensor.source",
+        CONF_PERIODS: [PERIOD_DAILY],
+        CONF_TYPES: [TYPE_MAX],
+    }
+    config_entry.options = {}
+    async_add_entities = Mock()
+
+    entry_max = Mock(entity_id="sensor.max", unique_id="test_entry_daily_max", device_id=None)
+    old_device = Mock(id="old_device")
+    mock_er = Mock()
+    mock_dr = Mock()
+
+    with patch("custom_components.max_min.sensor.er.async_get", return_value=mock_er), \
+         patch("custom_components.max_min.sensor.er.async_entries_for_config_entry", return_value=[entry_max]), \
+         patch("custom_components.max_min.sensor.dr.async_get", return_value=mock_dr), \
+         patch("custom_components.max_min.sensor.dr.async_entries_for_config_entry", return_value=[old_device]):
+        hass.states.get.return_value = Mock(attributes={})
+        await async_setup_entry(hass, config_entry, async_add_entities)
+        assert [entity.unique_id for entity in async_add_entities.call_args[0][0]] == ["test_entry_daily_max"]
+
+        config_entry.options = {
+            CONF_PERIODS: [PERIOD_DAILY],
+            CONF_TYPES: [TYPE_MAX, TYPE_MIN],
+            CONF_DEVICE_ID: "new_device",
+        }
+        async_add_entities.reset_mock()
+        mock_dr.async_update_device.reset_mock()
+        config_entry.runtime_data.entities_listener()
+
+    # Only the new entity is created; the existing one is kept and moved.
+    assert [entity.unique_id for entity in async_add_entities.call_args[0][0]] == ["test_entry_daily_min"]
+    mock_er.async_remove.assert_not_called()
+    mock_er.async_update_entity.assert_called_once_with("sensor.max", device_id="new_device")
+    mock_dr.async_update_device.assert_any_call("old_device", remove_config_entry_id="test_entry")
+    mock_dr.async_update_device.assert_any_call("new_device", add_config_entry_id="test_entry")
+
+
+@pytest.mark.asyncio
+async def test_setup_with_configured_device_leaves_device_links(hass):
+    """Setup with a device configured does not unlink the entry from any device."""
+    config_entry = Mock()
+    config_entry.runtime_data = Mock()
+    config_entry.entry_id = "test_entry"
+    config_entry.data = {
+        CONF_SENSOR_ENTITY: "sensor.source",
+        CONF_PERIODS: [PERIOD_DAILY],
+        CONF_TYPES: [TYPE_MAX],
+        CONF_DEVICE_ID: "my_device",
+    }
+    config_entry.options = {}
+
+    entry_max = Mock(entity_id="sensor.max", unique_id="test_entry_daily_max", device_id="other_device")
+    mock_er = Mock()
+    mock_dr = Mock()
+
+    with patch("custom_components.max_min.sensor.er.async_get", return_value=mock_er), \
+         patch("custom_components.max_min.sensor.er.async_entries_for_config_entry", return_value=[entry_max]), \
+         patch("custom_components.max_min.sensor.dr.async_get", return_value=mock_dr), \
+         patch(
+             "custom_components.max_min.sensor.dr.async_entries_for_config_entry",
+             return_value=[Mock(id="other_device")],
+         ) as mock_devices:
+        hass.states.get.return_value = Mock(attributes={})
+        await async_setup_entry(hass, config_entry, Mock())
+
+    mock_devices.assert_not_called()
+    mock_dr.async_update_device.assert_not_called()
+    mock_er.async_update_entity.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_summary_mode_creates_single_entity(hass):
+    """Summary mode replaces the per-period sensors with one entity."""
+    from custom_components.max_min.const import CONF_ENTITY_MODE, ENTITY_MODE_SUMMARY
+
+    config_entry = Mock()
+    config_entry.runtime_data = Mock()
+    config_entry.entry_id = "test_entry"
+    config_entry.data = {
+        CONF_SENSOR_ENTITY: "sensor.source",
+        CONF_PERIODS: ["weekly", PERIOD_DAILY],
+        CONF_TYPES: [TYPE_MAX, TYPE_MIN],
+    }
+    config_entry.options = {CONF_ENTITY_MODE: ENTITY_MODE_SUMMARY}
+    async_add_entities = Mock()
+    entry_max = Mock(entity_id="sensor.max", unique_id="test_entry_daily_max", device_id=None)
+    mock_er = Mock()
+
+    with patch("custom_components.max_min.sensor.er.async_get", return_value=mock_er), \
+         patch("custom_components.max_min.sensor.er.async_entries_for_config_entry", return_value=[entry_max]), \
+         patch("custom_components.max_min.sensor.dr.async_get", return_value=Mock()), \
+         patch("custom_components.max_min.sensor.dr.async_entries_for_config_entry", return_value=[]):
+        hass.states.get.return_value = Mock(attributes={})
+        await async_setup_entry(hass, config_entry, async_add_entities)
+
+    mock_er.async_remove.assert_called_once_with("sensor.max")
+    entities = async_add_entities.call_args[0][0]
+    assert [entity.unique_id for entity in entities] == ["test_entry_summary"]
+    assert entities[0].period == PERIOD_DAILY
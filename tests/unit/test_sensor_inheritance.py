@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import Mock, patch
 from homeassistant.const import STATE_UNKNOWN, STATE_UNAVAILABLE
+from custom_components.max_min.coordinator import SourceMetadata
 from custom_components.max_min.sensor import MaxSensor, MinSensor
 from custom_components.max_min.const import (
     CONF_SENSOR_ENTITY,
@@ -28,6 +29,7 @@ def coordinator(hass):
     coordinator.hass = hass
     coordinator.max_value = 20.0
     coordinator.min_value = 5.0
+    coordinator.source_metadata = SourceMetadata("°C", "temperature", "measurement")
     return coordinator
 
 @pytest.fixture
@@ -64,6 +66,7 @@ def test_sensor_defaults_if_source_missing(coordinator, config_entry, hass):
     """Test defaults when source sensor has no attributes."""
     hass.states.get.return_value = Mock(state="10.0", attributes={})
     coordinator.hass = hass
+    coordinator.source_metadata = SourceMetadata()
     
     max_sensor = MaxSensor(coordinator, config_entry, "Max Test", PERIOD_DAILY)
     
@@ -0,0 +1,211 @@
+"""Tests for the max_min.reset / max_min.set_value services."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+from conftest import make_coordinator, make_mock_hass
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.max_min.const import (
+    DOMAIN,
+    PERIOD_ALL_TIME,
+    PERIOD_DAILY,
+    PERIOD_ROLLING,
+    PERIOD_WEEKLY,
+    TYPE_AVERAGE,
+    TYPE_COUNT,
+    TYPE_DELTA,
+    TYPE_MAX,
+    TYPE_MEAN,
+    TYPE_MIN,
+    TYPE_P50,
+)
+from custom_components.max_min.services import _resolve_targets
+
+NOW = datetime(2026, 3, 11, 12, 0, tzinfo=timezone.utc)
+
+
+def _coordinator(hass):
+    coordinator = make_coordinator(
+        hass,
+        [PERIOD_DAILY, PERIOD_WEEKLY],
+        [TYPE_MAX, TYPE_MIN, TYPE_DELTA],
+        now=NOW,
+        values={"max": 30.0, "min": 2.0, "start": 4.0, "end": 10.0},
+    )
+    coordinator._last_source_state = "10.0"
+    return coordinator
+
+
+def test_reset_values_rebaselines_without_touching_window():
+    """Reset restarts max from the source value and keeps last_reset."""
+    hass = make_mock_hass(state="12.0")
+    coordinator = _coordinator(hass)
+    weekly = coordinator.tracked_data[PERIOD_WEEKLY]
+    last_reset = weekly.last_reset
+
+    coordinator.reset_values({(PERIOD_WEEKLY, TYPE_MAX), (PERIOD_WEEKLY, TYPE_DELTA)})
+
+    # Re-merged with the daily max (30.0), which lies inside the week.
+    assert weekly.max == 30.0
+    assert (weekly.start, weekly.end) == (12.0, 12.0)
+    assert weekly.min == 2.0
+    assert weekly.last_reset is last_reset
+    assert coordinator._last_source_state is None
+    coordinator.async_set_updated_data.assert_called_once()
+
+    coordinator.reset_values({(PERIOD_DAILY, TYPE_MAX), (PERIOD_WEEKLY, TYPE_MAX)})
+    assert coordinator.tracked_data[PERIOD_DAILY].max == 12.0
+    assert weekly.max == 12.0
+
+
+def test_reset_values_source_unavailable_reanchors_delta():
+    """With no source value the last end seeds the reset until the next reading."""
+    hass = make_mock_hass(state="unavailable")
+    coordinator = _coordinator(hass)
+
+    coordinator.reset_values({(PERIOD_DAILY, TYPE_DELTA)})
+
+    daily = coordinator.tracked_data[PERIOD_DAILY]
+    assert (daily.start, daily.end) == (10.0, 10.0)
+    assert PERIOD_DAILY in coordinator._pending_start_reanchor
+
+
+def test_set_values_max_min_and_delta():
+    """set_value overwrites extremes and moves the delta start."""
+    hass = make_mock_hass(state="12.0")
+    coordinator = _coordinator(hass)
+
+    coordinator.set_values({(PERIOD_DAILY, TYPE_DELTA)}, 3.5)
+    daily = coordinator.tracked_data[PERIOD_DAILY]
+    assert (daily.start, daily.end) == (6.5, 10.0)
+
+    published = []
+    coordinator.async_set_updated_data.side_effect = lambda _data: published.append(coordinator.changed_keys)
+    coordinator.set_values({(PERIOD_DAILY, TYPE_MIN), (PERIOD_WEEKLY, TYPE_MIN)}, -1.0)
+    assert daily.min == -1.0
+    assert coordinator.tracked_data[PERIOD_WEEKLY].min == -1.0
+    # One publish for the whole batch, limited to the touched keys.
+    assert published == [frozenset({(PERIOD_DAILY, TYPE_MIN), (PERIOD_WEEKLY, TYPE_MIN)})]
+
+
+def test_set_values_statistics_types():
+    """set_value rewrites an average but leaves estimated and counted types alone."""
+    hass = make_mock_hass(state="10.0")
+    coordinator = make_coordinator(hass, types=[TYPE_AVERAGE, TYPE_P50, TYPE_COUNT, TYPE_MEAN], now=NOW)
+    with patch("custom_components.max_min.coordinator.async_call_later"):
+        for hour, value in enumerate((10.0, 20.0)):
+            coordinator._process_source_state(
+                Mock(state=str(value), attributes={}), value, NOW + timedelta(hours=hour)
+            )
+
+        with patch("custom_components.max_min.coordinator.dt_util.now", return_value=NOW + timedelta(hours=2)):
+            coordinator.set_values(
+                {(PERIOD_DAILY, TYPE_AVERAGE), (PERIOD_DAILY, TYPE_P50), (PERIOD_DAILY, TYPE_COUNT)}, 5.0
+            )
+            # The two hours so far now average 5.0; the held 20.0 keeps counting.
+            assert coordinator.get_value(PERIOD_DAILY, TYPE_AVERAGE) == 5.0
+        with patch("custom_components.max_min.coordinator.dt_util.now", return_value=NOW + timedelta(hours=4)):
+            assert coordinator.get_value(PERIOD_DAILY, TYPE_AVERAGE) == 12.5
+
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_P50) == 15.0
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_COUNT) == 2
+    assert coordinator.get_value(PERIOD_DAILY, TYPE_MEAN) == 15.0
+
+
+def _registry_entry(entity_id, entry_id, suffix, platform=DOMAIN):
+    return Mock(entity_id=entity_id, config_entry_id=entry_id, unique_id=f"{entry_id}_{suffix}", platform=platform)
+
+
+def _resolve(entries, referenced, indirect=(), loaded=True, coordinators=None, settable=False):
+    hass = Mock()
+    coordinators = {} if coordinators is None else coordinators
+
+    def _get_entry(entry_id):
+        coordinators.setdefault(entry_id, Mock(name=entry_id))
+        return Mock(
+            state=ConfigEntryState.LOADED if loaded else ConfigEntryState.NOT_LOADED,
+            runtime_data=coordinators[entry_id],
+        )
+
+    hass.config_entries.async_get_entry.side_effect = _get_entry
+    ent_reg = Mock()
+    ent_reg.async_get.side_effect = {entry.entity_id: entry for entry in entries}.get
+    selected = Mock(referenced=set(referenced), indirectly_referenced=set(indirect))
+    with patch("custom_components.max_min.services.async_extract_referenced_entity_ids", return_value=selected), \
+         patch("custom_components.max_min.services.er.async_get", return_value=ent_reg):
+        return _resolve_targets(hass, Mock(), settable=settable), coordinators
+
+
+def test_resolve_targets_groups_by_entry():
+    """Targets are grouped per coordinator, one key set each."""
+    entries = [
+        _registry_entry("sensor.a_max", "a", "daily_max"),
+        _registry_entry("sensor.a_all_time_delta", "a", "all_time_delta"),
+        _registry_entry("sensor.b_min", "b", "weekly_min"),
+        _registry_entry("sensor.other", "x", "whatever", platform="template"),
+    ]
+    targets, coordinators = _resolve(
+        entries, ["sensor.a_max", "sensor.a_all_time_delta", "sensor.b_min"], indirect=["sensor.other"]
+    )
+
+    assert targets == {
+        coordinators["a"]: {(PERIOD_DAILY, TYPE_MAX), (PERIOD_ALL_TIME, TYPE_DELTA)},
+        coordinators["b"]: {(PERIOD_WEEKLY, TYPE_MIN)},
+    }
+
+
+def test_resolve_targets_summary_covers_whole_entry():
+    """A summary sensor targets every period/type of its entry."""
+    coordinator = Mock(periods=[PERIOD_DAILY, PERIOD_WEEKLY], types=[TYPE_MAX], rolling_window=0)
+    targets, _coordinators = _resolve(
+        [_registry_entry("sensor.a_summary", "a", "summary")], ["sensor.a_summary"], coordinators={"a": coordinator}
+    )
+
+    assert targets == {coordinator: {(PERIOD_DAILY, TYPE_MAX), (PERIOD_WEEKLY, TYPE_MAX)}}
+
+    # The rolling window is part of the entry too.
+    coordinator.rolling_window = 1.0
+    targets, _coordinators = _resolve(
+        [_registry_entry("sensor.a_summary", "a", "summary")], ["sensor.a_summary"], coordinators={"a": coordinator}
+    )
+    assert targets[coordinator] == {(PERIOD_DAILY, TYPE_MAX), (PERIOD_WEEKLY, TYPE_MAX), (PERIOD_ROLLING, TYPE_MAX)}
+
+
+def test_resolve_targets_set_value_only_settable_sensors():
+    """set_value rejects explicit summary, rolling and statistics targets and skips indirect ones."""
+    entries = [
+        _registry_entry("sensor.a_max", "a", "daily_max"),
+        _registry_entry("sensor.a_average", "a", "daily_average"),
+        _registry_entry("sensor.a_summary", "a", "summary"),
+        _registry_entry("sensor.a_rolling_max", "a", "rolling_max"),
+        _registry_entry("sensor.a_p50", "a", "daily_p50"),
+        _registry_entry("sensor.a_count", "a", "daily_count"),
+    ]
+    for entity_id in ("sensor.a_summary", "sensor.a_rolling_max", "sensor.a_p50", "sensor.a_count"):
+        with pytest.raises(ServiceValidationError) as err:
+            _resolve(entries, [entity_id], settable=True)
+        assert err.value.translation_key == "value_not_settable"
+
+    targets, coordinators = _resolve(
+        entries,
+        ["sensor.a_max", "sensor.a_average"],
+        indirect=["sensor.a_summary", "sensor.a_rolling_max", "sensor.a_p50", "sensor.a_count"],
+        settable=True,
+    )
+    assert targets == {coordinators["a"]: {(PERIOD_DAILY, TYPE_MAX), (PERIOD_DAILY, TYPE_AVERAGE)}}
+
+
+def test_resolve_targets_rejects_foreign_and_unloaded_entities():
+    """Explicit targets must be loaded Max Min sensors."""
+    entries = [
+        _registry_entry("sensor.other", "x", "whatever", platform="template"),
+        _registry_entry("sensor.a_max", "a", "daily_max"),
+    ]
+    with pytest.raises(ServiceValidationError):
+        _resolve(entries, ["sensor.other"])
+    with pytest.raises(ServiceValidationError):
+        _resolve(entries, ["sensor.a_max"], loaded=False)
@@ -0,0 +1,104 @@
+"""Tests for the shared source hub."""
+
+from unittest.mock import Mock, patch
+
+from homeassistant.util import dt as dt_util
+from conftest import make_config_entry, make_mock_hass
+
+from custom_components.max_min.const import PERIOD_DAILY, PERIOD_WEEKLY
+from custom_components.max_min.coordinator import MaxMinDataUpdateCoordinator
+from custom_components.max_min.source_hub import MaxMinSourceHub
+
+
+def _make_coordinator(hass, entry_id, periods):
+    entry = make_config_entry(periods=periods)
+    entry.entry_id = entry_id
+    coordinator = MaxMinDataUpdateCoordinator(hass, entry)
+    coordinator.async_set_updated_data = Mock()
+    for period in periods:
+        coordinator.tracked_data[period]["last_reset"] = coordinator._get_period_start(dt_util.now(), period)
+    return coordinator
+
+
+def test_entries_on_same_source_share_one_listener_and_parse():
+    """Two entries on one source get one subscription and one parse per event."""
+    hass = make_mock_hass()
+    hub = MaxMinSourceHub(hass)
+    daily = _make_coordinator(hass, "entry_daily", [PERIOD_DAILY])
+    weekly = _make_coordinator(hass, "entry_weekly", [PERIOD_WEEKLY])
+
+    with patch("custom_components.max_min.source_hub.async_track_state_change_event") as mock_track:
+        unsub_listener = Mock()
+        mock_track.return_value = unsub_listener
+        hub.async_subscribe(daily)
+        hub.async_subscribe(weekly)
+        assert mock_track.call_count == 1
+
+    with patch(
+        "custom_components.max_min.source_hub.parse_source_state",
+        wraps=lambda state: float(state.state),
+    ) as mock_parse:
+        event = Mock(data={"entity_id": "sensor.test", "new_state": Mock(state="12.5", attributes={})})
+        hub._async_handle_event(event)
+
+    assert mock_parse.call_count == 1
+    assert daily.tracked_data[PERIOD_DAILY]["max"] == 12.5
+    assert weekly.tracked_data[PERIOD_WEEKLY]["max"] == 12.5
+    assert hub.source_stats("sensor.test") == {"subscribers": 2, "events": 1, "deliveries": 2}
+
+
+def test_listener_removed_with_last_subscriber():
+    """The source listener stays until the last coordinator unsubscribes."""
+    hass = make_mock_hass()
+    hub = MaxMinSourceHub(hass)
+    first = _make_coordinator(hass, "entry_1", [PERIOD_DAILY])
+    second = _make_coordinator(hass, "entry_2", [PERIOD_DAILY])
+
+    with patch("custom_components.max_min.source_hub.async_track_state_change_event") as mock_track:
+        unsub_listener = Mock()
+        mock_track.return_value = unsub_listener
+        unsub_first = hub.async_subscribe(first)
+        unsub_second = hub.async_subscribe(second)
+
+    unsub_first()
+    unsub_first()
+    unsub_listener.assert_not_called()
+    assert hub.stats == {"sensor.test": {"subscribers": 1, "events": 0, "deliveries": 0}}
+
+    unsub_second()
+    unsub_listener.assert_called_once()
+    assert hub.stats == {}
+
+
+def test_failing_subscriber_does_not_block_others():
+    """An exception in one coordinator is logged and the fan-out continues."""
+    hass = make_mock_hass()
+    hub = MaxMinSourceHub(hass)
+    broken = _make_coordinator(hass, "entry_broken", [PERIOD_DAILY])
+    healthy = _make_coordinator(hass, "entry_healthy", [PERIOD_DAILY])
+    broken.handle_source_update = Mock(side_effect=ValueError("boom"))
+
+    with patch("custom_components.max_min.source_hub.async_track_state_change_event"):
+        hub.async_subscribe(broken)
+        hub.async_subscribe(healthy)
+
+    event = Mock(data={"entity_id": "sensor.test", "new_state": Mock(state="7", attributes={})})
+    hub._async_handle_event(event)
+
+    broken.handle_source_update.assert_called_once()
+    assert healthy.tracked_data[PERIOD_DAILY]["max"] == 7.0
+
+
+def test_start_listeners_subscribes_via_hub():
+    """start_listeners() hands the coordinator to the hub when one is given."""
+    hass = make_mock_hass()
+    coordinator = _make_coordinator(hass, "entry", [PERIOD_DAILY])
+    hub = Mock()
+    hub.async_subscribe.return_value = unsub = Mock()
+
+    with patch("custom_components.max_min.coordinator.async_track_state_change_event") as mock_track:
+        coordinator.start_listeners(hub)
+
+    mock_track.assert_not_called()
+    hub.async_subscribe.assert_called_once_with(coordinator)
+    assert coordinator._unsub_sensor_state_listener is unsub
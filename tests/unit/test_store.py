@@ -0,0 +1,106 @@
+"""Tests for the shared tracker store."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from conftest import make_config_entry, make_coordinator, make_mock_hass
+
+from custom_components.max_min.const import PERIOD_DAILY, PERIOD_WEEKLY
+from custom_components.max_min.coordinator import MaxMinDataUpdateCoordinator
+from custom_components.max_min.sensor import MaxSensor
+from custom_components.max_min.store import STORE_SAVE_DELAY, MaxMinStore
+
+
+@pytest.fixture
+def store_backend():
+    """Patch the HA Store used by MaxMinStore."""
+    with patch("custom_components.max_min.store.Store") as store_cls:
+        backend = store_cls.return_value
+        backend.async_load = AsyncMock(return_value=None)
+        yield backend
+
+
+VALUES = {"max": 20.0, "min": 5.0, "start": 5.0, "end": 10.0}
+
+
+@pytest.mark.asyncio
+async def test_load_reads_file_once(store_backend):
+    """Every entry is served from one JSON load."""
+    store_backend.async_load.return_value = {"entries": {"entry_a": {PERIOD_DAILY: {"max": 1.0}}}}
+    store = MaxMinStore(make_mock_hass())
+
+    await store.async_load()
+    await store.async_load()
+
+    store_backend.async_load.assert_awaited_once()
+    assert store.entry_records("entry_a") == {PERIOD_DAILY: {"max": 1.0}}
+    assert store.entry_records("missing") == {}
+
+
+def test_saves_coalesced_across_entries(store_backend):
+    """Many publishes from several entries arm a single delayed write."""
+    hass = make_mock_hass()
+    store = MaxMinStore(hass)
+    first = make_coordinator(hass, values=VALUES, entry_id="entry_a")
+    second = make_coordinator(hass, values=VALUES, entry_id="entry_b")
+    store.async_register(first)
+    store.async_register(second)
+
+    for _ in range(5):
+        first._publish_changes()
+        second._publish_changes()
+
+    store_backend.async_delay_save.assert_called_once()
+    data_func, delay = store_backend.async_delay_save.call_args[0]
+    assert delay == STORE_SAVE_DELAY
+
+    # Records are collected when the write happens
+    first.tracked_data[PERIOD_DAILY].max = 25.0
+    data = data_func()
+    assert data["entries"]["entry_a"][PERIOD_DAILY]["max"] == 25.0
+    assert data["entries"]["entry_b"][PERIOD_DAILY]["max"] == 20.0
+    assert store.saves == 1
+
+    # The next change arms a new write
+    first._publish_changes()
+    assert store_backend.async_delay_save.call_count == 2
+
+
+def test_unregister_keeps_records_and_remove_entry_drops_them(store_backend):
+    """Unloaded entries keep their last records for a reload until removed."""
+    hass = make_mock_hass()
+    store = MaxMinStore(hass)
+    coordinator = make_coordinator(hass, values=VALUES, entry_id="entry_a")
+    unregister = store.async_register(coordinator)
+
+    unregister()
+    assert coordinator.persist_listener is None
+    assert store.entry_records("entry_a")[PERIOD_DAILY]["max"] == 20.0
+
+    store.async_remove_entry("entry_a")
+    assert store.entry_records("entry_a") == {}
+
+
+@pytest.mark.asyncio
+async def test_stored_records_restore_and_skip_entity_restore(store_backend):
+    """Stored records restore the coordinator; their entities skip RestoreEntity data."""
+    hass = make_mock_hass()
+    saved = make_coordinator(hass, values=VALUES, entry_id="entry_a")
+    saved.tracked_data[PERIOD_DAILY].max = 42.0
+    records = saved.get_restore_records()
+
+    coordinator = MaxMinDataUpdateCoordinator(hass, make_config_entry(periods=[PERIOD_DAILY, PERIOD_WEEKLY]))
+    coordinator.async_set_updated_data = Mock()
+    coordinator.begin_restore_batch()
+    coordinator.restore_stored_records({**records, "monthly": records[PERIOD_DAILY], PERIOD_WEEKLY: None})
+
+    sensor = MaxSensor(coordinator, coordinator.config_entry, "Max", PERIOD_DAILY)
+    sensor.async_get_last_state = AsyncMock(return_value=Mock(state="99.0", attributes={}))
+    sensor.async_get_last_extra_data = AsyncMock()
+    await sensor.async_added_to_hass()
+    coordinator.commit_restore_batch()
+
+    sensor.async_get_last_extra_data.assert_not_awaited()
+    assert coordinator.stored_periods == {PERIOD_DAILY}
+    assert coordinator.get_value(PERIOD_DAILY, "max") == 42.0
+    assert coordinator.get_value(PERIOD_DAILY, "end") == 10.0
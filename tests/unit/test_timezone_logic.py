@@ -89,3 +89,22 @@ def test_yearly_reset_uses_local_midnight():
         assert next_reset.hour == 0
     finally:
         dt_util.set_default_time_zone(timezone.utc)
+
+def test_period_bounds_rebuilt_on_time_zone_change():
+    """Changing the HA time zone drops the cached boundary table."""
+    from conftest import make_config_entry, make_mock_hass
+
+    cet = ZoneInfo("Europe/Madrid")
+    coordinator = Coordinator(make_mock_hass(), make_config_entry())
+    now = datetime(2023, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+    try:
+        dt_util.set_default_time_zone(timezone.utc)
+        utc_bounds = coordinator._get_period_bounds(now, PERIOD_DAILY)
+        assert utc_bounds[0] == datetime(2023, 1, 15, tzinfo=timezone.utc).timestamp()
+
+        dt_util.set_default_time_zone(cet)
+        cet_bounds = coordinator._get_period_bounds(now, PERIOD_DAILY)
+        assert cet_bounds[0] == datetime(2023, 1, 14, 23, 0, 0, tzinfo=timezone.utc).timestamp()
+        assert cet_bounds[2].tzinfo == cet
+    finally:
+        dt_util.set_default_time_zone(timezone.utc)
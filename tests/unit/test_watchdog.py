@@ -5,10 +5,11 @@ from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch, call
 from homeassistant.util import dt as dt_util
 
-from custom_components.max_min.coordinator import MaxMinDataUpdateCoordinator
+from custom_components.max_min.coordinator import BACKUP_RESET_DELAY, WATCHDOG_NEVER, MaxMinDataUpdateCoordinator
+from custom_components.max_min.watchdog import WATCHDOG_RETRY_DELAY, MaxMinWatchdog
 from custom_components.max_min.const import (
     CONF_SENSOR_ENTITY, CONF_PERIODS, CONF_TYPES, CONF_OFFSET,
-    PERIOD_DAILY, PERIOD_WEEKLY, TYPE_MAX
+    PERIOD_ALL_TIME, PERIOD_DAILY, PERIOD_WEEKLY, TYPE_MAX
 )
 
 @pytest.fixture
@@ -40,8 +41,7 @@ def config_entry():
 
 def test_chain_break_protection(mock_hass, config_entry):
     """Test that rescheduling happens even if reset logic crashes."""
-    with patch("custom_components.max_min.coordinator.async_track_time_interval"):
-        coordinator = MaxMinDataUpdateCoordinator(mock_hass, config_entry)
+    coordinator = MaxMinDataUpdateCoordinator(mock_hass, config_entry)
     
     # Setup initial state
     coordinator.tracked_data[PERIOD_DAILY] = {"max": 10.0, "min": 5.0}
@@ -63,8 +63,7 @@ def test_chain_break_protection(mock_hass, config_entry):
 
 def test_watchdog_detects_missed_reset(mock_hass, config_entry):
     """Test standard watchdog detection."""
-    with patch("custom_components.max_min.coordinator.async_track_time_interval"):
-        coordinator = MaxMinDataUpdateCoordinator(mock_hass, config_entry)
+    coordinator = MaxMinDataUpdateCoordinator(mock_hass, config_entry)
     
     # Setup scenario:
     # Current time: Jan 1st, 00:05 (5 minutes into new day)
@@ -89,10 +88,9 @@ def test_watchdog_detects_missed_reset(mock_hass, config_entry):
 def test_watchdog_respects_offset(mock_hass, config_entry):
     """Test watchdog waits for offset."""
     # Add offset of 900s (15 min)
-    with patch("custom_components.max_min.coordinator.async_track_time_interval"):
-        coordinator = MaxMinDataUpdateCoordinator(mock_hass, config_entry)
-        coordinator.offset = 900 
-        coordinator._source_is_cumulative = True
+    coordinator = MaxMinDataUpdateCoordinator(mock_hass, config_entry)
+    coordinator.offset = 900
+    coordinator._source_is_cumulative = True
     
     day_start = datetime(2023, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
     old_reset = datetime(2022, 12, 31, 0, 0, 0, tzinfo=timezone.utc)
@@ -117,10 +115,9 @@ def test_watchdog_respects_offset(mock_hass, config_entry):
 
 def test_watchdog_ignores_offset_for_non_cumulative(mock_hass, config_entry):
     """Test watchdog does not wait for offset on non-cumulative sensors."""
-    with patch("custom_components.max_min.coordinator.async_track_time_interval"):
-        coordinator = MaxMinDataUpdateCoordinator(mock_hass, config_entry)
-        coordinator.offset = 900
-        coordinator._source_is_cumulative = False
+    coordinator = MaxMinDataUpdateCoordinator(mock_hass, config_entry)
+    coordinator.offset = 900
+    coordinator._source_is_cumulative = False
 
     day_start = datetime(2023, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
     old_reset = datetime(2022, 12, 31, 0, 0, 0, tzinfo=timezone.utc)
@@ -138,8 +135,7 @@ def test_watchdog_ignores_offset_for_non_cumulative(mock_hass, config_entry):
 
 def test_watchdog_ignores_fresh_resets(mock_hass, config_entry):
     """Test watchdog sleeps if everything is fine."""
-    with patch("custom_components.max_min.coordinator.async_track_time_interval"):
-        coordinator = MaxMinDataUpdateCoordinator(mock_hass, config_entry)
+    coordinator = MaxMinDataUpdateCoordinator(mock_hass, config_entry)
     
     # Current time: 08:00
     # Last reset: 00:00 Today (Correct)
@@ -157,8 +153,7 @@ def test_watchdog_ignores_fresh_resets(mock_hass, config_entry):
 
 def test_watchdog_handles_naive_last_reset_string(mock_hass, config_entry):
     """Watchdog handles restored naive datetime strings without crashing."""
-    with patch("custom_components.max_min.coordinator.async_track_time_interval"):
-        coordinator = MaxMinDataUpdateCoordinator(mock_hass, config_entry)
+    coordinator = MaxMinDataUpdateCoordinator(mock_hass, config_entry)
 
     now = datetime(2023, 1, 2, 0, 5, 0, tzinfo=timezone.utc)
     coordinator.tracked_data[PERIOD_DAILY] = {
@@ -174,8 +169,7 @@ def test_watchdog_handles_naive_last_reset_string(mock_hass, config_entry):
 def test_watchdog_continues_when_one_period_fails(mock_hass, config_entry):
     """Watchdog should continue processing periods if one period errors."""
     config_entry.data[CONF_PERIODS] = [PERIOD_DAILY, PERIOD_WEEKLY]
-    with patch("custom_components.max_min.coordinator.async_track_time_interval"):
-        coordinator = MaxMinDataUpdateCoordinator(mock_hass, config_entry)
+    coordinator = MaxMinDataUpdateCoordinator(mock_hass, config_entry)
 
     now = datetime(2023, 1, 2, 0, 5, 0, tzinfo=timezone.utc)
 
@@ -187,3 +181,245 @@ def test_watchdog_continues_when_one_period_fails(mock_hass, config_entry):
         coordinator._check_watchdog(now)
 
     assert mock_trigger.call_count == 2
+
+
+def test_watchdog_due_moves_to_next_boundary(mock_hass, config_entry):
+    """After a clean check the coordinator is not due until the next boundary."""
+    coordinator = MaxMinDataUpdateCoordinator(mock_hass, config_entry)
+    now = datetime(2023, 1, 1, 8, 0, 0, tzinfo=timezone.utc)
+    coordinator.tracked_data[PERIOD_DAILY] = {
+        "last_reset": datetime(2023, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
+    }
+
+    assert coordinator.is_watchdog_due(now) is True
+    assert coordinator._check_watchdog(now) is False
+
+    assert coordinator.is_watchdog_due(now + timedelta(hours=15)) is False
+    assert coordinator.is_watchdog_due(datetime(2023, 1, 2, 0, 0, 0, tzinfo=timezone.utc)) is True
+
+
+def test_watchdog_due_stays_inside_offset_window(mock_hass, config_entry):
+    """A reset deferred by the cumulative offset keeps the coordinator due."""
+    coordinator = MaxMinDataUpdateCoordinator(mock_hass, config_entry)
+    coordinator.offset = 900
+    coordinator._source_is_cumulative = True
+    coordinator.tracked_data[PERIOD_DAILY] = {
+        "max": 10.0,
+        "last_reset": datetime(2022, 12, 31, 0, 0, 0, tzinfo=timezone.utc),
+    }
+    day_start = datetime(2023, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+
+    with patch.object(coordinator, "_perform_reset"):
+        coordinator._check_watchdog(day_start + timedelta(minutes=10))
+
+    assert coordinator.is_watchdog_due(day_start + timedelta(minutes=14)) is False
+    assert coordinator.is_watchdog_due(day_start + timedelta(minutes=15)) is True
+
+
+def test_watchdog_failure_keeps_coordinator_due(mock_hass, config_entry):
+    """A failing period is retried on the next tick."""
+    coordinator = MaxMinDataUpdateCoordinator(mock_hass, config_entry)
+    now = datetime(2023, 1, 2, 0, 5, 0, tzinfo=timezone.utc)
+
+    with patch.object(coordinator, "ensure_period_current", side_effect=RuntimeError("boom")):
+        coordinator._check_watchdog(now)
+
+    assert coordinator.is_watchdog_due(now + timedelta(minutes=1)) is True
+
+
+def test_cumulative_mode_change_marks_watchdog_due(mock_hass, config_entry):
+    """Switching cumulative mode invalidates the cached due time."""
+    coordinator = MaxMinDataUpdateCoordinator(mock_hass, config_entry)
+    now = datetime(2023, 1, 1, 8, 0, 0, tzinfo=timezone.utc)
+    coordinator.tracked_data[PERIOD_DAILY] = {"last_reset": datetime(2023, 1, 1, tzinfo=timezone.utc)}
+    coordinator._check_watchdog(now)
+    assert coordinator.is_watchdog_due(now) is False
+
+    coordinator.watchdog_listener = Mock()
+
+    with patch.object(coordinator, "_schedule_resets"):
+        coordinator._sync_source_cumulative_mode(Mock(attributes={"state_class": "total_increasing"}))
+
+    assert coordinator.is_watchdog_due(now) is True
+    assert coordinator.watchdog_due is None
+    coordinator.watchdog_listener.assert_called_once()
+
+
+def _watched_coordinator(entry_id, due=None, is_due=False, reset=False):
+    """Build a coordinator double as seen by the shared watchdog."""
+    coordinator = Mock()
+    coordinator.config_entry.entry_id = entry_id
+    coordinator.watchdog_due = due
+    coordinator.is_watchdog_due.return_value = is_due
+    coordinator._check_watchdog.return_value = reset
+    return coordinator
+
+
+def test_shared_watchdog_sleeps_until_earliest_boundary(mock_hass, mock_track_point_in_utc_time):
+    """The single timer is armed at the earliest due time plus backup delay."""
+    watchdog = MaxMinWatchdog(mock_hass)
+    daily = datetime(2023, 1, 2, 0, 0, 0, tzinfo=timezone.utc)
+    monthly = datetime(2023, 2, 1, 0, 0, 0, tzinfo=timezone.utc)
+
+    watchdog.async_register(_watched_coordinator("monthly", due=monthly))
+    watchdog.async_register(_watched_coordinator("daily", due=daily))
+
+    fire_at = mock_track_point_in_utc_time.call_args[0][2]
+    assert fire_at == daily + BACKUP_RESET_DELAY
+    assert watchdog.stats["next_check"] == fire_at.isoformat()
+
+
+def test_shared_watchdog_only_checks_due_coordinators(mock_hass, mock_track_point_in_utc_time):
+    """Only coordinators past their boundary are checked; timer re-arms."""
+    now = datetime(2023, 1, 2, 0, 0, 30, tzinfo=timezone.utc)
+    watchdog = MaxMinWatchdog(mock_hass)
+    due = _watched_coordinator("due", due=now, is_due=True, reset=True)
+    idle = _watched_coordinator("idle", due=now + timedelta(days=30))
+
+    watchdog.async_register(due)
+    watchdog.async_register(idle)
+    tick = mock_track_point_in_utc_time.call_args[0][1]
+    mock_track_point_in_utc_time.reset_mock()
+
+    due.watchdog_due = now + timedelta(days=1)
+    tick(now)
+
+    due._check_watchdog.assert_called_once_with(now)
+    idle._check_watchdog.assert_not_called()
+    assert watchdog.last_checked == 1
+    assert watchdog.last_reset == 1
+    assert watchdog.total_ticks == 1
+    mock_track_point_in_utc_time.assert_called_once()
+    assert mock_track_point_in_utc_time.call_args[0][2] == now + timedelta(days=1) + BACKUP_RESET_DELAY
+
+
+def test_shared_watchdog_retries_unknown_due(mock_hass, mock_track_point_in_utc_time):
+    """A coordinator without a due time is retried after the retry delay."""
+    watchdog = MaxMinWatchdog(mock_hass)
+    now = datetime(2023, 1, 1, 8, 0, 0, tzinfo=timezone.utc)
+
+    with patch("custom_components.max_min.watchdog.dt_util.utcnow", return_value=now):
+        watchdog.async_register(_watched_coordinator("failed", due=None))
+
+    assert mock_track_point_in_utc_time.call_args[0][2] == now + WATCHDOG_RETRY_DELAY
+
+
+def test_shared_watchdog_ignores_entry_without_boundaries(mock_hass, config_entry, mock_track_point_in_utc_time):
+    """An all_time-only entry is checked once, then never polled again."""
+    config_entry.data[CONF_PERIODS] = [PERIOD_ALL_TIME]
+    coordinator = MaxMinDataUpdateCoordinator(mock_hass, config_entry)
+    now = datetime(2023, 1, 1, 8, 0, 0, tzinfo=timezone.utc)
+    watchdog = MaxMinWatchdog(mock_hass)
+
+    with patch("custom_components.max_min.watchdog.dt_util.utcnow", return_value=now):
+        watchdog.async_register(coordinator)
+    # Unknown before the first check: retried once.
+    tick = mock_track_point_in_utc_time.call_args[0][1]
+    mock_track_point_in_utc_time.reset_mock()
+    tick(now + WATCHDOG_RETRY_DELAY)
+
+    assert coordinator.watchdog_due == WATCHDOG_NEVER
+    assert coordinator.is_watchdog_due(now + timedelta(days=365)) is False
+    mock_track_point_in_utc_time.assert_not_called()
+    assert watchdog.stats["next_check"] is None
+
+
+def test_shared_watchdog_rearms_when_coordinator_notifies(mock_hass, mock_track_point_in_utc_time):
+    """Coordinators call watchdog_listener when their due time moves earlier."""
+    watchdog = MaxMinWatchdog(mock_hass)
+    coordinator = _watched_coordinator("entry", due=datetime(2023, 2, 1, tzinfo=timezone.utc))
+    now = datetime(2023, 1, 1, 8, 0, 0, tzinfo=timezone.utc)
+    watchdog.async_register(coordinator)
+
+    coordinator.watchdog_due = None
+    with patch("custom_components.max_min.watchdog.dt_util.utcnow", return_value=now):
+        coordinator.watchdog_listener()
+
+    previous_unsub = mock_track_point_in_utc_time.return_value
+    previous_unsub.assert_called_once()
+    assert mock_track_point_in_utc_time.call_args[0][2] == now + WATCHDOG_RETRY_DELAY
+
+
+def test_shared_watchdog_survives_coordinator_error(mock_hass):
+    """An exception from one coordinator does not stop the tick."""
+    now = datetime(2023, 1, 1, 8, 0, 0, tzinfo=timezone.utc)
+    watchdog = MaxMinWatchdog(mock_hass)
+    broken = _watched_coordinator("broken", due=now, is_due=True)
+    broken._check_watchdog.side_effect = RuntimeError("boom")
+    healthy = _watched_coordinator("healthy", due=now, is_due=True)
+
+    watchdog.async_register(broken)
+    watchdog.async_register(healthy)
+    watchdog._async_tick(now)
+
+    healthy._check_watchdog.assert_called_once_with(now)
+    assert watchdog.last_checked == 2
+    assert watchdog.last_reset == 0
+
+
+def test_shared_watchdog_forces_check_on_clock_jump(mock_hass):
+    """A wall-clock jump forces every coordinator to be checked."""
+    start = datetime(2023, 1, 1, 8, 0, 0, tzinfo=timezone.utc)
+    watchdog = MaxMinWatchdog(mock_hass)
+    coordinator = _watched_coordinator("entry", due=start + timedelta(days=1))
+
+    with patch("custom_components.max_min.watchdog.time.monotonic", return_value=100.0), \
+         patch("custom_components.max_min.watchdog.dt_util.utcnow", return_value=start):
+        watchdog.async_register(coordinator)
+
+    # Heartbeat 5 minutes later on both clocks: no jump.
+    with patch("custom_components.max_min.watchdog.time.monotonic", return_value=400.0), \
+         patch("custom_components.max_min.watchdog.dt_util.utcnow", return_value=start + timedelta(minutes=5)):
+        watchdog._async_check_clock(start + timedelta(minutes=5))
+    coordinator._check_watchdog.assert_not_called()
+
+    # Wall clock advanced 2 hours while monotonic only 5 minutes (resume/NTP step).
+    jumped = start + timedelta(hours=2, minutes=10)
+    with patch("custom_components.max_min.watchdog.time.monotonic", return_value=700.0), \
+         patch("custom_components.max_min.watchdog.dt_util.utcnow", return_value=jumped):
+        watchdog._async_check_clock(jumped)
+
+    coordinator._check_watchdog.assert_called_once_with(jumped)
+    assert watchdog.clock_jumps == 1
+
+
+def test_shared_watchdog_checks_all_once_started(mock_hass):
+    """HA start and core config updates force a full check."""
+    mock_hass.is_running = False
+    watchdog = MaxMinWatchdog(mock_hass)
+    coordinator = _watched_coordinator("entry", due=datetime(2030, 1, 1, tzinfo=timezone.utc))
+    watchdog.async_register(coordinator)
+
+    mock_hass.bus.async_listen_once.assert_called_once()
+    started_listener = mock_hass.bus.async_listen_once.call_args[0][1]
+    started_listener(Mock())
+    coordinator._check_watchdog.assert_called_once()
+
+    config_listener = mock_hass.bus.async_listen.call_args[0][1]
+    config_listener(Mock())
+    assert coordinator._check_watchdog.call_count == 2
+
+
+def test_shared_watchdog_stops_when_last_coordinator_leaves(
+    mock_hass, mock_track_time_interval, mock_track_point_in_utc_time
+):
+    """Unregistering the last coordinator cancels every timer and listener."""
+    mock_hass.is_running = False
+    watchdog = MaxMinWatchdog(mock_hass)
+    first = _watched_coordinator("first", due=datetime(2030, 1, 1, tzinfo=timezone.utc))
+    second = _watched_coordinator("second", due=datetime(2030, 1, 2, tzinfo=timezone.utc))
+    unregister_first = watchdog.async_register(first)
+    unregister_second = watchdog.async_register(second)
+    mock_track_time_interval.assert_called_once()
+
+    unregister_first()
+    assert first.watchdog_listener is None
+    mock_track_time_interval.return_value.assert_not_called()
+
+    unregister_second()
+    mock_track_time_interval.return_value.assert_called_once()
+    mock_track_point_in_utc_time.return_value.assert_called()
+    mock_hass.bus.async_listen.return_value.assert_called_once()
+    mock_hass.bus.async_listen_once.return_value.assert_called_once()
+    assert watchdog.stats["coordinators"] == 0
+    assert watchdog.stats["next_check"] is None